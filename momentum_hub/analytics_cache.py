@@ -0,0 +1,135 @@
+import json
+import sqlite3
+from typing import Dict, Iterable, Optional, Tuple
+
+from .momentum_db import DB_NAME, MAX_QUERY_PARAMS, get_connection
+
+# Design rationale: cached analytics live in the habit database itself so they
+# survive restarts and disappear together with the data they describe. Each
+# entry records the habit's write version (maintained by triggers, see
+# momentum_db._init_analytics_cache_schema); an entry is only served while that
+# version is unchanged, which makes validation a single indexed lookup.
+
+
+def load(habit_id: int, db_name: str = DB_NAME) -> Tuple[Optional[int], Optional[dict]]:
+    """
+    Returns (current_version, payload) for a habit.
+    payload is None when nothing is cached or the cached entry is stale.
+    current_version is None when the database has no cache tables (not initialised
+    with init_db), in which case callers should skip caching entirely.
+    """
+    try:
+        with get_connection(db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT COALESCE(v.version, 0), c.version, c.payload
+                FROM (SELECT ? AS habit_id) h
+                LEFT JOIN habit_versions v ON v.habit_id = h.habit_id
+                LEFT JOIN analytics_cache c ON c.habit_id = h.habit_id
+            """,
+                (habit_id,),
+            )
+            current_version, cached_version, payload = cursor.fetchone()
+    except sqlite3.OperationalError:
+        return None, None
+
+    if payload is None or cached_version != current_version:
+        return current_version, None
+    return current_version, json.loads(payload)
+
+
+def load_many(
+    habit_ids: Iterable[int], db_name: str = DB_NAME
+) -> Dict[int, Tuple[int, Optional[dict]]]:
+    """
+    Bulk variant of load(): returns {habit_id: (current_version, payload)} for the
+    given habits using one query. Returns an empty dict if the cache is unavailable.
+    """
+    ids = list(habit_ids)
+    rows = []
+    try:
+        with get_connection(db_name) as conn:
+            cursor = conn.cursor()
+            for i in range(0, len(ids), MAX_QUERY_PARAMS):
+                chunk = ids[i : i + MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                    SELECT h.id, COALESCE(v.version, 0), c.version, c.payload
+                    FROM habits h
+                    LEFT JOIN habit_versions v ON v.habit_id = h.id
+                    LEFT JOIN analytics_cache c ON c.habit_id = h.id
+                    WHERE h.id IN ({placeholders})
+                """,
+                    chunk,
+                )
+                rows.extend(cursor.fetchall())
+    except sqlite3.OperationalError:
+        return {}
+
+    entries = {}
+    for habit_id, current_version, cached_version, payload in rows:
+        if payload is None or cached_version != current_version:
+            entries[habit_id] = (current_version, None)
+        else:
+            entries[habit_id] = (current_version, json.loads(payload))
+    return entries
+
+
+def store(habit_id: int, version: int, payload: dict, db_name: str = DB_NAME) -> None:
+    """
+    Persists a payload computed from data at the given habit version.
+    If the habit was written to meanwhile, the entry is already stale and will
+    simply be ignored by the next load().
+    """
+    try:
+        with get_connection(db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO analytics_cache(habit_id, version, payload)
+                VALUES (?, ?, ?)
+                ON CONFLICT(habit_id) DO UPDATE
+                SET version = excluded.version, payload = excluded.payload
+            """,
+                (habit_id, version, json.dumps(payload)),
+            )
+            conn.commit()
+    except sqlite3.OperationalError:
+        # Read-only or uninitialised database: caching is best effort.
+        pass
+
+
+def store_many(
+    entries: Iterable[Tuple[int, int, dict]], db_name: str = DB_NAME
+) -> None:
+    """Persists several (habit_id, version, payload) entries in one transaction."""
+    rows = [(hid, version, json.dumps(payload)) for hid, version, payload in entries]
+    if not rows:
+        return
+    try:
+        with get_connection(db_name) as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO analytics_cache(habit_id, version, payload)
+                VALUES (?, ?, ?)
+                ON CONFLICT(habit_id) DO UPDATE
+                SET version = excluded.version, payload = excluded.payload
+            """,
+                rows,
+            )
+            conn.commit()
+    except sqlite3.OperationalError:
+        pass
+
+
+def clear(db_name: str = DB_NAME) -> None:
+    """Removes every cached analytics entry from the database."""
+    try:
+        with get_connection(db_name) as conn:
+            conn.execute("DELETE FROM analytics_cache;")
+            conn.commit()
+    except sqlite3.OperationalError:
+        pass
@@ -0,0 +1,59 @@
+import functools
+import os
+import shutil
+from pathlib import Path
+
+from colorama import Fore, Style
+
+# Design rationale: the figlet title never changes, so it is rendered once and
+# kept in a small cache file. Later launches print it without importing pyfiglet
+# (and loading its font files), which keeps the banner off the startup path.
+
+BANNER_TEXT = "Momentum Hub"
+BANNER_FONT = "standard"
+BANNER_SUBTITLE = "Your personal habit tracker."
+
+
+def banner_cache_path() -> Path:
+    """$MOMENTUM_CACHE_DIR, else $XDG_CACHE_HOME/momentum-hub or ~/.cache/momentum-hub."""
+    cache_dir = os.getenv("MOMENTUM_CACHE_DIR")
+    if not cache_dir:
+        base = os.getenv("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(base, "momentum-hub")
+    return Path(cache_dir) / f"banner-{BANNER_FONT}.txt"
+
+
+@functools.lru_cache(maxsize=None)
+def render_banner() -> str:
+    """The figlet title, read from the cache file or rendered and cached on a miss."""
+    path = banner_cache_path()
+    try:
+        header, _, art = path.read_text(encoding="utf-8").partition("\n")
+        if header == BANNER_TEXT:
+            return art
+    except OSError:
+        pass
+
+    from pyfiglet import Figlet
+
+    art = Figlet(font=BANNER_FONT).renderText(BANNER_TEXT)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{BANNER_TEXT}\n{art}", encoding="utf-8")
+    except OSError:
+        pass  # read-only home: render again next launch
+    return art
+
+
+def startup_message():
+    """Displays a startup message for the Momentum Hub CLI, centered and in ASCII art."""
+    term_width = shutil.get_terminal_size((80, 20)).columns
+    # Center each line of the ASCII art
+    centered_ascii = "\n".join(
+        line.center(term_width) for line in render_banner().splitlines()
+    )
+    centered_subtitle = BANNER_SUBTITLE.center(term_width)
+    print("\n\n\n" + f"{Fore.GREEN}{centered_ascii}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}{centered_subtitle}{Style.RESET_ALL}\n")
@@ -0,0 +1,253 @@
+import csv
+import datetime
+import itertools
+import json
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, TextIO, Tuple
+
+from . import momentum_db as db
+from . import periods
+from .goal import Goal
+from .habit import Habit
+
+# Design rationale: a batch replays a stream of commands through the same
+# momentum_db functions the menu uses, so duplicate completions, unknown habits
+# and invalid frequencies are rejected exactly as they are interactively.
+# Commands are grouped into momentum_db.transaction() blocks, one SAVEPOINT per
+# command, so a rejected line is undone alone while the rest of its group still
+# commits in one write. Streaks are rebuilt once per affected habit at the end
+# instead of after every completion, which keeps a replay of thousands of events
+# linear. Results are reported per group, after it committed.
+
+BATCH_OPS = ("complete", "create", "update", "deactivate", "reactivate", "add_goal")
+HABIT_FIELDS = (
+    "name",
+    "frequency",
+    "notes",
+    "reminder_time",
+    "evening_reminder_time",
+    "category_id",
+)
+DEFAULT_TRANSACTION_SIZE = 100
+
+Command = Tuple[int, Any]  # (line number, command dict or the error parsing it)
+
+
+def read_jsonl(stream: TextIO) -> Iterator[Command]:
+    """One JSON object per line; blank lines and lines starting with # are skipped."""
+    for line_no, line in enumerate(stream, start=1):
+        text = line.strip()
+        if not text or text.startswith("#"):
+            continue
+        try:
+            command = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield line_no, ValueError(f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(command, dict):
+            command = ValueError("Each line must be a JSON object.")
+        yield line_no, command
+
+
+def read_csv(stream: TextIO) -> Iterator[Command]:
+    """A header row naming the fields (op, habit_id, at, ...); empty cells are unset."""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        command = {k: v for k, v in row.items() if k and v not in (None, "")}
+        if command:
+            yield reader.line_num, command
+
+
+def _int(command: dict, key: str, default: Optional[int] = None) -> int:
+    value = command.get(key, default)
+    if value is None:
+        raise ValueError(f"'{key}' is required.")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{key}' must be an integer.") from None
+
+
+def _datetime(command: dict, key: str) -> Optional[datetime.datetime]:
+    value = command.get(key)
+    if value is None:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"'{key}' must be an ISO 8601 date/time.") from None
+
+
+def _validate_habit(habit: Habit) -> None:
+    """The rules the create/update habit screens enforce."""
+    if not (habit.name or "").strip():
+        raise ValueError("Habit name cannot be empty.")
+    if not periods.is_valid_frequency(habit.frequency):
+        raise ValueError(f"Unsupported frequency '{habit.frequency}'.")
+    for attribute in ("reminder_time", "evening_reminder_time"):
+        value = getattr(habit, attribute)
+        if value:
+            try:
+                datetime.datetime.strptime(value, "%H:%M")
+            except ValueError:
+                raise ValueError(f"'{attribute}' must be HH:MM (24-hour).") from None
+
+
+def _existing_habit(command: dict, db_name: str) -> Habit:
+    habit_id = _int(command, "habit_id")
+    habit = db.get_habit(habit_id, db_name)
+    if habit is None:
+        raise LookupError(f"No habit with ID {habit_id}.")
+    return habit
+
+
+def _set_habit_fields(habit: Habit, command: dict) -> None:
+    for field in HABIT_FIELDS:
+        if field in command:
+            value = command[field]
+            if field == "category_id":
+                value = _int(command, field)
+            elif not isinstance(value, str) and (
+                value is not None or field in ("name", "frequency")
+            ):
+                # JSON numbers or lists would otherwise fail deep in validation
+                raise ValueError(f"'{field}' must be a string.")
+            setattr(habit, field, value)
+
+
+class BatchRunner:
+    """
+    Applies batch commands to a database. `affected` collects the habits whose
+    streaks must be rebuilt; run() does that at the end.
+
+    Example:
+        with open("events.jsonl") as f:
+            BatchRunner("momentum.db").run(read_jsonl(f), print)
+    """
+
+    def __init__(
+        self,
+        db_name: str = db.DB_NAME,
+        transaction_size: int = DEFAULT_TRANSACTION_SIZE,
+    ):
+        if transaction_size < 1:
+            raise ValueError("Transaction size must be at least 1.")
+        self.db_name = db_name
+        self.transaction_size = transaction_size
+        self.affected: Set[int] = set()
+
+    def _complete(self, command: dict) -> dict:
+        habit = _existing_habit(command, self.db_name)
+        if not habit.is_active:
+            raise ValueError(f"No active habit with ID {habit.id}.")
+        when = _datetime(command, "at") or datetime.datetime.now()
+        db.add_completion(habit.id, when, self.db_name)
+        self.affected.add(habit.id)
+        return {"habit_id": habit.id, "at": when.isoformat()}
+
+    def _create(self, command: dict) -> dict:
+        habit = Habit(created_at=_datetime(command, "created_at"))
+        _set_habit_fields(habit, command)
+        _validate_habit(habit)
+        return {"habit_id": db.add_habit(habit, self.db_name)}
+
+    def _update(self, command: dict) -> dict:
+        habit = _existing_habit(command, self.db_name)
+        _set_habit_fields(habit, command)
+        _validate_habit(habit)
+        db.update_habit(habit, self.db_name)
+        if "frequency" in command:
+            self.affected.add(habit.id)
+        return {"habit_id": habit.id}
+
+    def _deactivate(self, command: dict) -> dict:
+        habit = _existing_habit(command, self.db_name)
+        if not habit.is_active:
+            raise ValueError(f"Habit {habit.id} is already inactive.")
+        db.delete_habit(habit.id, self.db_name)
+        return {"habit_id": habit.id}
+
+    def _reactivate(self, command: dict) -> dict:
+        habit = _existing_habit(command, self.db_name)
+        if habit.is_active:
+            raise ValueError(f"Habit {habit.id} is already active.")
+        db.reactivate_habit(habit.id, self.db_name)
+        self.affected.add(habit.id)
+        return {"habit_id": habit.id}
+
+    def _add_goal(self, command: dict) -> dict:
+        habit = _existing_habit(command, self.db_name)
+        if not habit.is_active:
+            raise ValueError(f"No active habit with ID {habit.id}.")
+        target_period_days = _int(command, "target_period_days", 28)
+        target_completions = (
+            _int(command, "target_completions")
+            if "target_completions" in command
+            else None
+        )
+        if target_period_days < 1 or (target_completions or 1) < 1:
+            raise ValueError("Goal targets must be positive.")
+        goal = Goal(
+            habit_id=habit.id,
+            target_period_days=target_period_days,
+            target_completions=target_completions,
+            start_date=_datetime(command, "start_date"),
+            end_date=_datetime(command, "end_date"),
+        )
+        return {"goal_id": db.add_goal(goal, self.db_name)}
+
+    def apply(self, command: dict) -> dict:
+        """Applies one command; raises ValueError or LookupError when rejected."""
+        op = command.get("op")
+        if op not in BATCH_OPS:
+            raise ValueError(
+                f"Unknown op {op!r}; expected one of: {', '.join(BATCH_OPS)}."
+            )
+        return getattr(self, f"_{op}")(command)
+
+    def _run_group(self, group: Iterable[Command]) -> list:
+        results = []
+        with db.transaction(self.db_name) as conn:
+            for line_no, command in group:
+                op = command.get("op") if isinstance(command, dict) else None
+                result: Dict[str, Any] = {"line": line_no, "op": op}
+                conn.execute("SAVEPOINT batch_command")
+                try:
+                    if isinstance(command, Exception):
+                        raise command
+                    result.update(self.apply(command), ok=True)
+                except (ValueError, TypeError, LookupError, sqlite3.Error) as e:
+                    conn.execute("ROLLBACK TO batch_command")
+                    result.update(ok=False, error=str(e))
+                conn.execute("RELEASE batch_command")
+                results.append(result)
+        return results
+
+    def rebuild_streaks(self) -> int:
+        """Recomputes streak and last completion of every affected habit."""
+        with db.transaction(self.db_name):
+            for habit_id in sorted(self.affected):
+                db.update_streak(habit_id, self.db_name)
+        rebuilt = len(self.affected)
+        self.affected.clear()
+        return rebuilt
+
+    def run(
+        self, commands: Iterable[Command], report: Callable[[dict], None]
+    ) -> Dict[str, int]:
+        """
+        Applies commands in transactions of transaction_size, passing each line's
+        result to report once its transaction committed, then rebuilds streaks.
+        Returns {'applied': int, 'failed': int, 'streaks_rebuilt': int}.
+        """
+        summary = {"applied": 0, "failed": 0, "streaks_rebuilt": 0}
+        commands = iter(commands)
+        try:
+            while group := list(itertools.islice(commands, self.transaction_size)):
+                for result in self._run_group(group):
+                    summary["applied" if result["ok"] else "failed"] += 1
+                    report(result)
+        finally:
+            # Streaks of habits in committed groups stay correct even on errors
+            summary["streaks_rebuilt"] = self.rebuild_streaks()
+        return summary
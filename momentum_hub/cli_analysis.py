@@ -1,22 +1,29 @@
-from typing import List, Optional
+import calendar
+import datetime
+from typing import Dict, List, Optional, Set, Tuple
 
 import questionary
 from colorama import Fore, Style
 from tabulate import tabulate
 
 from . import habit_analysis as analysis
+from . import heatmap
 from . import momentum_db as db
+from . import periods
 from .cli_export import analyze_export_csv
-from .cli_utils import _handle_habit_selection, _to_date
+from .cli_utils import _format_goal_forecast, _to_date, select_habit
 from .habit import Habit
 from .momentum_utils import press_enter_to_continue, show_colored_message
+from .paged_table import show_paged_table
+
+HISTORY_COLUMN_WIDTHS = (7, 20)
 
 
 def get_periodicity_choice() -> Optional[str]:
     """Get user's periodicity selection with validation."""
     choice = questionary.select(
         "Select a periodicity to filter habits:",
-        choices=["daily", "weekly", "all", "Cancel"],
+        choices=["daily", "weekly", "monthly", "times per week", "all", "Cancel"],
     ).ask()
     if choice in [None, "Cancel", ""]:
         return None
@@ -24,9 +31,15 @@ def get_periodicity_choice() -> Optional[str]:
 
 
 def filter_habits_by_periodicity(habits: List[Habit], periodicity: str) -> List[Habit]:
-    """Filter habits based on selected periodicity."""
+    """Filter habits based on selected periodicity ("times per week" matches any N/week)."""
     if periodicity == "all":
         return habits
+    if periodicity == "times per week":
+        return [
+            h
+            for h in habits
+            if (periods.parse_frequency(h.frequency) or ("", 1))[1] > 1
+        ]
     return [h for h in habits if h.frequency == periodicity]
 
 
@@ -106,12 +119,15 @@ def display_streak_analysis_table(habits: List[Habit], db_name: str):
 
 
 def display_periodicity_analysis_table(habits: List[Habit], db_name: str):
-    """Display the periodicity analysis table for filtered habits."""
-    table = []
-    for habit in habits:
-        habit_data = format_habit_data(habit, db_name)
-        table.append(
-            [
+    """
+    Display the periodicity analysis table for filtered habits, a page at a time.
+    Each habit's metrics are computed only when its page is shown.
+    """
+
+    def rows():
+        for habit in habits:
+            habit_data = format_habit_data(habit, db_name)
+            yield [
                 habit_data["id"],
                 habit_data["name"],
                 habit_data["frequency"],
@@ -121,7 +137,6 @@ def display_periodicity_analysis_table(habits: List[Habit], db_name: str):
                 habit_data["completion_rate"],
                 habit_data["last_completed"],
             ]
-        )
 
     headers = [
         f"{Fore.CYAN}ID{Style.RESET_ALL}",
@@ -133,7 +148,7 @@ def display_periodicity_analysis_table(habits: List[Habit], db_name: str):
         f"{Fore.CYAN}Completion Rate{Style.RESET_ALL}",
         f"{Fore.CYAN}Last Completed{Style.RESET_ALL}",
     ]
-    print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
+    show_paged_table(rows(), headers)
 
 
 def analyze_habits(db_name: str):
@@ -149,10 +164,14 @@ def analyze_habits(db_name: str):
             "See the longest streak of all habits",
             "See the longest streak of a specific habit",
             "Show streak history (Calendar View)",
+            "Show year heatmap",
+            "Show monthly calendars",
             "Export analysis to CSV",
             "Show best/worst habit",
             "Show goal progress",
             "Show completion history for a habit",
+            "Show habit leaderboard",
+            "Show habits done together",
             "Back to Main Menu",
         ],
     ).ask()
@@ -170,12 +189,16 @@ def analyze_habits(db_name: str):
         "Show streak history (Calendar View)": (
             lambda: analyze_streak_history_grid(db_name)
         ),
+        "Show year heatmap": lambda: analyze_year_heatmap(db_name),
+        "Show monthly calendars": lambda: analyze_month_calendars(db_name),
         "Export analysis to CSV": lambda: analyze_export_csv(db_name),
         "Show best/worst habit": lambda: analyze_best_worst_habit(db_name),
         "Show goal progress": lambda: analyze_goal_progress(db_name),
         "Show completion history for a habit": lambda: analyze_completion_history(
             db_name
         ),
+        "Show habit leaderboard": lambda: analyze_leaderboard(db_name),
+        "Show habits done together": lambda: analyze_co_completion(db_name),
         "Back to Main Menu": lambda: None,
     }
     if analysis_choice in analysis_actions:
@@ -186,22 +209,22 @@ def analyze_list_all_habits(db_name: str):
     show_colored_message(
         "\n--- All Currently Tracked Habits ---", color=Fore.YELLOW, style=Style.BRIGHT
     )
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    if not habits:
-        show_colored_message("No active habits found.", color=Fore.RED)
-    else:
-        table = []
-        for habit in habits:
-            created_at_str = (
-                habit.created_at.strftime("%Y-%m-%d %H:%M") if habit.created_at else "-"
-            )
-            table.append([habit.id, habit.name, created_at_str])
-        headers = [
-            f"{Fore.CYAN}ID{Style.RESET_ALL}",
-            f"{Fore.CYAN}Name{Style.RESET_ALL}",
-            f"{Fore.CYAN}Created At{Style.RESET_ALL}",
+    habits = db.iter_habits(active_only=True, db_name=db_name)
+    rows = (
+        [
+            habit.id,
+            habit.name,
+            habit.created_at.strftime("%Y-%m-%d %H:%M") if habit.created_at else "-",
         ]
-        print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
+        for habit in habits
+    )
+    headers = [
+        f"{Fore.CYAN}ID{Style.RESET_ALL}",
+        f"{Fore.CYAN}Name{Style.RESET_ALL}",
+        f"{Fore.CYAN}Created At{Style.RESET_ALL}",
+    ]
+    if not show_paged_table(rows, headers, source=habits):
+        show_colored_message("No active habits found.", color=Fore.RED)
     press_enter_to_continue()
 
 
@@ -256,9 +279,8 @@ def analyze_longest_streak_one(db_name: str):
         color=Fore.YELLOW,
         style=Style.BRIGHT,
     )
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    selected_habit = _handle_habit_selection(
-        habits,
+    selected_habit = select_habit(
+        db_name,
         "Select a habit to analyze its longest streak:",
         "No active habits found to analyze.",
     )
@@ -323,9 +345,8 @@ def analyze_streak_history_grid(db_name: str):
         color=Fore.YELLOW,
         style=Style.BRIGHT,
     )
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    selected_habit = _handle_habit_selection(
-        habits,
+    selected_habit = select_habit(
+        db_name,
         "Select a habit to view its streak history:",
         "No active habits found to analyze.",
     )
@@ -349,9 +370,13 @@ def analyze_streak_history_grid(db_name: str):
         )
     total_completions = len(completions)
     show_colored_message(f"Total completions: {total_completions}", color=Fore.CYAN)
-    import calendar
 
-    if habit.frequency == "daily":
+    parsed = periods.parse_frequency(habit.frequency)
+    unit = parsed[0] if parsed else None
+    completed_keys = set(
+        periods.completed_period_keys(completion_dates, habit.frequency)
+    )
+    if unit == "day":
         current_month = today.month
         current_year = today.year
         calendar.setfirstweekday(calendar.SUNDAY)
@@ -398,21 +423,19 @@ def analyze_streak_history_grid(db_name: str):
                 ),
                 color=Fore.MAGENTA,
             )
-    elif habit.frequency == "weekly":
+    elif unit == "week":
         # Calculate the first week (Sunday) containing the creation date
-        creation_week_start = habit_created_date - timedelta(
-            days=(habit_created_date.weekday() + 1) % 7
-        )
+        creation_week_start = periods.week_start(habit_created_date)
         today = date.today()
-        current_week_start = today - timedelta(days=(today.weekday() + 1) % 7)
+        current_week_start = periods.week_start(today)
         # Number of weeks since creation (inclusive)
         total_weeks = ((current_week_start - creation_week_start).days // 7) + 1
         weeks_to_show = min(8, total_weeks)
+        first_week_start = current_week_start - timedelta(weeks=weeks_to_show - 1)
         print("\nLast {} weeks (Sunday-Saturday):".format(weeks_to_show))
         completed_weeks = 0
         for i in range(weeks_to_show):
-            this_week_start = creation_week_start + timedelta(weeks=i)
-            this_week_end = this_week_start + timedelta(days=6)
+            this_week_start = first_week_start + timedelta(weeks=i)
             week_label = f"Week {i+1:2d} "
             # Determine if this week is in the future
             if this_week_start > current_week_start:
@@ -420,17 +443,11 @@ def analyze_streak_history_grid(db_name: str):
                 week_row = (
                     week_label + f"{Fore.LIGHTBLACK_EX}  -  {Style.RESET_ALL}" * 7
                 )
+            elif periods.week_key(this_week_start) in completed_keys:
+                week_row = week_label + f"{Fore.GREEN}  ✓  {Style.RESET_ALL}" * 7
+                completed_weeks += 1
             else:
-                # Check if any completion exists in this week
-                week_completed = any(
-                    (c >= this_week_start and c <= this_week_end)
-                    for c in completion_dates
-                )
-                if week_completed:
-                    week_row = week_label + f"{Fore.GREEN}  ✓  {Style.RESET_ALL}" * 7
-                    completed_weeks += 1
-                else:
-                    week_row = week_label + f"{Fore.RED}  ✗  {Style.RESET_ALL}" * 7
+                week_row = week_label + f"{Fore.RED}  ✗  {Style.RESET_ALL}" * 7
             print(week_row)
         print("\nLegend:")
         print(f"{Fore.GREEN}Green{Style.RESET_ALL} = Week completed")
@@ -446,6 +463,29 @@ def analyze_streak_history_grid(db_name: str):
                 ),
                 color=Fore.MAGENTA,
             )
+    elif unit == "month":
+        current_month_key = periods.month_key(today)
+        first_month_key = max(
+            periods.month_key(habit_created_date), current_month_key - 11
+        )
+        months_to_show = current_month_key - first_month_key + 1
+        print(f"\nLast {months_to_show} months:")
+        completed_months = 0
+        for key in range(first_month_key, current_month_key + 1):
+            label = periods.key_start(key, "month").strftime("%b %Y")
+            if key in completed_keys:
+                print(f"{label}  {Fore.GREEN}✓{Style.RESET_ALL}")
+                completed_months += 1
+            else:
+                print(f"{label}  {Fore.RED}✗{Style.RESET_ALL}")
+        show_colored_message(
+            (
+                f"Completion rate last {months_to_show} months: "
+                f"{completed_months / months_to_show * 100:.1f}% "
+                f"({completed_months}/{months_to_show} months)"
+            ),
+            color=Fore.MAGENTA,
+        )
     else:
         show_colored_message(
             "Unsupported periodicity for calendar view.", color=Fore.RED
@@ -457,6 +497,213 @@ def analyze_streak_history_grid(db_name: str):
     press_enter_to_continue()
 
 
+# (colour, glyph) per heatmap intensity level, from "nothing done" to "all done"
+HEATMAP_STYLES = (
+    (Fore.LIGHTBLACK_EX, "·"),
+    (Fore.GREEN, "░"),
+    (Fore.GREEN, "▒"),
+    (Fore.LIGHTGREEN_EX, "▓"),
+    (Fore.LIGHTGREEN_EX, "█"),
+)
+CALENDAR_MONTHS_PER_PAGE = 3
+_MONTH_WIDTH = 23  # 7 three-character day cells and a period marker
+ONE_HABIT_CHOICE = "One habit..."
+
+
+def _select_calendar_habits(db_name: str) -> Optional[Tuple[str, List[Habit]]]:
+    """
+    Asks for all habits, one category or one habit (through the paginated habit
+    picker); returns (title, habits). Returns None after telling the user why and
+    waiting for Enter.
+    """
+    habits = db.get_all_habits(active_only=True, db_name=db_name)
+    if not habits:
+        show_colored_message("No active habits found to analyze.", color=Fore.RED)
+        press_enter_to_continue()
+        return None
+    options: Dict[str, Tuple[str, List[Habit]]] = {"All habits": ("All habits", habits)}
+    for category in db.get_all_categories(active_only=True, db_name=db_name):
+        members = [h for h in habits if h.category_id == category.id]
+        if members:
+            options[f"Category: {category.name}"] = (category.name, members)
+    choice = questionary.select(
+        "Show completions for:", choices=[*options, ONE_HABIT_CHOICE, "Cancel"]
+    ).ask()
+    if choice == ONE_HABIT_CHOICE:
+        habit = select_habit(
+            db_name, "Select a habit to show:", "No active habits found to analyze."
+        )
+        return (habit.name, [habit]) if habit else None
+    if choice in [None, "Cancel"]:
+        show_colored_message("Operation cancelled.", color=Fore.YELLOW)
+        press_enter_to_continue()
+        return None
+    return options[choice]
+
+
+def _period_marks(habits: List[Habit], index) -> Tuple[Optional[str], Set[int]]:
+    """For a single weekly or monthly habit, returns (unit, keys of met periods)."""
+    if len(habits) != 1:
+        return None, set()
+    habit = habits[0]
+    parsed = periods.parse_frequency(habit.frequency)
+    if not parsed or parsed[0] == "day":
+        return None, set()
+    return parsed[0], set(
+        periods.completed_period_keys(index.days(habit.id), habit.frequency)
+    )
+
+
+def _period_mark(key: int, met: Set[int], current_key: int, habit: Habit) -> str:
+    """✓ for a met period, ✗ for a missed one, · for open or pre-creation periods."""
+    unit = periods.parse_frequency(habit.frequency)[0]
+    created = habit.created_at.date() if habit.created_at else None
+    if key in met:
+        return f"{Fore.GREEN}✓{Style.RESET_ALL}"
+    if key >= current_key or (created and periods.key_end(key, unit) < created):
+        return f"{Fore.LIGHTBLACK_EX}·{Style.RESET_ALL}"
+    return f"{Fore.RED}✗{Style.RESET_ALL}"
+
+
+def _heatmap_cell(level: Optional[int]) -> str:
+    if level is None:
+        return " "
+    color, glyph = HEATMAP_STYLES[level]
+    return f"{color}{glyph}{Style.RESET_ALL}"
+
+
+def _heatmap_legend() -> str:
+    cells = " ".join(_heatmap_cell(level) for level in range(heatmap.LEVELS + 1))
+    return f"Less {cells} More"
+
+
+def analyze_year_heatmap(db_name: str):
+    """Displays a GitHub-style heatmap of the last 52 weeks."""
+    show_colored_message(
+        "\n--- Year Heatmap ---", color=Fore.YELLOW, style=Style.BRIGHT
+    )
+    selection = _select_calendar_habits(db_name)
+    if not selection:
+        return
+    title, habits = selection
+    today = datetime.date.today()
+    start, end = heatmap.heatmap_span(today)
+    ids = [h.id for h in habits]
+    index = analysis.get_day_index(db_name, ids, start, end)
+    counts = index.counts(ids)
+    week_starts, rows = heatmap.heatmap_grid(index, counts, len(habits))
+
+    show_colored_message(f"{title}: {start} to {end}", color=Fore.CYAN)
+    labels = [" "] * len(week_starts)
+    free_from = 0
+    for i, week in enumerate(week_starts):
+        if (i == 0 or week.month != week_starts[i - 1].month) and i >= free_from:
+            name = calendar.month_abbr[week.month]
+            if i + len(name) <= len(labels):
+                labels[i : i + len(name)] = name
+                free_from = i + len(name) + 1
+    print("    " + "".join(labels))
+    for name, row in zip(heatmap.WEEKDAY_NAMES, rows):
+        print(f"{name} " + "".join(_heatmap_cell(level) for level in row))
+    unit, met = _period_marks(habits, index)
+    if unit == "week":
+        current = periods.week_key(today)
+        marks = (
+            _period_mark(periods.week_key(w), met, current, habits[0])
+            for w in week_starts
+        )
+        print("Met " + "".join(marks))
+
+    active_days = sum(1 for c in counts if c)
+    print(f"\n{_heatmap_legend()}")
+    show_colored_message(
+        f"Days with a completion: {active_days} of {index.n_days}", color=Fore.MAGENTA
+    )
+    press_enter_to_continue()
+
+
+def _month_lines(
+    index, key: int, counts: List[int], habits: List[Habit], marks: tuple
+) -> List[str]:
+    """Renders one month as fixed-width lines; marks is (unit, met keys, today)."""
+    unit, met, today = marks
+    first = periods.key_start(key, "month")
+    header = f"{calendar.month_name[first.month]} {first.year}"
+    width = len(header)
+    if unit == "month":
+        header += " " + _period_mark(key, met, periods.month_key(today), habits[0])
+        width += 2
+    lines = [header + " " * (_MONTH_WIDTH - width)]
+    lines.append(" " + " ".join(name[:2] for name in heatmap.WEEKDAY_NAMES) + "  ")
+    grid = heatmap.month_grid(index, first.year, first.month, counts, len(habits))
+    pad = sum(1 for cell in grid[0] if cell is None)
+    for row_number, row in enumerate(grid):
+        line = ""
+        for cell in row:
+            if cell is None:
+                line += "   "
+            elif cell[1] is None:
+                line += f"{Style.DIM}{cell[0]:3d}{Style.RESET_ALL}"
+            else:
+                line += f"{HEATMAP_STYLES[cell[1]][0]}{cell[0]:3d}{Style.RESET_ALL}"
+        if unit == "week":
+            sunday = first + datetime.timedelta(days=7 * row_number - pad)
+            week = periods.week_key(sunday)
+            line += " " + _period_mark(week, met, periods.week_key(today), habits[0])
+        else:
+            line += "  "
+        lines.append(line)
+    return lines
+
+
+def analyze_month_calendars(db_name: str):
+    """Displays pages of month calendars that can be scrolled back in time."""
+    show_colored_message(
+        "\n--- Monthly Calendars ---", color=Fore.YELLOW, style=Style.BRIGHT
+    )
+    selection = _select_calendar_habits(db_name)
+    if not selection:
+        return
+    title, habits = selection
+    ids = [h.id for h in habits]
+    today = datetime.date.today()
+    current_key = periods.month_key(today)
+    last_key = current_key
+    while True:
+        first_key = last_key - CALENDAR_MONTHS_PER_PAGE + 1
+        # Start on a Sunday so weeks crossing into the page are counted whole
+        start = periods.week_start(periods.key_start(first_key, "month"))
+        last_day = periods.key_end(last_key, "month")
+        end = min(periods.key_end(periods.week_key(last_day), "week"), today)
+        index = analysis.get_day_index(db_name, ids, start, end)
+        counts = index.counts(ids)
+        unit, met = _period_marks(habits, index)
+
+        show_colored_message(f"\n{title}", color=Fore.CYAN)
+        blocks = [
+            _month_lines(index, key, counts, habits, (unit, met, today))
+            for key in range(first_key, last_key + 1)
+        ]
+        height = max(len(block) for block in blocks)
+        for block in blocks:
+            block.extend([" " * _MONTH_WIDTH] * (height - len(block)))
+        for line in zip(*blocks):
+            print("  ".join(line))
+        print(f"\n{_heatmap_legend()}")
+
+        choices = ["Earlier months"]
+        if last_key < current_key:
+            choices.append("Later months")
+        choices.append("Back")
+        choice = questionary.select("Scroll:", choices=choices).ask()
+        if choice == "Earlier months":
+            last_key -= CALENDAR_MONTHS_PER_PAGE
+        elif choice == "Later months":
+            last_key = min(current_key, last_key + CALENDAR_MONTHS_PER_PAGE)
+        else:
+            return
+
+
 def analyze_best_worst_habit(db_name: str):
     """Handles displaying the best and worst habit."""
     show_colored_message(
@@ -493,23 +740,152 @@ def analyze_best_worst_habit(db_name: str):
     press_enter_to_continue()
 
 
+# Leaderboard menu labels mapped to habit_analysis.RANKING_METRICS
+LEADERBOARD_METRICS = {
+    "Current streak": "current_streak",
+    "Longest streak": "longest_streak",
+    "28-day completion rate": "completion_rate",
+    "Goal progress": "goal_percent",
+}
+LEADERBOARD_SIZE = 5
+
+
+def format_ranking_value(metric: str, value: float) -> str:
+    """Format a leaderboard value for display."""
+    if metric == "completion_rate":
+        return format_completion_rate(value)
+    if metric == "goal_percent":
+        return f"{value:.1f}%"
+    return format_streak_color(int(value))
+
+
+def display_leaderboard_table(title: str, metric: str, entries: list):
+    """Display one side (top or bottom) of the habit leaderboard."""
+    show_colored_message(f"\n{title}", color=Fore.CYAN, style=Style.BRIGHT)
+    table = [
+        [rank, habit.name, habit.frequency, format_ranking_value(metric, value)]
+        for rank, (habit, value) in enumerate(entries, start=1)
+    ]
+    headers = [
+        f"{Fore.CYAN}Rank{Style.RESET_ALL}",
+        f"{Fore.CYAN}Name{Style.RESET_ALL}",
+        f"{Fore.CYAN}Periodicity{Style.RESET_ALL}",
+        f"{Fore.CYAN}Value{Style.RESET_ALL}",
+    ]
+    print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
+
+
+def analyze_leaderboard(db_name: str):
+    """Displays the top and bottom habits for a chosen metric."""
+    show_colored_message(
+        "\n--- Habit Leaderboard ---", color=Fore.YELLOW, style=Style.BRIGHT
+    )
+    metric_choice = questionary.select(
+        "Rank habits by:", choices=[*LEADERBOARD_METRICS, "Cancel"]
+    ).ask()
+    if metric_choice in [None, "Cancel"]:
+        show_colored_message("Operation cancelled.", color=Fore.YELLOW)
+        press_enter_to_continue()
+        return
+    metric = LEADERBOARD_METRICS[metric_choice]
+
+    category_id = None
+    categories = db.get_all_categories(active_only=True, db_name=db_name)
+    if categories:
+        category_choice = questionary.select(
+            "Limit the ranking to a category?",
+            choices=["All categories"] + [f"{c.id}. {c.name}" for c in categories],
+        ).ask()
+        if category_choice is None:
+            show_colored_message("Operation cancelled.", color=Fore.YELLOW)
+            press_enter_to_continue()
+            return
+        if category_choice != "All categories":
+            category_id = int(category_choice.split(".")[0])
+
+    board = analysis.get_habit_leaderboard(
+        db_name, metric, n=LEADERBOARD_SIZE, category_id=category_id
+    )
+    if not board["top"]:
+        show_colored_message("No habits to rank for this metric.", color=Fore.RED)
+    else:
+        display_leaderboard_table(
+            f"Top {len(board['top'])} by {metric_choice.lower()}", metric, board["top"]
+        )
+        display_leaderboard_table(
+            f"Bottom {len(board['bottom'])} by {metric_choice.lower()}",
+            metric,
+            board["bottom"],
+        )
+    press_enter_to_continue()
+
+
+CO_COMPLETION_PAIRS = 10
+
+
+def analyze_co_completion(db_name: str):
+    """Displays the habit pairs most often completed on the same days."""
+    show_colored_message(
+        "\n--- Habits Done Together ---", color=Fore.YELLOW, style=Style.BRIGHT
+    )
+    co_completion = analysis.calculate_co_completion(db_name)
+    pairs = [
+        p for p in analysis.get_co_completion_pairs(co_completion) if p["co_days"] > 0
+    ][:CO_COMPLETION_PAIRS]
+    if not pairs:
+        show_colored_message(
+            "Not enough completions to compare habits yet.", color=Fore.RED
+        )
+        press_enter_to_continue()
+        return
+
+    show_colored_message(
+        f"From {co_completion['start']} to {co_completion['end']}", color=Fore.CYAN
+    )
+    table = [
+        [
+            f"{p['first'].name} + {p['second'].name}",
+            p["co_days"],
+            f"{p['jaccard'] * 100:.0f}%",
+            f"{p['correlation']:+.2f}",
+            f"{p['lagged']:+.2f}",
+        ]
+        for p in pairs
+    ]
+    headers = [
+        f"{Fore.CYAN}Habits{Style.RESET_ALL}",
+        f"{Fore.CYAN}Days Together{Style.RESET_ALL}",
+        f"{Fore.CYAN}Overlap{Style.RESET_ALL}",
+        f"{Fore.CYAN}Same-day Corr.{Style.RESET_ALL}",
+        f"{Fore.CYAN}Next-day Corr.{Style.RESET_ALL}",
+    ]
+    print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
+    show_colored_message(
+        "Overlap = shared days / days either habit was done. "
+        "Next-day corr. relates the first habit to the second one a day later.",
+        color=Fore.MAGENTA,
+    )
+    press_enter_to_continue()
+
+
 def analyze_goal_progress(db_name: str):
     """Handles displaying goal progress for all goals."""
     show_colored_message(
         "\n--- Goal Progress ---", color=Fore.YELLOW, style=Style.BRIGHT
     )
 
-    goals = db.get_all_goals(active_only=True, db_name=db_name)
-    if not goals:
+    goal_progress = analysis.calculate_all_goal_progress(db_name)
+    if not goal_progress:
         show_colored_message("No active goals found.", color=Fore.RED)
         press_enter_to_continue()
         return
+    forecasts = analysis.forecast_goal_achievement(db_name, goal_progress)
 
     table = []
-    for goal in goals:
-        habit = db.get_habit(goal.habit_id, db_name)
-        habit_name = habit.name if habit else "Unknown Habit"
-        progress = goal.calculate_progress(db_name)
+    for entry in goal_progress:
+        goal = entry["goal"]
+        habit_name = entry["habit_name"]
+        progress = entry["progress"]
         progress_str = (
             f"{progress['count']}/{progress['total']} ({progress['percent']:.1f}%)"
         )
@@ -528,6 +904,7 @@ def analyze_goal_progress(db_name: str):
                 goal.target_completions or "Auto",
                 progress_str,
                 status_col,
+                _format_goal_forecast(forecasts.get(goal.id), progress["achieved"]),
             ]
         )
 
@@ -538,6 +915,7 @@ def analyze_goal_progress(db_name: str):
         f"{Fore.CYAN}Target{Style.RESET_ALL}",
         f"{Fore.CYAN}Progress{Style.RESET_ALL}",
         f"{Fore.CYAN}Status{Style.RESET_ALL}",
+        f"{Fore.CYAN}Chance to Reach{Style.RESET_ALL}",
     ]
     print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
     press_enter_to_continue()
@@ -548,27 +926,26 @@ def analyze_completion_history(db_name: str):
     show_colored_message(
         "\n--- Completion History ---", color=Fore.YELLOW, style=Style.BRIGHT
     )
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    selected_habit = _handle_habit_selection(
-        habits,
+    selected_habit = select_habit(
+        db_name,
         "Select a habit to view its completion history:",
         "No active habits found to analyze.",
     )
     if not selected_habit:
         return
-    completion_history = analysis.get_completion_history(selected_habit.id, db_name)
-    if not completion_history:
+    # Streamed in date order; the widths fit any row count, so nothing is read ahead
+    completions = db.iter_completions(selected_habit.id, db_name=db_name)
+    rows = (
+        [i, dt.strftime("%Y-%m-%d %H:%M")] for i, dt in enumerate(completions, start=1)
+    )
+    headers = [
+        f"{Fore.CYAN}# {Style.RESET_ALL}",
+        f"{Fore.CYAN}Completion Date/Time{Style.RESET_ALL}",
+    ]
+    if not show_paged_table(
+        rows, headers, widths=HISTORY_COLUMN_WIDTHS, source=completions
+    ):
         show_colored_message(
             "No completions recorded yet for this habit.", color=Fore.YELLOW
         )
-    else:
-        table = [
-            [i + 1, dt.strftime("%Y-%m-%d %H:%M")]
-            for i, dt in enumerate(completion_history)
-        ]
-        headers = [
-            f"{Fore.CYAN}# {Style.RESET_ALL}",
-            f"{Fore.CYAN}Completion Date/Time{Style.RESET_ALL}",
-        ]
-        print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
     press_enter_to_continue()
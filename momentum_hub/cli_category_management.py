@@ -4,7 +4,7 @@ from tabulate import tabulate
 
 from . import momentum_db as db
 from .category import Category
-from .cli_utils import _handle_habit_selection
+from .cli_utils import select_habit
 from .momentum_utils import press_enter_to_continue, show_colored_message
 
 
@@ -290,14 +290,10 @@ class CategoryManager:
             "\n--- Assign Habit to Category ---", color=Fore.YELLOW, style=Style.BRIGHT
         )
 
-        habits = db.get_all_habits(active_only=True, db_name=self.db_name)
-        if not habits:
-            show_colored_message("No active habits found.", color=Fore.RED)
-            press_enter_to_continue()
-            return
-
-        selected_habit = _handle_habit_selection(
-            habits, "Select a habit to assign to a category:", "No active habits found."
+        selected_habit = select_habit(
+            self.db_name,
+            "Select a habit to assign to a category:",
+            "No active habits found.",
         )
         if not selected_habit:
             return
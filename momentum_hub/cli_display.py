@@ -1,73 +1,131 @@
-import shutil
+import datetime
 
 from colorama import Fore, Style
-from pyfiglet import Figlet
 from tabulate import tabulate
 
+from . import habit_analysis as analysis
 from . import momentum_db as db
+from .banner import startup_message  # noqa: F401
 from .momentum_utils import press_enter_to_continue, show_colored_message
+from .paged_table import show_paged_table
 
 
-def startup_message():
-    """Displays a startup message for the Momentum Hub CLI, centered and in ASCII art."""
-    term_width = shutil.get_terminal_size((80, 20)).columns
-    figlet = Figlet(font="standard")
-    ascii_title = figlet.renderText("Momentum Hub")
-    # Center each line of the ASCII art
-    centered_ascii = "\n".join(
-        line.center(term_width) for line in ascii_title.splitlines()
+def _habit_row(habit) -> list:
+    last_completed_str = (
+        habit.last_completed.strftime("%Y-%m-%d %H:%M") if habit.last_completed else "-"
     )
-    subtitle = "Your personal habit tracker."
-    centered_subtitle = subtitle.center(term_width)
-    print("\n\n\n" + f"{Fore.GREEN}{centered_ascii}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{centered_subtitle}{Style.RESET_ALL}\n")
+    reactivated_at_str = (
+        habit.reactivated_at.strftime("%Y-%m-%d %H:%M") if habit.reactivated_at else "-"
+    )
+    return [
+        habit.id,
+        habit.name,
+        habit.frequency,
+        habit.streak,
+        habit.notes or "-",
+        habit.reminder_time or "-",
+        habit.evening_reminder_time or "-",
+        last_completed_str,
+        reactivated_at_str,
+    ]
 
 
 def view_habits(db_name: str):
-    """Displays all active habits in a tabulated format."""
+    """Displays all active habits in a table, a page at a time."""
     show_colored_message("\n--- View Habits ---", color=Fore.YELLOW, style=Style.BRIGHT)
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-
-    if not habits:
+    headers = [
+        f"{Fore.CYAN}ID{Style.RESET_ALL}",
+        f"{Fore.CYAN}Name{Style.RESET_ALL}",
+        f"{Fore.CYAN}Frequency{Style.RESET_ALL}",
+        f"{Fore.CYAN}Streak{Style.RESET_ALL}",
+        f"{Fore.CYAN}Notes{Style.RESET_ALL}",
+        f"{Fore.CYAN}Morning Reminder{Style.RESET_ALL}",
+        f"{Fore.CYAN}Evening Reminder{Style.RESET_ALL}",
+        f"{Fore.CYAN}Last Completed{Style.RESET_ALL}",
+        f"{Fore.CYAN}Reactivated At{Style.RESET_ALL}",
+    ]
+    habits = db.iter_habits(active_only=True, db_name=db_name)
+    if not show_paged_table(map(_habit_row, habits), headers, source=habits):
         show_colored_message(
             "No active habits found. Let's create one!", color=Fore.RED
         )
-    else:
-        table = []
-        for habit in habits:
-            last_completed_str = (
-                habit.last_completed.strftime("%Y-%m-%d %H:%M")
-                if habit.last_completed
-                else "-"
-            )
-            reactivated_at_str = (
-                habit.reactivated_at.strftime("%Y-%m-%d %H:%M")
-                if habit.reactivated_at
-                else "-"
-            )
-            table.append(
-                [
-                    habit.id,
-                    habit.name,
-                    habit.frequency,
-                    habit.streak,
-                    habit.notes or "-",
-                    habit.reminder_time or "-",
-                    habit.evening_reminder_time or "-",
-                    last_completed_str,
-                    reactivated_at_str,
-                ]
-            )
-        headers = [
-            f"{Fore.CYAN}ID{Style.RESET_ALL}",
-            f"{Fore.CYAN}Name{Style.RESET_ALL}",
-            f"{Fore.CYAN}Frequency{Style.RESET_ALL}",
-            f"{Fore.CYAN}Streak{Style.RESET_ALL}",
-            f"{Fore.CYAN}Notes{Style.RESET_ALL}",
-            f"{Fore.CYAN}Morning Reminder{Style.RESET_ALL}",
-            f"{Fore.CYAN}Evening Reminder{Style.RESET_ALL}",
-            f"{Fore.CYAN}Last Completed{Style.RESET_ALL}",
-            f"{Fore.CYAN}Reactivated At{Style.RESET_ALL}",
+    press_enter_to_continue()
+
+
+def _format_due_by(due_by: datetime.date, today: datetime.date) -> str:
+    if due_by == today:
+        return "Today"
+    return due_by.strftime("%a %d %b")
+
+
+def view_due_habits(db_name: str):
+    """Displays the habits still due in their current period, by reminder time."""
+    show_colored_message("\n--- What's Due ---", color=Fore.YELLOW, style=Style.BRIGHT)
+    agenda = analysis.get_due_list(db_name)
+    if not agenda:
+        show_colored_message(
+            "Nothing is due right now. Great job keeping up!", color=Fore.GREEN
+        )
+        press_enter_to_continue()
+        return
+
+    today = datetime.date.today()
+    table = [
+        [
+            entry["habit"].reminder_time or "-",
+            entry["habit"].name,
+            entry["habit"].frequency,
+            f"{entry['done']}/{entry['quota']}",
+            _format_due_by(entry["due_by"], today),
+        ]
+        for entry in agenda
+    ]
+    headers = [
+        f"{Fore.CYAN}Reminder{Style.RESET_ALL}",
+        f"{Fore.CYAN}Habit{Style.RESET_ALL}",
+        f"{Fore.CYAN}Frequency{Style.RESET_ALL}",
+        f"{Fore.CYAN}Done{Style.RESET_ALL}",
+        f"{Fore.CYAN}Due By{Style.RESET_ALL}",
+    ]
+    print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
+    press_enter_to_continue()
+
+
+SEARCH_RESULT_LIMIT = 20
+
+
+def view_search(db_name: str):
+    """Searches habits and categories by name, notes and description."""
+    import questionary
+
+    show_colored_message("\n--- Search ---", color=Fore.YELLOW, style=Style.BRIGHT)
+    query = questionary.text(
+        "Search habits and categories (words or word starts):"
+    ).ask()
+    if not query or not query.strip():
+        return
+    results = db.search(query, SEARCH_RESULT_LIMIT, db_name)
+    if not results:
+        show_colored_message(f"No habits or categories match '{query}'.", Fore.RED)
+        press_enter_to_continue()
+        return
+
+    table = [
+        [
+            result["kind"].capitalize(),
+            result["id"],
+            result["name"],
+            result["snippet"] or "-",
+            "Active" if result["is_active"] else "Deleted",
         ]
-        print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
+        for result in results
+    ]
+    headers = [
+        f"{Fore.CYAN}Type{Style.RESET_ALL}",
+        f"{Fore.CYAN}ID{Style.RESET_ALL}",
+        f"{Fore.CYAN}Name{Style.RESET_ALL}",
+        f"{Fore.CYAN}Match{Style.RESET_ALL}",
+        f"{Fore.CYAN}Status{Style.RESET_ALL}",
+    ]
+    print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
     press_enter_to_continue()
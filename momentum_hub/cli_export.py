@@ -1,8 +1,10 @@
 import questionary
 from colorama import Fore, Style
 
+from . import habit_analysis as analysis
 from . import momentum_db as db
-from .cli_utils import _handle_habit_selection
+from . import periods
+from .cli_utils import select_habit
 from .momentum_utils import press_enter_to_continue, show_colored_message
 
 
@@ -18,6 +20,7 @@ def analyze_export_csv(db_name: str):
             "Export all habits and their details",
             "Export completions for all habits",
             "Export completions for a specific habit",
+            "Export habit co-completion statistics",
             "Back to Main Menu",
         ],
     ).ask()
@@ -28,6 +31,8 @@ def analyze_export_csv(db_name: str):
         export_all_completions_to_csv(db_name)
     elif analysis_choice == "Export completions for a specific habit":
         export_habit_completions_to_csv(db_name)
+    elif analysis_choice == "Export habit co-completion statistics":
+        export_co_completion_to_csv(db_name)
     elif analysis_choice == "Back to Main Menu":
         return
 
@@ -40,6 +45,14 @@ def export_all_habits_to_csv(db_name: str, base_dir: str = "CSV Export"):
 
     habits = db.get_all_habits(active_only=False, db_name=db_name)
 
+    # Most recent active goal per habit, with progress from one grouped query
+    latest_goal_progress = {}
+    for entry in analysis.calculate_all_goal_progress(db_name):
+        goal = entry["goal"]
+        current = latest_goal_progress.get(goal.habit_id)
+        if current is None or goal.created_at > current["goal"].created_at:
+            latest_goal_progress[goal.habit_id] = entry
+
     os.makedirs(base_dir, exist_ok=True)
     filename = os.path.join(
         base_dir, f"habits_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
@@ -74,11 +87,8 @@ def export_all_habits_to_csv(db_name: str, base_dir: str = "CSV Export"):
 
                 # Get goal progress if habit has active goals
                 goal_progress = ""
-                goals = db.get_all_goals(active_only=True, db_name=db_name)
-                habit_goals = [g for g in goals if g.habit_id == habit.id]
-                if habit_goals:
-                    goal = max(habit_goals, key=lambda g: g.created_at)
-                    progress = goal.calculate_progress(db_name)
+                if habit.id in latest_goal_progress:
+                    progress = latest_goal_progress[habit.id]["progress"]
                     goal_progress = f"{progress['count']}/{progress['total']} ({progress['percent']:.1f}%)"
 
                 writer.writerow(
@@ -183,14 +193,11 @@ def export_habit_completions_to_csv(db_name: str, base_dir: str = "CSV Export"):
     import os
     from datetime import datetime
 
-    habits = db.get_all_habits(active_only=False, db_name=db_name)
-    if not habits:
-        show_colored_message("No habits found to export completions.", color=Fore.RED)
-        press_enter_to_continue()
-        return
-
-    selected_habit = _handle_habit_selection(
-        habits, "Select a habit to export completions:", "No habits found to export."
+    selected_habit = select_habit(
+        db_name,
+        "Select a habit to export completions:",
+        "No habits found to export completions.",
+        active=None,
     )
     if not selected_habit:
         return
@@ -223,26 +230,16 @@ def export_habit_completions_to_csv(db_name: str, base_dir: str = "CSV Export"):
 
             writer.writeheader()
             for completion in completions:
-                # Calculate week number for weekly habits
+                # Week number (Sunday-start weeks since creation) for weekly habits
                 week_number = ""
-                if selected_habit.frequency == "weekly":
-                    from datetime import timedelta
-
-                    completion_date = completion.date()
-                    week_start = completion_date - timedelta(
-                        days=(
-                            completion_date.weekday() + 1
-                            if completion_date.weekday() < 6
-                            else 0
-                        )
+                parsed = periods.parse_frequency(selected_habit.frequency)
+                if parsed and parsed[0] == "week" and selected_habit.created_at:
+                    weeks_since_creation = (
+                        periods.week_key(completion)
+                        - periods.week_key(selected_habit.created_at)
+                        + 1
                     )
-                    # Week number since habit creation
-                    if selected_habit.created_at:
-                        habit_start = selected_habit.created_at.date()
-                        weeks_since_creation = (
-                            (week_start - habit_start).days // 7
-                        ) + 1
-                        week_number = f"Week {weeks_since_creation}"
+                    week_number = f"Week {weeks_since_creation}"
 
                 writer.writerow(
                     {
@@ -263,3 +260,65 @@ def export_habit_completions_to_csv(db_name: str, base_dir: str = "CSV Export"):
         show_colored_message(f"Error exporting completions: {str(e)}", color=Fore.RED)
 
     press_enter_to_continue()
+
+
+def export_co_completion_to_csv(db_name: str, base_dir: str = "CSV Export"):
+    """Export pairwise co-completion statistics for all active habits to a CSV file."""
+    import csv
+    import os
+    from datetime import datetime
+
+    co_completion = analysis.calculate_co_completion(db_name)
+    if len(co_completion["habits"]) < 2:
+        show_colored_message(
+            "At least two active habits are needed to compare.", color=Fore.RED
+        )
+        press_enter_to_continue()
+        return
+
+    os.makedirs(base_dir, exist_ok=True)
+    filename = os.path.join(
+        base_dir,
+        f"co_completion_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+    )
+
+    try:
+        pairs = analysis.get_co_completion_pairs(co_completion)
+        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+            fieldnames = [
+                "Habit A",
+                "Habit B",
+                "Days Together",
+                "Jaccard",
+                "Correlation",
+                "Next-day Correlation (A then B)",
+                "Next-day Correlation (B then A)",
+            ]
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+
+            writer.writeheader()
+            for pair in pairs:
+                writer.writerow(
+                    {
+                        "Habit A": pair["first"].name,
+                        "Habit B": pair["second"].name,
+                        "Days Together": pair["co_days"],
+                        "Jaccard": f"{pair['jaccard']:.4f}",
+                        "Correlation": f"{pair['correlation']:.4f}",
+                        "Next-day Correlation (A then B)": f"{pair['lagged']:.4f}",
+                        "Next-day Correlation (B then A)": (
+                            f"{pair['lagged_reverse']:.4f}"
+                        ),
+                    }
+                )
+
+        show_colored_message(
+            f"Successfully exported {len(pairs)} habit pairs to {filename}",
+            color=Fore.GREEN,
+        )
+    except Exception as e:
+        show_colored_message(
+            f"Error exporting co-completion statistics: {str(e)}", color=Fore.RED
+        )
+
+    press_enter_to_continue()
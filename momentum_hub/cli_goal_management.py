@@ -4,8 +4,9 @@ import questionary
 from colorama import Fore, Style
 from tabulate import tabulate
 
+from . import habit_analysis as analysis
 from . import momentum_db as db
-from .cli_utils import _handle_habit_selection
+from .cli_utils import _format_goal_forecast, select_habit
 from .goal import Goal
 from .momentum_utils import press_enter_to_continue, show_colored_message
 
@@ -45,16 +46,10 @@ def create_goal(db_name: str):
     )
 
     # Select habit
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    if not habits:
-        show_colored_message(
-            "No active habits found. Create a habit first!", color=Fore.RED
-        )
-        press_enter_to_continue()
-        return
-
-    selected_habit = _handle_habit_selection(
-        habits, "Select a habit for the goal:", "No active habits found."
+    selected_habit = select_habit(
+        db_name,
+        "Select a habit for the goal:",
+        "No active habits found. Create a habit first!",
     )
     if not selected_habit:
         return
@@ -134,17 +129,18 @@ def view_goals(db_name: str):
     """Handles viewing all goals."""
     show_colored_message("\n--- All Goals ---", color=Fore.YELLOW, style=Style.BRIGHT)
 
-    goals = db.get_all_goals(active_only=True, db_name=db_name)
-    if not goals:
+    goal_progress = analysis.calculate_all_goal_progress(db_name)
+    if not goal_progress:
         show_colored_message("No active goals found.", color=Fore.RED)
         press_enter_to_continue()
         return
+    forecasts = analysis.forecast_goal_achievement(db_name, goal_progress)
 
     table = []
-    for goal in goals:
-        habit = db.get_habit(goal.habit_id, db_name)
-        habit_name = habit.name if habit else "Unknown Habit"
-        progress = goal.calculate_progress(db_name)
+    for entry in goal_progress:
+        goal = entry["goal"]
+        habit_name = entry["habit_name"]
+        progress = entry["progress"]
         progress_str = (
             f"{progress['count']}/{progress['total']} ({progress['percent']:.1f}%)"
         )
@@ -163,6 +159,7 @@ def view_goals(db_name: str):
                 goal.target_completions or "Auto",
                 progress_str,
                 status_col,
+                _format_goal_forecast(forecasts.get(goal.id), progress["achieved"]),
             ]
         )
 
@@ -173,6 +170,7 @@ def view_goals(db_name: str):
         f"{Fore.CYAN}Target{Style.RESET_ALL}",
         f"{Fore.CYAN}Progress{Style.RESET_ALL}",
         f"{Fore.CYAN}Status{Style.RESET_ALL}",
+        f"{Fore.CYAN}Chance to Reach{Style.RESET_ALL}",
     ]
     print(tabulate(table, headers=headers, tablefmt="grid", stralign="center"))
     press_enter_to_continue()
@@ -182,20 +180,19 @@ def update_goal(db_name: str):
     """Handles updating an existing goal."""
     show_colored_message("\n--- Update Goal ---", color=Fore.YELLOW, style=Style.BRIGHT)
 
-    goals = db.get_all_goals(active_only=True, db_name=db_name)
-    if not goals:
+    goal_progress = analysis.calculate_all_goal_progress(db_name)
+    if not goal_progress:
         show_colored_message("No active goals found to update.", color=Fore.RED)
         press_enter_to_continue()
         return
 
     # Create choices for goal selection
     choices = []
-    for goal in goals:
-        habit = db.get_habit(goal.habit_id, db_name)
-        habit_name = habit.name if habit else "Unknown Habit"
-        progress = goal.calculate_progress(db_name)
+    for entry in goal_progress:
+        progress = entry["progress"]
         choices.append(
-            f"{goal.id}. {habit_name} - {progress['count']}/{progress['total']} ({progress['percent']:.1f}%)"
+            f"{entry['goal'].id}. {entry['habit_name']} - "
+            f"{progress['count']}/{progress['total']} ({progress['percent']:.1f}%)"
         )
     choices.append("Cancel")
 
@@ -277,20 +274,19 @@ def delete_goal(db_name: str):
     """Handles deleting a goal."""
     show_colored_message("\n--- Delete Goal ---", color=Fore.YELLOW, style=Style.BRIGHT)
 
-    goals = db.get_all_goals(active_only=True, db_name=db_name)
-    if not goals:
+    goal_progress = analysis.calculate_all_goal_progress(db_name)
+    if not goal_progress:
         show_colored_message("No active goals found to delete.", color=Fore.RED)
         press_enter_to_continue()
         return
 
     # Create choices for goal selection
     choices = []
-    for goal in goals:
-        habit = db.get_habit(goal.habit_id, db_name)
-        habit_name = habit.name if habit else "Unknown Habit"
-        progress = goal.calculate_progress(db_name)
+    for entry in goal_progress:
+        progress = entry["progress"]
         choices.append(
-            f"{goal.id}. {habit_name} - {progress['count']}/{progress['total']} ({progress['percent']:.1f}%)"
+            f"{entry['goal'].id}. {entry['habit_name']} - "
+            f"{progress['count']}/{progress['total']} ({progress['percent']:.1f}%)"
         )
     choices.append("Cancel")
 
@@ -4,11 +4,37 @@ import questionary
 from colorama import Fore, Style
 
 from . import momentum_db as db
-from .cli_utils import _handle_habit_selection, _validate_time_format
+from . import periods
+from .cli_utils import _validate_time_format, _validate_times_per_week, select_habit
 from .encouragements import get_completion_encouragement, get_streak_encouragement
 from .habit import Habit
 from .momentum_utils import press_enter_to_continue, show_colored_message
 
+FREQUENCY_CHOICES = ["daily", "weekly", "monthly", "times per week"]
+# Streak lengths, in periods of the habit's unit, that earn a milestone message
+STREAK_MILESTONES = {"day": (7, 30, 100), "week": (4, 12, 52), "month": (3, 6, 12)}
+
+
+def _ask_frequency(message: str, current: str | None = None) -> str | None:
+    """
+    Prompts for a habit frequency; "times per week" asks for N and returns "N/week".
+    Returns None if the user cancels.
+    """
+    default = None
+    if current:
+        default = current if current in FREQUENCY_CHOICES else "times per week"
+    frequency = questionary.select(
+        message, choices=FREQUENCY_CHOICES, default=default
+    ).ask()
+    if frequency != "times per week":
+        return frequency
+    times = questionary.text(
+        "How many times per week? (2-6)", validate=_validate_times_per_week
+    ).ask()
+    if times is None:
+        return None
+    return periods.times_per_week(int(times))
+
 
 def create_new_habit(db_name: str):
     """Handles creating a new habit and saving it to the database."""
@@ -29,9 +55,7 @@ def create_new_habit(db_name: str):
             show_colored_message("Habit name cannot be empty.", color=Fore.RED)
             continue
         break
-    frequency = questionary.select(
-        f"How often should '{habit_name}' be done?", choices=["daily", "weekly"]
-    ).ask()
+    frequency = _ask_frequency(f"How often should '{habit_name}' be done?")
     if frequency is None:
         show_colored_message("Habit creation cancelled.", color=Fore.YELLOW)
         press_enter_to_continue()
@@ -108,9 +132,8 @@ def mark_habit_completed(db_name: str):
     show_colored_message(
         "\n--- Mark Habit as Completed ---", color=Fore.YELLOW, style=Style.BRIGHT
     )
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    selected_habit = _handle_habit_selection(
-        habits,
+    selected_habit = select_habit(
+        db_name,
         "Select a habit to mark as completed:",
         "No active habits found. Let's create one!",
     )
@@ -145,20 +168,16 @@ def mark_habit_completed(db_name: str):
         color=Fore.CYAN,
         style=Style.BRIGHT,
     )
-    if habit.frequency == "daily":
-        if current_streak in [7, 30, 100]:
-            show_colored_message(
-                get_streak_encouragement(current_streak, is_weekly=False),
-                color=Fore.MAGENTA,
-                style=Style.BRIGHT,
-            )
-    else:  # weekly habit
-        if current_streak in [4, 12, 52]:
-            show_colored_message(
-                get_streak_encouragement(current_streak, is_weekly=True),
-                color=Fore.MAGENTA,
-                style=Style.BRIGHT,
-            )
+    parsed = periods.parse_frequency(habit.frequency)
+    unit = parsed[0] if parsed else "day"
+    if current_streak in STREAK_MILESTONES[unit]:
+        show_colored_message(
+            get_streak_encouragement(
+                current_streak, is_weekly=unit == "week", is_monthly=unit == "month"
+            ),
+            color=Fore.MAGENTA,
+            style=Style.BRIGHT,
+        )
     press_enter_to_continue()
 
 
@@ -167,19 +186,14 @@ def delete_habit(db_name: str):
     show_colored_message(
         "\n--- Delete Habit ---", color=Fore.YELLOW, style=Style.BRIGHT
     )
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    if not habits:
-        show_colored_message("No active habits found to delete.", color=Fore.RED)
-        press_enter_to_continue()
-        return
     # Use interactive menu for habit selection, with Cancel option
-    habit_to_delete = _handle_habit_selection(
-        habits,
+    habit_to_delete = select_habit(
+        db_name,
         "Select a habit to delete (or Cancel):",
         "No active habits found to delete.",
     )
     if not habit_to_delete:
-        return  # _handle_habit_selection already shows cancellation message and waits for input
+        return  # select_habit already shows the empty or cancelled message and waits
     confirm = questionary.confirm(
         f"Are you sure you want to delete '{habit_to_delete.name}'?"
     ).ask()
@@ -200,38 +214,20 @@ def reactivate_habit(db_name: str):
     show_colored_message(
         "\n--- Reactivate Habit ---", color=Fore.YELLOW, style=Style.BRIGHT
     )
-    habits = db.get_all_habits(active_only=False, db_name=db_name)
-    deleted_habits = [h for h in habits if not h.is_active]
-    if not deleted_habits:
-        show_colored_message("No deleted habits found to reactivate.", color=Fore.RED)
-        press_enter_to_continue()
-        return
     # Use interactive menu for habit selection, with Cancel option
-    choices = [
-        f"{habit.id}. {habit.name} ({habit.frequency})" for habit in deleted_habits
-    ]
-    choices.append("Cancel")
-    answer = questionary.select(
-        "Select a habit to reactivate (or Cancel):", choices=choices
-    ).ask()
-    if answer == "Cancel" or answer is None:
-        show_colored_message("Reactivation cancelled.", color=Fore.YELLOW)
-        press_enter_to_continue()
-        return
-    try:
-        habit_id = int(answer.split(".")[0])
-        for habit in deleted_habits:
-            if habit.id == habit_id:
-                db.reactivate_habit(habit.id, db_name)
-                show_colored_message(
-                    f"Habit '{habit.name}' reactivated successfully!", color=Fore.GREEN
-                )
-                press_enter_to_continue()
-                return
-    except Exception:
-        show_colored_message("Invalid selection.", color=Fore.RED)
-        press_enter_to_continue()
+    habit = select_habit(
+        db_name,
+        "Select a habit to reactivate (or Cancel):",
+        "No deleted habits found to reactivate.",
+        active=False,
+    )
+    if not habit:
         return
+    db.reactivate_habit(habit.id, db_name)
+    show_colored_message(
+        f"Habit '{habit.name}' reactivated successfully!", color=Fore.GREEN
+    )
+    press_enter_to_continue()
 
 
 def update_habit(db_name: str):
@@ -240,19 +236,11 @@ def update_habit(db_name: str):
         "\n--- Update Habit ---", color=Fore.YELLOW, style=Style.BRIGHT
     )
 
-    habits = db.get_all_habits(active_only=True, db_name=db_name)
-    if not habits:
-        show_colored_message(
-            "No active habits found. Let's create one!", color=Fore.RED
-        )
-        press_enter_to_continue()
-        return
-
     # Use interactive menu for habit selection
-    habit_to_update = _handle_habit_selection(
-        habits,
+    habit_to_update = select_habit(
+        db_name,
         "Select a habit to update (or Cancel):",
-        "No active habits found to update.",
+        "No active habits found. Let's create one!",
     )
     if not habit_to_update:
         show_colored_message("Update cancelled.", color=Fore.YELLOW)
@@ -280,11 +268,10 @@ def update_habit(db_name: str):
     if not new_name.strip():
         new_name = habit_to_update.name
 
-    new_frequency = questionary.select(
+    new_frequency = _ask_frequency(
         f"Select new frequency for '{habit_to_update.name}' (current: {habit_to_update.frequency}):",
-        choices=["daily", "weekly"],
-        default=habit_to_update.frequency,
-    ).ask()
+        current=habit_to_update.frequency,
+    )
 
     new_notes = questionary.text(
         f"Enter new notes for '{habit_to_update.name}' (leave blank to keep current):",
@@ -1,7 +1,21 @@
 import datetime
+from typing import Optional
 
+from . import momentum_db as db
+from .habit import Habit
 from .momentum_utils import press_enter_to_continue, show_colored_message
 
+HABIT_PAGE_SIZE = 15
+
+# Navigation entries of the habit picker; habit entries use the habit id as value
+_SEARCH, _CLEAR, _NEXT, _PREVIOUS, _CANCEL = (
+    "search",
+    "clear",
+    "next",
+    "previous",
+    "cancel",
+)
+
 
 def _validate_time_format(time_str: str) -> bool | str:
     """Validates the time format (HH:MM) and allows empty string for optional times."""
@@ -14,6 +28,17 @@ def _validate_time_format(time_str: str) -> bool | str:
         return "Invalid time format. Please use HH:MM (24-hour format)."
 
 
+def _validate_times_per_week(value: str) -> bool | str:
+    """Validates an N-per-week count (2-6)."""
+    from .periods import MAX_TIMES_PER_WEEK, MIN_TIMES_PER_WEEK
+
+    if value.isdigit() and MIN_TIMES_PER_WEEK <= int(value) <= MAX_TIMES_PER_WEEK:
+        return True
+    return (
+        f"Please enter a number between {MIN_TIMES_PER_WEEK} and {MAX_TIMES_PER_WEEK}."
+    )
+
+
 def _handle_habit_selection(habits, title, error_msg="No active habits found"):
     import questionary
     from colorama import Fore
@@ -22,27 +47,110 @@ def _handle_habit_selection(habits, title, error_msg="No active habits found"):
         show_colored_message(error_msg, color=Fore.RED)
         press_enter_to_continue()
         return None
-    choices = [
-        f"{habit.id}. {habit.name} ({habit.frequency}) - Streak: {habit.streak}"
-        for habit in habits
-    ]
+    choices = [_habit_label(habit) for habit in habits]
     choices.append("Cancel")
     answer = questionary.select(title, choices=choices).ask()
     if answer == "Cancel" or answer is None:
         show_colored_message("Operation cancelled.", color=Fore.YELLOW)
         press_enter_to_continue()
         return None
-    try:
-        habit_id = int(answer.split(".")[0])
-        for habit in habits:
-            if habit.id == habit_id:
-                return habit
-    except Exception:
+    habit = {h.id: h for h in habits}.get(
+        int(answer.split(".")[0]) if answer.split(".")[0].isdigit() else None
+    )
+    if habit is None:
         show_colored_message("Invalid selection.", color=Fore.RED)
         press_enter_to_continue()
-        return None
+    return habit
+
+
+def _habit_label(habit: Habit) -> str:
+    return f"{habit.id}. {habit.name} ({habit.frequency}) - Streak: {habit.streak}"
+
+
+def select_habit(
+    db_name: str,
+    title: str,
+    error_msg: str = "No active habits found",
+    active: Optional[bool] = True,
+    page_size: int = HABIT_PAGE_SIZE,
+) -> Optional[Habit]:
+    """
+    Interactive habit picker for any number of habits. Shows one page at a time
+    from db.search_habits() and lets the user search names and notes (prefix,
+    substring or fuzzy) or move between pages. The answer is the habit id, looked
+    up in the page's id map.
+    active: True for active habits, False for deleted ones, None for all.
+    Returns the selected habit, or None when there is none or the user cancels.
+    """
+    import questionary
+    from colorama import Fore
+
+    query = ""
+    cursors = [None]  # start cursor of every page visited; last is the current one
+    while True:
+        habits, next_cursor = db.search_habits(
+            query, active, cursors[-1], page_size, db_name
+        )
+        if not habits and not query and len(cursors) == 1:
+            show_colored_message(error_msg, color=Fore.RED)
+            press_enter_to_continue()
+            return None
+        by_id = {habit.id: habit for habit in habits}
+
+        choices = [questionary.Choice(_habit_label(h), value=h.id) for h in habits]
+        if next_cursor is not None:
+            choices.append(questionary.Choice("Next page >", value=_NEXT))
+        if len(cursors) > 1:
+            choices.append(questionary.Choice("< Previous page", value=_PREVIOUS))
+        choices.append(questionary.Choice("Search...", value=_SEARCH))
+        if query:
+            choices.append(questionary.Choice("Clear search", value=_CLEAR))
+        choices.append(questionary.Choice("Cancel", value=_CANCEL))
+
+        heading = f"{title} (page {len(cursors)}"
+        if query:
+            heading += (
+                f", matching '{query}'" if habits else f", no match for '{query}'"
+            )
+        answer = questionary.select(heading + ")", choices=choices).ask()
+
+        if answer in by_id:
+            return by_id[answer]
+        if answer == _NEXT:
+            cursors.append(next_cursor)
+        elif answer == _PREVIOUS:
+            cursors.pop()
+        elif answer in (_SEARCH, _CLEAR):
+            text = ""
+            if answer == _SEARCH:
+                text = questionary.text("Search habits by name or notes:").ask()
+                if text is None:
+                    continue
+            query, cursors = text.strip(), [None]
+        else:
+            show_colored_message("Operation cancelled.", color=Fore.YELLOW)
+            press_enter_to_continue()
+            return None
 
 
 def _to_date(dt):
     """Normalize a datetime-like value to a date."""
     return dt.date() if hasattr(dt, "date") else dt
+
+
+def _format_goal_forecast(forecast, achieved: bool = False) -> str:
+    """Colour a goal forecast (from habit_analysis.forecast_goal_achievement)."""
+    from colorama import Fore, Style
+
+    if achieved:
+        return f"{Fore.GREEN}Done{Style.RESET_ALL}"
+    if not forecast:
+        return "-"
+    probability = forecast["probability"]
+    if probability >= 0.8:
+        color = Fore.GREEN
+    elif probability >= 0.5:
+        color = Fore.YELLOW
+    else:
+        color = Fore.RED
+    return f"{color}{probability * 100:.0f}%{Style.RESET_ALL}"
@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+from typing import Any, List, Optional
+
+# Design rationale: the client only imports the standard library, so a scripted
+# call costs an interpreter start and one socket round trip; all database and
+# analytics work happens in the long-running daemon (momentum_hub.daemon).
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon is unreachable or reports a failed request."""
+
+
+def default_socket_path() -> str:
+    """$MOMENTUM_SOCKET, or a per-user socket in the temporary directory."""
+    user = os.getuid() if hasattr(os, "getuid") else os.getenv("USERNAME", "user")
+    return os.getenv(
+        "MOMENTUM_SOCKET",
+        os.path.join(tempfile.gettempdir(), f"momentum-hub-{user}.sock"),
+    )
+
+
+class DaemonClient:
+    """
+    Newline-delimited JSON connection to a running daemon; one connection can
+    carry any number of requests.
+
+    Example:
+        with DaemonClient() as client:
+            client.call("complete", habit_id=3)
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 30):
+        self.socket_path = socket_path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(self.socket_path)
+        except OSError as e:
+            self._sock.close()
+            raise DaemonError(
+                f"Momentum daemon is not running at {self.socket_path} ({e}). "
+                "Start it with: python momentum_main.py --daemon"
+            ) from e
+        self._file = self._sock.makefile("rwb")
+        self._next_id = 0
+
+    def call(self, op: str, **args) -> Any:
+        """Sends one request and returns its result; raises DaemonError on failure."""
+        self._next_id += 1
+        request = {"id": self._next_id, "op": op, "args": args}
+        self._file.write(json.dumps(request).encode() + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise DaemonError("The daemon closed the connection.")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Request failed."))
+        return response.get("result")
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def request(op: str, socket_path: Optional[str] = None, **args) -> Any:
+    """Sends a single request over a new connection and returns its result."""
+    with DaemonClient(socket_path) as client:
+        return client.call(op, **args)
+
+
+def _parse_arg(text: str) -> tuple:
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected key=value, got '{text}'")
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError:
+        return key, value
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Send one request to a running Momentum Hub daemon",
+        epilog="Example: python -m momentum_hub.client complete habit_id=3",
+    )
+    parser.add_argument("op", help="Operation, e.g. habits, complete, due, metrics")
+    parser.add_argument(
+        "args", nargs="*", type=_parse_arg, help="Arguments as key=value (JSON values)"
+    )
+    parser.add_argument("--socket", default=None, help="Daemon socket path")
+    args = parser.parse_args(argv)
+    try:
+        result = request(args.op, args.socket, **dict(args.args))
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
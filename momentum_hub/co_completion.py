@@ -0,0 +1,136 @@
+import datetime
+import math
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Set, Tuple
+
+# Design rationale: each habit's history over a date span is one Python int used
+# as a bitset (bit d set = completed on day start + d). Pairwise statistics are
+# then AND / shift / popcount operations on whole histories at once, so the cost
+# per pair is a few machine words per 64 days rather than a per-day Python loop.
+# Pairs are not enumerated over all H^2 habit combinations: a transposed index
+# (one habit bitset per day) gives each habit the habits completed on its days in
+# a few big-int ORs, so only pairs that actually co-occur are visited and the
+# Python-level work grows with completions and co-occurring pairs, not with H^2.
+# Results are sparse {(i, j): value} dicts; absent pairs never co-occurred.
+
+Pair = Tuple[int, int]
+
+
+def day_bitset(days: Iterable[datetime.date], start: datetime.date, n_days: int) -> int:
+    """Bitset of the given days that fall within [start, start + n_days)."""
+    buf = bytearray((n_days + 7) // 8)
+    for d in days:
+        offset = (d - start).days
+        if 0 <= offset < n_days:
+            buf[offset >> 3] |= 1 << (offset & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _indices(mask: int) -> Iterator[int]:
+    """Positions of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _phi(n: int, both: int, a: int, b: int) -> float:
+    """Phi coefficient (Pearson correlation of two 0/1 series) from counts."""
+    denominator = a * (n - a) * b * (n - b)
+    if denominator == 0:
+        return 0.0
+    return (n * both - a * b) / math.sqrt(denominator)
+
+
+class CompletionMatrix:
+    """
+    Day x habit completion matrix stored as one bitset per habit, plus the
+    transposed index of one habit bitset per day.
+
+    Example:
+        matrix = CompletionMatrix([1, 2], {1: days_a, 2: days_b}, start, 90)
+        matrix.jaccard()[(0, 1)] -> 0.42
+    """
+
+    def __init__(
+        self,
+        habit_ids: Sequence[int],
+        days_by_habit: Dict[int, Iterable[datetime.date]],
+        start: datetime.date,
+        n_days: int,
+    ):
+        self.habit_ids = list(habit_ids)
+        self.start = start
+        self.n_days = max(0, n_days)
+        self.bits = [
+            day_bitset(days_by_habit.get(hid, ()), start, self.n_days)
+            for hid in self.habit_ids
+        ]
+        self.counts = [b.bit_count() for b in self.bits]
+        self._offsets = [list(_indices(b)) for b in self.bits]
+        self._habits_on_day: Dict[int, int] = {}
+        for index, offsets in enumerate(self._offsets):
+            for offset in offsets:
+                day = self._habits_on_day.get(offset, 0)
+                self._habits_on_day[offset] = day | (1 << index)
+
+    def partners(self, i: int, lag: int = 0) -> int:
+        """Bitset of the habits completed `lag` days after any completion of i."""
+        mask = 0
+        for offset in self._offsets[i]:
+            mask |= self._habits_on_day.get(offset + lag, 0)
+        return mask
+
+    def candidate_pairs(self, lag: int = 0) -> Set[Pair]:
+        """
+        Pairs that co-occur: unordered (i < j) pairs completed on a shared day
+        for lag 0, else ordered (i, j) pairs with j done `lag` days after i.
+        """
+        pairs = set()
+        for i in range(len(self.bits)):
+            for j in _indices(self.partners(i, lag)):
+                if (j > i) if lag == 0 else (j != i):
+                    pairs.add((i, j))
+        return pairs
+
+    def co_occurrence(self) -> Dict[Pair, int]:
+        """Days on which both habits were completed, for pairs sharing a day."""
+        return {
+            (i, j): (self.bits[i] & self.bits[j]).bit_count()
+            for i, j in self.candidate_pairs()
+        }
+
+    def jaccard(self, co: Optional[Dict[Pair, int]] = None) -> Dict[Pair, float]:
+        """Shared days / days on which either habit was completed."""
+        co = co if co is not None else self.co_occurrence()
+        return {
+            (i, j): both / (self.counts[i] + self.counts[j] - both)
+            for (i, j), both in co.items()
+        }
+
+    def correlation(
+        self, pairs: Optional[Iterable[Pair]] = None, lag: int = 0
+    ) -> Dict[Pair, float]:
+        """
+        Phi correlation between habit i on day d and habit j on day d + lag, for
+        the given pairs (default: the pairs that co-occur at that lag). The
+        lagged result is not symmetric: (i, j) asks whether doing i today goes
+        with doing j `lag` days later.
+        """
+        pairs = self.candidate_pairs(lag) if pairs is None else pairs
+        n = self.n_days - lag
+        if n <= 0:
+            return {pair: 0.0 for pair in pairs}
+        mask = (1 << n) - 1
+        leading = [b & mask for b in self.bits]
+        trailing = [b >> lag for b in self.bits]
+        leading_counts = [b.bit_count() for b in leading]
+        trailing_counts = [b.bit_count() for b in trailing]
+        return {
+            (i, j): _phi(
+                n,
+                (leading[i] & trailing[j]).bit_count(),
+                leading_counts[i],
+                trailing_counts[j],
+            )
+            for i, j in pairs
+        }
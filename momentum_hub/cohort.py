@@ -0,0 +1,217 @@
+import argparse
+import datetime
+import glob
+import json
+import os
+import sqlite3
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Union
+
+from . import habit_analysis
+from . import momentum_db as db
+
+# Design rationale: deployments keep one SQLite file per user, so cohort statistics
+# are computed per file in worker processes (each opening its file read-only) and
+# reduced into one summary. Partial summaries only hold counters, which are small,
+# picklable and merge associatively, so the sweep scales with the number of workers.
+
+RATE_BINS = 10  # completion-rate histogram buckets of width 0.1
+DEFAULT_CHUNKSIZE = 16  # databases handed to a worker per task
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def find_databases(target: Union[str, Sequence[str]]) -> List[str]:
+    """
+    Resolves a directory (every *.db inside it), a glob pattern, a single file or a
+    list of those into a sorted list of database paths.
+    """
+    if not isinstance(target, str):
+        return sorted({path for item in target for path in find_databases(item)})
+    if os.path.isdir(target):
+        return sorted(glob.glob(os.path.join(target, "*.db")))
+    if os.path.isfile(target):
+        return [target]
+    return sorted(p for p in glob.glob(target, recursive=True) if os.path.isfile(p))
+
+
+def empty_summary() -> dict:
+    """Returns the identity element for merge_summaries()."""
+    return {
+        "databases": 0,
+        "habits": 0,
+        "completions": 0,
+        "rate_histogram": [0] * RATE_BINS,
+        "longest_streaks": Counter(),
+        "current_streaks": Counter(),
+        "categories": Counter(),
+        "frequencies": Counter(),
+        "errors": [],
+    }
+
+
+def _rate_bin(rate: float) -> int:
+    return min(RATE_BINS - 1, max(0, int(rate * RATE_BINS)))
+
+
+def summarize_database(
+    path: str, reference_date: Optional[datetime.date] = None
+) -> dict:
+    """
+    Computes the partial cohort summary of one database, opened read-only.
+    Files that cannot be read are reported in 'errors' instead of raising.
+    """
+    summary = empty_summary()
+    uri = db.readonly_uri(path)
+    try:
+        habits = db.get_all_habits(active_only=True, db_name=uri)
+        categories = {
+            c.id: c.name for c in db.get_all_categories(active_only=True, db_name=uri)
+        }
+        metrics = habit_analysis.get_metrics_for_habits(habits, uri, reference_date)
+    except sqlite3.Error as e:
+        summary["errors"].append(f"{path}: {e}")
+        return summary
+
+    summary["databases"] = 1
+    summary["habits"] = len(habits)
+    for habit in habits:
+        habit_metrics = metrics.get(habit.id, {})
+        summary["completions"] += habit_metrics.get("total_completions", 0)
+        summary["rate_histogram"][
+            _rate_bin(habit_metrics.get("completion_rate", 0.0))
+        ] += 1
+        summary["longest_streaks"][habit_metrics.get("longest_streak", 0)] += 1
+        summary["current_streaks"][habit.streak or 0] += 1
+        summary["categories"][categories.get(habit.category_id, "Uncategorized")] += 1
+        summary["frequencies"][habit.frequency] += 1
+    return summary
+
+
+def merge_summaries(total: dict, part: dict) -> dict:
+    """Adds the partial summary `part` into `total` in place and returns `total`."""
+    for key in ("databases", "habits", "completions"):
+        total[key] += part[key]
+    total["rate_histogram"] = [
+        a + b for a, b in zip(total["rate_histogram"], part["rate_histogram"])
+    ]
+    for key in ("longest_streaks", "current_streaks", "categories", "frequencies"):
+        total[key].update(part[key])
+    total["errors"].extend(part["errors"])
+    return total
+
+
+def _summaries(
+    paths: List[str],
+    workers: Optional[int],
+    reference_date: Optional[datetime.date],
+    chunksize: int,
+) -> Iterator[dict]:
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            yield summarize_database(path, reference_date)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            summarize_database,
+            paths,
+            [reference_date] * len(paths),
+            chunksize=chunksize,
+        )
+
+
+def aggregate_databases(
+    target: Union[str, Iterable[str]],
+    workers: Optional[int] = None,
+    reference_date: Optional[datetime.date] = None,
+    progress: Optional[ProgressCallback] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> dict:
+    """
+    Cohort analytics across many databases: summarizes every database in a pool of
+    `workers` processes (default: one per CPU; 1 runs inline) and merges the results.
+    progress(done, total) is called after each database.
+    Returns: {'databases': int, 'habits': int, 'completions': int,
+              'rate_histogram': [int] * RATE_BINS,
+              'longest_streaks': Counter, 'current_streaks': Counter,
+              'categories': Counter, 'frequencies': Counter, 'errors': [str]}
+
+    Example:
+        aggregate_databases("/srv/momentum/users", workers=8)["rate_histogram"]
+    """
+    paths = find_databases(target if isinstance(target, str) else list(target))
+    total = empty_summary()
+    for done, part in enumerate(
+        _summaries(paths, workers, reference_date, chunksize), start=1
+    ):
+        merge_summaries(total, part)
+        if progress:
+            progress(done, len(paths))
+    return total
+
+
+def format_summary(summary: dict) -> str:
+    """Renders an aggregate summary as plain text."""
+    lines = [
+        f"Databases: {summary['databases']}",
+        f"Active habits: {summary['habits']}",
+        f"Completions: {summary['completions']}",
+        "",
+        "Completion rate histogram:",
+    ]
+    for i, count in enumerate(summary["rate_histogram"]):
+        lines.append(
+            f"  {i * 100 // RATE_BINS:3d}-{(i + 1) * 100 // RATE_BINS}%: {count}"
+        )
+    lines.append("")
+    lines.append("Longest streaks (length: habits):")
+    lines.extend(f"  {k}: {v}" for k, v in sorted(summary["longest_streaks"].items()))
+    lines.append("")
+    lines.append("Habits by category:")
+    lines.extend(f"  {k}: {v}" for k, v in summary["categories"].most_common())
+    lines.append("")
+    lines.append("Habits by frequency:")
+    lines.extend(f"  {k}: {v}" for k, v in summary["frequencies"].most_common())
+    if summary["errors"]:
+        lines.append("")
+        lines.append(f"Unreadable databases: {len(summary['errors'])}")
+        lines.extend(f"  {e}" for e in summary["errors"])
+    return "\n".join(lines)
+
+
+def _print_progress(done: int, total: int) -> None:
+    if done == total or done % 100 == 0:
+        print(f"\r{done}/{total} databases", end="", file=sys.stderr, flush=True)
+        if done == total:
+            print(file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Aggregate habit analytics across many Momentum Hub databases"
+    )
+    parser.add_argument(
+        "target", nargs="+", help="Database directories, files or glob patterns"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress")
+    args = parser.parse_args(argv)
+
+    summary = aggregate_databases(
+        args.target,
+        workers=args.workers,
+        progress=None if args.quiet else _print_progress,
+    )
+    if args.json:
+        print(json.dumps(summary, indent=2, sort_keys=True))
+    else:
+        print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+import argparse
+import csv
+import datetime
+import json
+import os
+import sqlite3
+import sys
+from typing import Any, List, Optional
+
+from . import momentum_db as db
+
+# Design rationale: scripting subcommands (`momentum complete 3 --json`) are
+# dispatched by momentum_main before the interactive menu is imported, so a cron
+# job or shell script pays for the interpreter and its database work only, not
+# for questionary, prompt_toolkit and the banner. Output is plain text for
+# people or JSON (--json) for tools; failures go to stderr with exit status 1.
+
+COMMANDS = ("complete", "habits", "due", "stats", "export", "batch", "serve", "watch")
+EXPORT_HABIT_FIELDS = (
+    "id",
+    "name",
+    "frequency",
+    "streak",
+    "created_at",
+    "last_completed",
+    "is_active",
+    "category_id",
+)
+
+
+def to_json(value: Any) -> Any:
+    """json.dumps default hook for dates and model objects."""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def find_command(argv: List[str]) -> Optional[str]:
+    """
+    Returns the subcommand named in argv, skipping the global --db option, or None
+    when argv starts the interactive app (e.g. `--demo`).
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == "--db":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg if arg in COMMANDS else None
+    return None
+
+
+def _print_json(value: Any) -> None:
+    print(json.dumps(value, indent=2, default=to_json))
+
+
+def _cmd_complete(args) -> None:
+    when = datetime.datetime.fromisoformat(args.at) if args.at else None
+    habit = db.complete_habit(args.habit_id, when, args.db_name)
+    if args.json:
+        _print_json(habit)
+    else:
+        print(f"Completed '{habit.name}' (streak {habit.streak})")
+
+
+def _cmd_habits_list(args) -> None:
+    if args.category is not None:
+        habits = db.get_habits_by_category(args.category, db_name=args.db_name)
+    else:
+        habits = db.get_all_habits(active_only=not args.all, db_name=args.db_name)
+    if args.json:
+        _print_json(habits)
+        return
+    for habit in habits:
+        status = "" if habit.is_active else "\tinactive"
+        print(
+            f"{habit.id}\t{habit.name}\t{habit.frequency}\tstreak {habit.streak}{status}"
+        )
+
+
+def _cmd_due(args) -> None:
+    from .habit_analysis import get_due_list
+
+    agenda = get_due_list(args.db_name)
+    if args.json:
+        _print_json(agenda)
+        return
+    for item in agenda:
+        habit = item["habit"]
+        print(
+            f"{habit.id}\t{habit.name}\t{item['done']}/{item['quota']}"
+            f"\tdue by {item['due_by'].isoformat()}"
+        )
+
+
+def _cmd_stats(args) -> None:
+    from .habit_analysis import get_metrics_for_habits
+
+    habits = db.get_all_habits(active_only=True, db_name=args.db_name)
+    metrics = get_metrics_for_habits(habits, args.db_name)
+    rows = [
+        {
+            "id": habit.id,
+            "name": habit.name,
+            "frequency": habit.frequency,
+            "current_streak": habit.streak,
+            "longest_streak": metrics[habit.id]["longest_streak"],
+            "completion_rate": metrics[habit.id]["completion_rate"],
+            "total_completions": metrics[habit.id]["total_completions"],
+        }
+        for habit in habits
+    ]
+    # Ties go to the lowest habit id, matching the leaderboard
+    best = max(rows, key=lambda r: (r["longest_streak"], -r["id"]), default=None)
+    stats = {
+        "active_habits": len(rows),
+        "total_completions": sum(r["total_completions"] for r in rows),
+        "longest_streak": (
+            {"habit": best["name"], "streak": best["longest_streak"]} if best else None
+        ),
+        "habits": rows,
+    }
+    if args.json:
+        _print_json(stats)
+        return
+    print(f"Active habits: {stats['active_habits']}")
+    print(f"Total completions: {stats['total_completions']}")
+    if best:
+        print(f"Longest streak: {best['name']} ({best['longest_streak']})")
+    for r in rows:
+        print(
+            f"{r['id']}\t{r['name']}\tstreak {r['current_streak']}"
+            f"\tlongest {r['longest_streak']}\trate {r['completion_rate']:.0%}"
+        )
+
+
+def _cmd_export(args) -> None:
+    if args.what == "habits":
+        habits = db.get_all_habits(active_only=not args.all, db_name=args.db_name)
+        columns = list(EXPORT_HABIT_FIELDS)
+        rows = [[h.to_dict()[c] for c in columns] for h in habits]
+    else:
+        columns, rows = db.get_completion_export_rows(args.db_name)
+    if args.output == "-":
+        out = sys.stdout
+    else:
+        out = open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        writer = csv.writer(out)
+        writer.writerow(columns)
+        writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.output != "-":
+        print(f"Exported {len(rows)} rows to {args.output}", file=sys.stderr)
+
+
+def _cmd_batch(args) -> int:
+    from . import batch
+
+    fmt = args.format or ("csv" if args.file.lower().endswith(".csv") else "jsonl")
+    read = batch.read_csv if fmt == "csv" else batch.read_jsonl
+    runner = batch.BatchRunner(
+        args.db_name, args.transaction_size or batch.DEFAULT_TRANSACTION_SIZE
+    )
+
+    def report(result: dict) -> None:
+        if args.json:
+            print(json.dumps(result), flush=True)
+            return
+        details = result.get("error") or " ".join(
+            f"{k}={v}" for k, v in result.items() if k not in ("line", "op", "ok")
+        )
+        status = "ok" if result["ok"] else "error"
+        op = result["op"] or "-"
+        print(f"{result['line']}\t{status}\t{op}\t{details}", flush=True)
+
+    if args.file == "-":
+        summary = runner.run(read(sys.stdin), report)
+    else:
+        with open(args.file, newline="", encoding="utf-8") as f:
+            summary = runner.run(read(f), report)
+    print(
+        f"Applied {summary['applied']} commands, {summary['failed']} failed; "
+        f"rebuilt streaks of {summary['streaks_rebuilt']} habits",
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
+
+
+def _cmd_serve(args) -> None:
+    from .http_api import run_http_server
+
+    run_http_server(args.db_name, args.host, args.port, args.workers)
+
+
+def _cmd_watch(args) -> None:
+    from .watch import run_watch
+
+    run_watch(args.db_name, args.interval)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parser for `momentum [--db PATH] <command> ...`."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--db", dest="db_name", default=argparse.SUPPRESS)
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--json", action="store_true", help="Print JSON")
+
+    parser = argparse.ArgumentParser(
+        prog="momentum",
+        description="Momentum Hub scripting commands (run without a command for "
+        "the interactive menu)",
+    )
+    parser.add_argument(
+        "--db",
+        dest="db_name",
+        default=os.getenv("MOMENTUM_DB", "momentum.db"),
+        help="Path to the SQLite database file (default: momentum.db or $MOMENTUM_DB)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    complete = commands.add_parser(
+        "complete", parents=[common, output], help="Complete a habit"
+    )
+    complete.add_argument("habit_id", type=int)
+    complete.add_argument(
+        "--at", help="Completion time as ISO 8601, e.g. 2026-01-05T08:00"
+    )
+    complete.set_defaults(handler=_cmd_complete)
+
+    habits = commands.add_parser("habits", help="Habit queries")
+    habit_commands = habits.add_subparsers(dest="habits_command", required=True)
+    listing = habit_commands.add_parser(
+        "list", parents=[common, output], help="List habits"
+    )
+    listing.add_argument("--all", action="store_true", help="Include inactive habits")
+    listing.add_argument("--category", type=int, help="Only habits of this category")
+    listing.set_defaults(handler=_cmd_habits_list)
+
+    due = commands.add_parser(
+        "due", parents=[common, output], help="Habits still due this period"
+    )
+    due.set_defaults(handler=_cmd_due)
+
+    stats = commands.add_parser(
+        "stats", parents=[common, output], help="Streaks and completion rates"
+    )
+    stats.set_defaults(handler=_cmd_stats)
+
+    export = commands.add_parser("export", parents=[common], help="Export CSV")
+    export.add_argument("what", choices=("habits", "completions"))
+    export.add_argument(
+        "--output", "-o", default="-", help="CSV file path (default: stdout)"
+    )
+    export.add_argument("--all", action="store_true", help="Include inactive habits")
+    export.set_defaults(handler=_cmd_export)
+
+    batch = commands.add_parser(
+        "batch",
+        parents=[common, output],
+        help="Apply completions and edits from a JSONL or CSV file",
+    )
+    batch.add_argument(
+        "file", nargs="?", default="-", help="Command file (default: stdin)"
+    )
+    batch.add_argument(
+        "--format",
+        choices=("jsonl", "csv"),
+        help="Input format (default: csv for *.csv files, else jsonl)",
+    )
+    batch.add_argument(
+        "--transaction-size",
+        type=int,
+        default=None,
+        help="Commands per transaction (default: 100)",
+    )
+    batch.set_defaults(handler=_cmd_batch)
+
+    serve = commands.add_parser(
+        "serve",
+        parents=[common],
+        help="Serve habits, completions, analytics and goals as JSON over HTTP",
+    )
+    serve.add_argument(
+        "--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)"
+    )
+    serve.add_argument(
+        "--port", type=int, default=8737, help="Port to listen on (default: 8737)"
+    )
+    serve.add_argument(
+        "--workers", type=int, default=4, help="Database threads (default: 4)"
+    )
+    serve.set_defaults(handler=_cmd_serve)
+
+    watch = commands.add_parser(
+        "watch",
+        parents=[common],
+        help="Live dashboard that redraws habits as their completions change",
+    )
+    watch.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for changes (default: 1.0)",
+    )
+    watch.set_defaults(handler=_cmd_watch)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs one scripting command; returns the process exit status."""
+    args = build_parser().parse_args(argv)
+    if not os.path.exists(args.db_name):
+        print(f"Error: database '{args.db_name}' does not exist.", file=sys.stderr)
+        return 1
+    db.init_db(args.db_name)
+    try:
+        return args.handler(args) or 0
+    except (ValueError, LookupError, OSError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import asyncio
+import datetime
+import json
+import os
+import signal
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import habit_analysis as analysis
+from . import momentum_db as db
+from .client import default_socket_path
+from .commands import to_json
+
+# Design rationale: one long-lived process serves newline-delimited JSON requests
+# over a UNIX socket. The asyncio loop only moves bytes; SQLite work runs in a
+# thread pool so slow queries never block other clients. Read results are kept
+# in memory and validated with SQLite's PRAGMA data_version, which changes
+# whenever any other connection (this daemon's workers, the interactive CLI,
+# cron jobs) commits to the database, so warm answers are never stale.
+
+DEFAULT_WORKERS = 4
+
+
+def _op_habit(db_name: str, habit_id: int):
+    habit = db.get_habit(habit_id, db_name)
+    if habit is None:
+        raise ValueError(f"No habit with ID {habit_id}.")
+    return habit
+
+
+def _op_complete(db_name: str, habit_id: int, at: Optional[str] = None):
+    when = datetime.datetime.fromisoformat(at) if at else None
+    return db.complete_habit(habit_id, when, db_name)
+
+
+def _op_metrics(db_name: str, reference_date: Optional[str] = None):
+    habits = db.get_all_habits(active_only=True, db_name=db_name)
+    day = datetime.date.fromisoformat(reference_date) if reference_date else None
+    return analysis.get_metrics_for_habits(habits, db_name, day)
+
+
+# name -> (function(db_name, **args), whether it writes)
+OPERATIONS: Dict[str, Tuple[Callable[..., Any], bool]] = {
+    "ping": (lambda db_name: "pong", False),
+    "habits": (
+        lambda db_name, active_only=True: db.get_all_habits(active_only, db_name),
+        False,
+    ),
+    "habit": (_op_habit, False),
+    "completions": (
+        lambda db_name, habit_id: db.get_completions(habit_id, db_name),
+        False,
+    ),
+    "complete": (_op_complete, True),
+    "due": (lambda db_name: analysis.get_due_list(db_name), False),
+    "metrics": (_op_metrics, False),
+    "leaderboard": (
+        lambda db_name, metric="current_streak", n=5, category_id=None: (
+            analysis.get_habit_leaderboard(db_name, metric, n, category_id)
+        ),
+        False,
+    ),
+    "goals": (lambda db_name: analysis.calculate_all_goal_progress(db_name), False),
+    "categories": (
+        lambda db_name: db.get_all_categories(active_only=True, db_name=db_name),
+        False,
+    ),
+}
+
+
+class MomentumDaemon:
+    """
+    Serves OPERATIONS for one database over a UNIX domain socket.
+
+    Request:  {"id": 1, "op": "complete", "args": {"habit_id": 3}}
+    Response: {"id": 1, "ok": true, "result": {...}}
+              {"id": 1, "ok": false, "error": "This habit has already been completed."}
+    """
+
+    def __init__(
+        self,
+        db_name: str = db.DB_NAME,
+        socket_path: Optional[str] = None,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        self.db_name = db_name
+        self.socket_path = socket_path or default_socket_path()
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="momentum-db")
+        self._cache: Dict[tuple, Tuple[int, str]] = {}
+        self._stamp_lock = threading.Lock()
+        self._stamp_conn = sqlite3.connect(
+            db_name, uri=db_name.startswith("file:"), check_same_thread=False
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._writers: set = set()
+
+    def _data_version(self) -> int:
+        with self._stamp_lock:
+            return self._stamp_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def execute(self, request: dict) -> dict:
+        """Runs one request synchronously and returns the response object."""
+        response: Dict[str, Any] = {"id": request.get("id")}
+        op = request.get("op")
+        args = request.get("args") or {}
+        if op not in OPERATIONS:
+            response.update(ok=False, error=f"Unknown operation: {op}")
+            return response
+        function, writes = OPERATIONS[op]
+        key = (op, json.dumps(args, sort_keys=True), datetime.date.today())
+        try:
+            if writes:
+                result = json.dumps(function(self.db_name, **args), default=to_json)
+                self._cache.clear()
+            else:
+                version = self._data_version()
+                cached = self._cache.get(key)
+                if cached and cached[0] == version:
+                    result = cached[1]
+                else:
+                    result = json.dumps(function(self.db_name, **args), default=to_json)
+                    self._cache[key] = (version, result)
+        except (ValueError, TypeError, LookupError, sqlite3.Error) as e:
+            response.update(ok=False, error=str(e))
+            return response
+        response.update(ok=True, result=json.loads(result))
+        return response
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Parses one request line and returns the encoded response line."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            response = {"id": None, "ok": False, "error": f"Invalid request: {e}"}
+        else:
+            response = self.execute(request)
+        return json.dumps(response, default=to_json).encode() + b"\n"
+
+    async def _serve_client(self, reader, writer) -> None:
+        loop = asyncio.get_running_loop()
+        self._writers.add(writer)
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                response = await loop.run_in_executor(
+                    self.executor, self.handle_line, line
+                )
+                writer.write(response)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def serve(self, ready: Optional[threading.Event] = None) -> None:
+        """Listens on the socket until stop() is called."""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # left over from a crashed daemon
+        server = await asyncio.start_unix_server(
+            self._serve_client, path=self.socket_path
+        )
+        os.chmod(self.socket_path, 0o600)
+        if ready:
+            ready.set()
+        try:
+            async with server:
+                await self._stop.wait()
+                # Closing the server waits for open connections to end
+                for writer in list(self._writers):
+                    writer.close()
+        finally:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self.executor.shutdown(wait=False)
+            self._stamp_conn.close()
+
+    def stop(self) -> None:
+        """Stops serve(); safe to call from any thread."""
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+
+def run_daemon(
+    db_name: str, socket_path: Optional[str] = None, workers: int = DEFAULT_WORKERS
+) -> None:
+    """Runs a daemon in the foreground until SIGINT or SIGTERM."""
+    daemon = MomentumDaemon(db_name, socket_path, workers)
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, daemon.stop)
+        await daemon.serve()
+
+    print(f"Momentum daemon serving {db_name} on {daemon.socket_path}")
+    asyncio.run(main())
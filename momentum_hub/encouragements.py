@@ -12,8 +12,27 @@ def get_completion_encouragement():
     return random.choice(messages)
 
 
-def get_streak_encouragement(streak, is_weekly=False):
-    if is_weekly:
+def get_streak_encouragement(streak, is_weekly=False, is_monthly=False):
+    if is_monthly:
+        if streak >= 12:
+            messages = [
+                f"A whole year - {streak} months in a row!",
+                f"{streak} months without a miss - truly part of your life now!",
+                "Twelve months of commitment! What a year!",
+            ]
+        elif streak >= 6:
+            messages = [
+                f"Half a year - {streak} months of steady progress!",
+                f"{streak} months strong - this habit is here to stay!",
+                "Six months of consistency! Keep it rolling!",
+            ]
+        else:
+            messages = [
+                f"{streak} months and counting - you're on your way!",
+                f"Month {streak} complete - keep the momentum going!",
+                f"{streak} months of progress - every month counts!",
+            ]
+    elif is_weekly:
         if streak >= 52:
             messages = [
                 f"A whole year - {streak} weeks of incredible dedication!",
@@ -1,62 +1,67 @@
+import functools
 import os
 import sqlite3
+from typing import Dict, Optional
 
 from colorama import Fore
 
+from . import momentum_db as db
 from .momentum_utils import show_colored_message
 
+# Design rationale: the built-in messages are compiled in, so creating an
+# ErrorManager (including the global one below) never touches the database. The
+# selected database's optional `errors` table is read on the first message shown,
+# once per process and database path, and never created or written; its rows
+# override the built-in messages so they stay consistent with that database.
+
+DEFAULT_ERROR_MESSAGES: Dict[str, str] = {
+    "empty_input": "Even a snail leaves a trail! Please don't leave this field blank.",
+    "invalid_number": "That's not a number in my book! Please enter a digit.",
+    "invalid_habit_id": "Habit Not Found! Please check your ID and try again.",
+    "invalid_menu_option": "My crystal ball says that's not a valid choice. Try another number from the options.",
+}
+FALLBACK_ERROR_MESSAGE = "An unexpected error occurred. Please try again."
+
+
+@functools.lru_cache(maxsize=None)
+def load_custom_errors(db_path: str) -> Dict[str, str]:
+    """
+    Messages stored in db_path's `errors` table, read once per process. Returns {}
+    when the database or the table does not exist.
+    """
+    if not os.path.exists(db_path):
+        return {}
+    try:
+        with db.get_connection(db.readonly_uri(db_path)) as conn:
+            return dict(conn.execute("SELECT key, message FROM errors").fetchall())
+    except sqlite3.Error:
+        return {}
+
 
 class ErrorManager:
     """
     Manages error messages for the "Momentum Hub" application.
     """
 
-    def __init__(self, db_path=None):
-        if db_path is None:
-            db_path = os.getenv("MOMENTUM_DB", "momentum.db")
-        self.db_path = db_path
-        self.error_messages = self._load_errors()
-
-    def _load_errors(self):
-        """Load error messages from database using context manager."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Create table if not exists
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS errors (
-                    key TEXT PRIMARY KEY,
-                    message TEXT NOT NULL
-                )
-            """
-            )
-            # Insert default messages if table is empty
-            cursor.execute("SELECT COUNT(*) FROM errors")
-            if cursor.fetchone()[0] == 0:
-                default_errors = [
-                    (
-                        "empty_input",
-                        "Even a snail leaves a trail! Please don't leave this field blank.",
-                    ),
-                    (
-                        "invalid_number",
-                        "That's not a number in my book! Please enter a digit.",
-                    ),
-                    (
-                        "invalid_habit_id",
-                        "Habit Not Found! Please check your ID and try again.",
-                    ),
-                    (
-                        "invalid_menu_option",
-                        "My crystal ball says that's not a valid choice. Try another number from the options.",
-                    ),
-                ]
-                cursor.executemany(
-                    "INSERT INTO errors (key, message) VALUES (?, ?)", default_errors
-                )
-            # Load errors into dict
-            cursor.execute("SELECT key, message FROM errors")
-            return dict(cursor.fetchall())
+    def __init__(self, db_path: Optional[str] = None):
+        self._db_path = db_path
+        self.error_messages = dict(DEFAULT_ERROR_MESSAGES)
+
+    @property
+    def db_path(self) -> str:
+        """The database consulted for custom messages ($MOMENTUM_DB by default)."""
+        return self._db_path or os.getenv("MOMENTUM_DB", "momentum.db")
+
+    def use_database(self, db_path: str) -> None:
+        """Points custom message lookups at the database the app is running on."""
+        self._db_path = db_path
+
+    def get_message(self, error_key: str) -> str:
+        """The message for a key: the database, then built-in, then a fallback."""
+        custom = load_custom_errors(self.db_path)
+        if error_key in custom:
+            return custom[error_key]
+        return self.error_messages.get(error_key, FALLBACK_ERROR_MESSAGE)
 
     def display_error(self, error_key: str, **kwargs):
         """
@@ -66,10 +71,7 @@ class ErrorManager:
         **kwargs: Additional keyword arguments to format the error message.
         """
 
-        message = self.error_messages.get(
-            error_key, "An unexpected error occurred. Please try again."
-        )
-        formatted_message = message.format(
+        formatted_message = self.get_message(error_key).format(
             **kwargs
         )  # For error messages like "Habit {habit_id} not found."
         show_colored_message(formatted_message, color=Fore.RED)
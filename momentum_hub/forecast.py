@@ -0,0 +1,79 @@
+import math
+import random
+from typing import List, Optional, Sequence
+
+try:  # Optional: vectorised simulation when NumPy is installed
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# Design rationale: each remaining period ("slot") before a goal's deadline is
+# modelled as an independent chance to complete the habit, with the habit's
+# recent per-slot completion rate as probability. The chance of reaching the
+# target is then a binomial tail, which has an exact closed form; the Monte Carlo
+# path simulates the same model and is kept for callers that want sampled
+# estimates (it is vectorised across all goals when NumPy is available).
+
+DEFAULT_TRIALS = 10_000
+
+
+def binomial_tail(n: int, p: float, k: int) -> float:
+    """
+    Probability of at least k successes in n independent trials with chance p.
+
+    Example:
+        binomial_tail(10, 0.5, 5) -> 0.623
+    """
+    if k <= 0:
+        return 1.0
+    if k > n or p <= 0.0:
+        return 0.0
+    if p >= 1.0:
+        return 1.0
+    # Sum the pmf from k to n, stepping pmf(i+1) = pmf(i) * (n-i)/(i+1) * p/(1-p)
+    log_pmf = (
+        math.lgamma(n + 1)
+        - math.lgamma(k + 1)
+        - math.lgamma(n - k + 1)
+        + k * math.log(p)
+        + (n - k) * math.log1p(-p)
+    )
+    pmf = math.exp(log_pmf)
+    ratio = p / (1.0 - p)
+    total = 0.0
+    for i in range(k, n + 1):
+        total += pmf
+        pmf *= (n - i) / (i + 1) * ratio
+    return min(1.0, total)
+
+
+def simulate_tails(
+    slots: Sequence[int],
+    probabilities: Sequence[float],
+    needed: Sequence[int],
+    trials: int = DEFAULT_TRIALS,
+    seed: Optional[int] = None,
+) -> List[float]:
+    """
+    Monte Carlo estimate of binomial_tail() for many goals at once: simulates
+    `trials` trajectories per goal and returns the share reaching the target.
+    Uses one vectorised NumPy draw for all goals, or the standard library otherwise.
+    """
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        n = np.asarray(slots, dtype=np.int64)
+        p = np.clip(np.asarray(probabilities, dtype=float), 0.0, 1.0)
+        k = np.asarray(needed, dtype=np.int64)
+        draws = rng.binomial(n, p, size=(trials, len(n)))
+        return (draws >= k).mean(axis=0).tolist()
+
+    rng = random.Random(seed)
+    results = []
+    for n, p, k in zip(slots, probabilities, needed):
+        hits = sum(
+            1
+            for _ in range(trials)
+            if sum(1 for _ in range(n) if rng.random() < p) >= k
+        )
+        results.append(hits / trials)
+    return results
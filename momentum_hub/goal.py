@@ -2,6 +2,7 @@ import datetime
 from typing import Any, Dict, Optional
 
 from . import momentum_db as db
+from . import periods
 from .habit import Habit
 
 
@@ -82,15 +83,19 @@ class Goal:
         if not habit:
             return {"count": 0, "total": 0, "percent": 0.0, "achieved": False}
 
-        completions = db.get_completions(self.habit_id, db_name)
-        # Filter completions within the goal period
-        if self.start_date:
-            completions = [c for c in completions if c >= self.start_date]
-        if self.end_date:
-            completions = [c for c in completions if c <= self.end_date]
+        # Count only completions within the goal period (indexed range query)
+        count = db.count_completions_in_range(
+            self.habit_id, self.start_date, self.end_date, db_name
+        )
+        return self.progress_from_count(count, habit)
 
+    def progress_from_count(self, count: int, habit: Habit) -> Dict[str, Any]:
+        """
+        Build the progress summary from an already known completion count
+        (e.g. from db.get_goals_with_completion_counts).
+        Returns: {'count': int, 'total': int, 'percent': float, 'achieved': bool}
+        """
         total = self.target_completions or self._calculate_expected_completions(habit)
-        count = len(completions)
         percent = (count / total * 100) if total > 0 else 0.0
         achieved = count >= total
 
@@ -103,11 +108,8 @@ class Goal:
 
     def _calculate_expected_completions(self, habit: Habit) -> int:
         """Calculate expected completions based on habit frequency and period."""
-        if habit.frequency == "weekly":
-            # For weekly habits, target is number of weeks in period
-            return max(1, self.target_period_days // 7)
-        else:  # daily
-            return self.target_period_days
+        # weeks * N for weekly and N/week habits, months for monthly, days for daily
+        return periods.expected_per_window(habit.frequency, self.target_period_days)
 
     def is_expired(self) -> bool:
         """Check if the goal has expired."""
@@ -1,6 +1,8 @@
 import datetime
 from typing import Any, Dict, List, Optional
 
+from . import periods
+
 
 class Habit:
     """
@@ -8,7 +10,7 @@ class Habit:
     Attributes:
         - id: Unique identifier for the habit
         - name: The name of the habit
-        - frequency: The frequency at which the habit is to be performed (daily, weekly, monthly)
+        - frequency: The frequency at which the habit is to be performed (daily, weekly, monthly or "N/week")
         - notes: Additional notes about the habit
         - reminder_time: Morning reminder time
         - evening_reminder_time: Evening reminder time
@@ -85,30 +87,23 @@ class Habit:
         Updates streak and last completed date and time of habit
         """
         now = dt or datetime.datetime.now()
-        if self.last_completed is not None:
-            delta_days = (now.date() - self.last_completed.date()).days
-            if self.frequency == "daily":
-                if delta_days == 1:
-                    self.streak += 1
-                else:
-                    self.streak = 1  # reset if a day is missed or same-day repeat
-            elif self.frequency == "weekly":
-                # Compare week starts (Sunday) to enforce weekly periodicity
-                current_week_start = now.date() - datetime.timedelta(
-                    days=(now.date().weekday() + 1) % 7
-                )
-                last_week_start = self.last_completed.date() - datetime.timedelta(
-                    days=(self.last_completed.date().weekday() + 1) % 7
-                )
-                if current_week_start == last_week_start:
-                    # Same week -> streak does not increment
-                    pass
-                elif (current_week_start - last_week_start).days == 7:
-                    self.streak += 1
-                else:
-                    self.streak = 1  # reset if a full week is missed
+        parsed = periods.parse_frequency(self.frequency)
+        if self.last_completed is not None and parsed:
+            unit, quota = parsed
+            gap = periods.unit_key(now, unit) - periods.unit_key(
+                self.last_completed, unit
+            )
+            if quota > 1:
+                # N-per-week streaks depend on the week's count; update_streak
+                # recomputes them from the stored completions.
+                pass
+            elif gap == 0 and unit != "day":
+                # Same week/month -> streak does not increment
+                pass
+            elif gap == 1:
+                self.streak += 1
             else:
-                self.streak = 1
+                self.streak = 1  # reset if a period is missed or same-day repeat
         else:
             self.streak = 1  # first completion
         self.last_completed = now
@@ -120,57 +115,12 @@ class Habit:
         Args:
             completions: List of datetime objects representing habit completions.
         Returns:
-            int: The longest streak of consecutive completions.
+            int: The longest streak of consecutive completed periods
+            (0 for unsupported frequencies).
         """
-        if not completions:
-            return 0
-
-        if self.frequency == "daily":
-            unique_dates = sorted(list(set(c.date() for c in completions)))
-            if not unique_dates:
-                return 0
-
-            longest_streak = 1
-            current_streak = 1
-            last_completed_date = unique_dates[0]
-
-            for current_date in unique_dates[1:]:
-                if (current_date - last_completed_date).days == 1:
-                    current_streak += 1
-                else:
-                    current_streak = 1
-                longest_streak = max(longest_streak, current_streak)
-                last_completed_date = current_date
-
-            return longest_streak
-        elif self.frequency == "weekly":
-            # Use Sunday-start weeks to align with completion rules
-            week_starts = sorted(
-                {
-                    (c.date() - datetime.timedelta(days=(c.date().weekday() + 1) % 7))
-                    for c in completions
-                }
-            )
-            if not week_starts:
-                return 0
-
-            longest_streak = 1
-            current_streak = 1
-            last_week = week_starts[0]
-
-            for current_week in week_starts[1:]:
-                # Check if consecutive weeks by week-start date
-                if (current_week - last_week).days == 7:
-                    current_streak += 1
-                else:
-                    current_streak = 1
-                longest_streak = max(longest_streak, current_streak)
-                last_week = current_week
-
-            return longest_streak
-        else:
-            # For other frequencies, treat as daily for now
-            return 0
+        return periods.longest_run(
+            periods.completed_period_keys(completions, self.frequency)
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -192,6 +142,7 @@ class Habit:
             "reactivated_at": (
                 self.reactivated_at.isoformat() if self.reactivated_at else None
             ),
+            "category_id": self.category_id,
         }
 
     @classmethod
@@ -1,8 +1,14 @@
 import datetime
-from typing import List, Optional, Set, Tuple, Union
+import heapq
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
+from . import analytics_cache, forecast
 from . import momentum_db as db
+from . import periods, trends
+from .co_completion import CompletionMatrix
 from .habit import Habit
+from .heatmap import DayIndex
+from .streak_timeline import StreakTimeline
 
 # Design rationale: analytics functions are pure where possible to keep
 # calculations deterministic and easy to unit-test.
@@ -22,24 +28,90 @@ def calculate_completion_rate_for_habit(
     Returns:
         float: The completion rate as a decimal (0.0 to 1.0)
     """
-    habit = db.get_habit(habit_id, db_name)
-    completions = db.get_completions(habit_id, db_name)
+    metrics = get_habit_metrics(habit_id, db_name, reference_date)
+    return metrics.get("completion_rate", 0.0)
 
-    if not completions or not habit:
-        return 0.0
 
-    # Convert completions to a set of dates
-    completion_dates = {c.date() for c in completions}
+def _compute_habit_metrics(
+    habit: Habit, completions: List[datetime.datetime], today: datetime.date
+) -> dict:
+    """Pure helper: builds the cached metrics payload from a completion history."""
+    dates = [c.date() for c in completions]
+    return {
+        "longest_streak": calculate_longest_streak_from_dates(dates, habit.frequency),
+        "completion_rate": calculate_completion_rate_from_dates(
+            set(dates), habit.frequency, today
+        ),
+        "total_completions": len(completions),
+        "rate_date": today.isoformat(),
+    }
 
-    if reference_date is None:
-        today = datetime.datetime.now().date()
-    else:
-        today = reference_date
 
-    # Delegate to pure function
-    return calculate_completion_rate_from_dates(
-        completion_dates, habit.frequency, today
+def get_habit_metrics(
+    habit_id: int, db_name: str, reference_date: Optional[datetime.date] = None
+) -> dict:
+    """
+    Returns the cached analytics for a habit, recomputing them only when the habit
+    or its completions changed since they were stored (or the reference date moved).
+    Returns: {'longest_streak': int, 'completion_rate': float,
+              'total_completions': int, 'rate_date': str}, or {} if not found.
+
+    Args:
+        habit_id: The habit ID to analyze.
+        db_name: The name of the database.
+        reference_date: Date the completion rate is relative to (default: today).
+
+    Returns:
+        dict: Metrics for the habit.
+    """
+    today = reference_date or datetime.datetime.now().date()
+    version, cached = analytics_cache.load(habit_id, db_name)
+    if cached is not None and cached.get("rate_date") == today.isoformat():
+        return cached
+
+    habit = db.get_habit(habit_id, db_name)
+    if not habit:
+        return {}
+    metrics = _compute_habit_metrics(
+        habit, db.get_completions(habit_id, db_name), today
     )
+    if version is not None:
+        analytics_cache.store(habit_id, version, metrics, db_name)
+    return metrics
+
+
+def get_metrics_for_habits(
+    habits: Iterable[Habit],
+    db_name: str,
+    reference_date: Optional[datetime.date] = None,
+) -> Dict[int, dict]:
+    """
+    Bulk variant of get_habit_metrics(): validates every cached entry with a single
+    query and only recomputes the habits whose entries are missing or stale.
+    Returns: {habit_id: metrics}
+    """
+    habits = list(habits)
+    today = reference_date or datetime.datetime.now().date()
+    entries = analytics_cache.load_many([h.id for h in habits], db_name)
+    results = {}
+    stale = []
+    for habit in habits:
+        version, cached = entries.get(habit.id, (None, None))
+        if cached is not None and cached.get("rate_date") == today.isoformat():
+            results[habit.id] = cached
+        else:
+            stale.append((habit, version))
+
+    # Misses are recomputed from one batched history query
+    histories = db.get_completions_for_habits([h.id for h, _ in stale], db_name)
+    fresh = []
+    for habit, version in stale:
+        metrics = _compute_habit_metrics(habit, histories[habit.id], today)
+        if version is not None:
+            fresh.append((habit.id, version, metrics))
+        results[habit.id] = metrics
+    analytics_cache.store_many(fresh, db_name)
+    return results
 
 
 def get_missed_days_for_habit(
@@ -60,25 +132,35 @@ def get_missed_days_for_habit(
     if not habit or habit.frequency != "daily":
         return []
 
-    completions = db.get_completions(habit_id, db_name)
-    if not completions:
+    first_day, last_day, distinct_days = db.get_completion_day_span(habit_id, db_name)
+    if not distinct_days:
         return []
 
-    # Get all completion dates as a set for O(1) lookup
-    completion_dates = {c.date() for c in completions}
+    # Every day between the first and last completion is either completed or missed
+    return (last_day - first_day).days + 1 - distinct_days
 
-    # Get the date range from first to last completion
-    first_date = min(completion_dates)
-    last_date = max(completion_dates)
 
-    missed_days = []
-    current_date = first_date
-    while current_date <= last_date:
-        if current_date not in completion_dates:
-            missed_days.append(current_date)
-        current_date += datetime.timedelta(days=1)
+def get_missed_day_ranges(
+    habit_id: int, db_name: str
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """
+    Get the missed days of a daily habit as compact ranges.
 
-    return len(missed_days)
+    Args:
+        habit_id: The ID of the habit to check
+        db_name: The name of the database
+
+    Returns:
+        List[Tuple[datetime.date, datetime.date]]: Inclusive (first, last) missed
+        day ranges between the first and last completion. Empty for non-daily habits.
+
+    Example:
+        completions on Jan 1, Jan 2, Jan 5 -> [(date(2026, 1, 3), date(2026, 1, 4))]
+    """
+    habit = db.get_habit(habit_id, db_name)
+    if not habit or habit.frequency != "daily":
+        return []
+    return db.get_completion_gaps(habit_id, db_name)
 
 
 def calculate_longest_streak_for_habit(habit_id: int, db_name: str) -> int:
@@ -92,14 +174,104 @@ def calculate_longest_streak_for_habit(habit_id: int, db_name: str) -> int:
     Returns:
         int: The longest streak achieved for this habit
     """
+    metrics = get_habit_metrics(habit_id, db_name)
+    return metrics.get("longest_streak", 0)
+
+
+# In-process memo of built timelines: {(db_name, habit_id): (version, timeline)}
+_timeline_memo: Dict[Tuple[str, int], Tuple[int, StreakTimeline]] = {}
+
+
+def get_streak_timeline(habit_id: int, db_name: str) -> StreakTimeline:
+    """
+    Returns the streak timeline index for a habit, rebuilding it only when the
+    habit's write version changed since it was last built in this process.
+
+    Args:
+        habit_id: The ID of the habit.
+        db_name: The name of the database.
+
+    Returns:
+        StreakTimeline: Run index answering as-of streak and rate queries.
+    """
+    version, _ = analytics_cache.load(habit_id, db_name)
+    memo = _timeline_memo.get((db_name, habit_id))
+    if version is not None and memo is not None and memo[0] == version:
+        return memo[1]
+
     habit = db.get_habit(habit_id, db_name)
     if not habit:
-        return 0
+        return StreakTimeline([], "")
+    dates = [c.date() for c in db.get_completions(habit_id, db_name)]
+    timeline = StreakTimeline.from_dates(dates, habit.frequency)
+    if version is not None:
+        _timeline_memo[(db_name, habit_id)] = (version, timeline)
+    return timeline
 
-    completions = db.get_completions(habit_id, db_name)
-    # Convert to list of dates
-    dates = [c.date() for c in completions]
-    return calculate_longest_streak_from_dates(dates, habit.frequency)
+
+def get_streak_history(
+    habit_id: int, db_name: str, dates: Iterable[datetime.date]
+) -> List[dict]:
+    """
+    Returns the as-of snapshot (current streak, longest so far, completion rate)
+    for every requested date, e.g. to plot a trend chart.
+
+    Example:
+        get_streak_history(1, "momentum.db", [date(2026, 1, 7), date(2026, 1, 14)])
+        -> [{'date': date(2026, 1, 7), 'current_streak': 3, ...}, ...]
+    """
+    timeline = get_streak_timeline(habit_id, db_name)
+    return [{"date": d, **timeline.snapshot(d)} for d in dates]
+
+
+def iter_habit_trend(
+    habit_id: int,
+    db_name: str,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    windows: Sequence[int] = trends.DEFAULT_WINDOWS,
+    half_life: float = trends.DEFAULT_HALF_LIFE,
+) -> Iterator[dict]:
+    """
+    Streams daily trend rows for a habit (rolling rates and EWMA consistency score)
+    straight from the database cursor, in one pass and constant memory.
+    Yields: {'date': date, 'done': bool, 'rates': {window: float}, 'ewma': float}
+
+    Args:
+        habit_id: The habit ID to analyze.
+        db_name: The name of the database.
+        start: First day of the report (default: first completion).
+        end: Last day of the report (default: today).
+        windows: Rolling window lengths in days.
+        half_life: Days after which a completion's EWMA weight halves.
+
+    Example:
+        for row in iter_habit_trend(1, "momentum.db"):
+            print(row["date"], row["rates"][7], row["ewma"])
+    """
+    yield from trends.trend_report(
+        db.iter_completions(habit_id, db_name=db_name), start, end, windows, half_life
+    )
+
+
+def iter_streak_breaks(
+    habit_id: int, db_name: str, as_of: Optional[datetime.date] = None
+) -> Iterator[dict]:
+    """
+    Streams the streak-break events of a habit in date order.
+    Yields: {'length', 'start', 'end', 'broken_on', 'missed_periods'}
+
+    Args:
+        habit_id: The habit ID to analyze.
+        db_name: The name of the database.
+        as_of: Also report a trailing streak that has lapsed by this date.
+    """
+    habit = db.get_habit(habit_id, db_name)
+    if not habit:
+        return
+    yield from trends.streak_breaks(
+        db.iter_completions(habit_id, db_name=db_name), habit.frequency, as_of
+    )
 
 
 def calculate_longest_streak_from_dates(
@@ -111,40 +283,7 @@ def calculate_longest_streak_from_dates(
         dates = [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 4)]
         calculate_longest_streak_from_dates(dates, "daily") -> 2
     """
-    if not dates:
-        return 0
-    if frequency == "daily":
-        unique_dates = sorted(set(dates))
-        longest = cur = 1
-        last = unique_dates[0]
-        for d in unique_dates[1:]:
-            if (d - last).days == 1:
-                cur += 1
-            else:
-                cur = 1
-            longest = max(longest, cur)
-            last = d
-        return longest
-    elif frequency == "weekly":
-        # Use Sunday-start weeks to align with completion rules
-        week_starts = sorted(
-            {d - datetime.timedelta(days=(d.weekday() + 1) % 7) for d in dates}
-        )
-        if not week_starts:
-            return 0
-        longest = cur = 1
-        last = week_starts[0]
-        for w in week_starts[1:]:
-            # check consecutive weeks by week-start date
-            if (w - last).days == 7:
-                cur += 1
-            else:
-                cur = 1
-            longest = max(longest, cur)
-            last = w
-        return longest
-    else:
-        return 0
+    return periods.longest_run(periods.completed_period_keys(dates, frequency))
 
 
 def calculate_completion_rate_from_dates(
@@ -162,21 +301,16 @@ def calculate_completion_rate_from_dates(
         today = datetime.datetime.now().date()
     else:
         today = reference_date
-    if frequency == "weekly":
-        total_weeks = 4
-        recent_week_starts = set()
-        # consider the week-start (Sunday) for each completion
-        for d in completion_dates:
-            week_start = d
-            while week_start.weekday() != 6:  # Sunday
-                week_start -= datetime.timedelta(days=1)
-            if (today - week_start).days < 7 * total_weeks:
-                recent_week_starts.add(week_start)
-        return len(recent_week_starts) / total_weeks
-    else:
-        total_days = 28
-        count = len([d for d in completion_dates if 0 <= (today - d).days < total_days])
-        return count / total_days
+    window = periods.rate_window(frequency)
+    if not window:
+        return 0.0
+    current = periods.period_key(today, frequency)
+    count = sum(
+        1
+        for key in periods.completed_period_keys(completion_dates, frequency)
+        if current - window < key <= current
+    )
+    return count / window
 
 
 def calculate_overall_longest_streak(db_name: str) -> Tuple[str, int]:
@@ -193,11 +327,12 @@ def calculate_overall_longest_streak(db_name: str) -> Tuple[str, int]:
         calculate_overall_longest_streak("momentum_demo.db") -> ("Code", 28)
     """
     habits = db.get_all_habits(active_only=True, db_name=db_name)
+    metrics = get_metrics_for_habits(habits, db_name)
     longest_streak = 0
     habit_name = ""
 
     for habit in habits:
-        streak = calculate_longest_streak_for_habit(habit.id, db_name)
+        streak = metrics[habit.id]["longest_streak"]
         if streak > longest_streak:
             longest_streak = streak
             habit_name = habit.name
@@ -232,6 +367,231 @@ def calculate_best_worst_habit(db_name: str) -> Tuple[Optional[Habit], Optional[
     return best_habit, worst_habit
 
 
+# Metrics available to the habit leaderboard
+RANKING_METRICS = (
+    "current_streak",
+    "longest_streak",
+    "completion_rate",
+    "goal_percent",
+)
+
+
+def _collect_ranking_values(
+    habits: List[Habit],
+    metric: str,
+    db_name: str,
+    reference_date: Optional[datetime.date] = None,
+) -> List[Tuple[float, int, Habit]]:
+    """One batched pass that yields (value, habit_id, habit) for the chosen metric."""
+    if metric == "current_streak":
+        return [(h.streak, h.id, h) for h in habits]
+    if metric == "goal_percent":
+        # Most recent active goal per habit; habits without a goal are not ranked
+        latest: dict = {}
+        for entry in calculate_all_goal_progress(db_name):
+            goal = entry["goal"]
+            if (
+                goal.habit_id not in latest
+                or goal.created_at > latest[goal.habit_id][0]
+            ):
+                latest[goal.habit_id] = (goal.created_at, entry["progress"]["percent"])
+        return [(latest[h.id][1], h.id, h) for h in habits if h.id in latest]
+    metrics = get_metrics_for_habits(habits, db_name, reference_date)
+    return [(metrics[h.id][metric], h.id, h) for h in habits]
+
+
+def get_habit_leaderboard(
+    db_name: str,
+    metric: str = "current_streak",
+    n: int = 5,
+    category_id: Optional[int] = None,
+    reference_date: Optional[datetime.date] = None,
+) -> dict:
+    """
+    Ranks active habits by a metric and returns the top and bottom n.
+    Uses heap selection (O(h log n)) over a single batched metrics pass rather
+    than sorting the whole habit set.
+    Returns: {'top': [(Habit, value)], 'bottom': [(Habit, value)]}
+
+    Args:
+        db_name: The name of the database.
+        metric: One of RANKING_METRICS.
+        n: How many habits to return at each end.
+        category_id: Only rank habits of this category (optional).
+        reference_date: Date the completion rate is relative to (optional).
+
+    Returns:
+        dict: Top and bottom habits with their metric values.
+
+    Example:
+        get_habit_leaderboard("momentum_demo.db", "longest_streak", n=3)
+    """
+    if metric not in RANKING_METRICS:
+        raise ValueError(f"Unknown ranking metric: {metric}")
+    if category_id is None:
+        habits = db.get_all_habits(active_only=True, db_name=db_name)
+    else:
+        habits = db.get_habits_by_category(category_id, db_name=db_name)
+    values = _collect_ranking_values(habits, metric, db_name, reference_date)
+    # Ties are broken by habit id so rankings are deterministic
+    top = heapq.nsmallest(n, values, key=lambda v: (-v[0], v[1]))
+    bottom = heapq.nsmallest(n, values, key=lambda v: (v[0], v[1]))
+    return {
+        "top": [(habit, value) for value, _, habit in top],
+        "bottom": [(habit, value) for value, _, habit in bottom],
+    }
+
+
+def calculate_co_completion(
+    db_name: str,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    lag: int = 1,
+) -> dict:
+    """
+    Builds the day x habit completion matrix for all active habits from one batched
+    scan and computes pairwise statistics for the pairs that co-occur.
+    Returns: {'habits': [Habit], 'start': date, 'end': date, 'lag': int,
+              'co_occurrence': {(i, j): int}, 'jaccard': {(i, j): float},
+              'correlation': {(i, j): float}, 'lagged_correlation': {(i, j): float}}
+    Pairs index 'habits'. The same-day statistics hold one unordered (i < j) entry
+    per pair completed on a shared day or `lag` days apart; lagged_correlation
+    holds both orders of those pairs, (i, j) relating habit i on a day to habit j
+    `lag` days later. Pairs that never co-occur are left out.
+
+    Args:
+        db_name: The name of the database.
+        start: First day of the span (default: earliest completion).
+        end: Last day of the span (default: today).
+        lag: Day offset for the lagged correlation (default: next day).
+
+    Returns:
+        dict: The habits and their pairwise matrices.
+
+    Example:
+        result = calculate_co_completion("momentum_demo.db")
+        result["jaccard"][(0, 1)] -> 0.8
+    """
+    habits = db.get_all_habits(active_only=True, db_name=db_name)
+    completions = db.get_completions_for_habits([h.id for h in habits], db_name)
+    days_by_habit = {hid: {c.date() for c in cs} for hid, cs in completions.items()}
+    end = end or datetime.date.today()
+    if start is None:
+        firsts = [min(days) for days in days_by_habit.values() if days]
+        start = min(firsts) if firsts else end
+    matrix = CompletionMatrix(
+        [h.id for h in habits], days_by_habit, start, (end - start).days + 1
+    )
+    co = matrix.co_occurrence()
+    pairs = set(co) | {(min(p), max(p)) for p in matrix.candidate_pairs(lag)}
+    return {
+        "habits": habits,
+        "start": start,
+        "end": end,
+        "lag": lag,
+        "co_occurrence": co,
+        "jaccard": matrix.jaccard(co),
+        "correlation": matrix.correlation(pairs),
+        "lagged_correlation": matrix.correlation(
+            pairs | {(j, i) for i, j in pairs}, lag
+        ),
+    }
+
+
+def get_co_completion_pairs(co_completion: dict, n: Optional[int] = None) -> List[dict]:
+    """
+    Flattens a calculate_co_completion() result into habit pairs, strongest first
+    (by Jaccard, then same-day correlation).
+    Returns: [{'first': Habit, 'second': Habit, 'co_days': int, 'jaccard': float,
+               'correlation': float, 'lagged': float, 'lagged_reverse': float}]
+
+    Args:
+        co_completion: Result of calculate_co_completion().
+        n: Maximum number of pairs to return (default: all).
+
+    Returns:
+        List[dict]: One entry per unordered habit pair that co-occurs.
+    """
+    habits = co_completion["habits"]
+    lagged = co_completion["lagged_correlation"]
+    pairs = [
+        {
+            "first": habits[i],
+            "second": habits[j],
+            "co_days": co_completion["co_occurrence"].get((i, j), 0),
+            "jaccard": co_completion["jaccard"].get((i, j), 0.0),
+            "correlation": correlation,
+            "lagged": lagged[(i, j)],
+            "lagged_reverse": lagged[(j, i)],
+        }
+        for (i, j), correlation in co_completion["correlation"].items()
+    ]
+    pairs.sort(
+        key=lambda p: (-p["jaccard"], -p["correlation"], p["first"].id, p["second"].id)
+    )
+    return pairs if n is None else pairs[:n]
+
+
+def get_due_list(db_name: str, now: Optional[datetime.datetime] = None) -> List[dict]:
+    """
+    Today's agenda: active habits that still need completions in their current
+    period, ordered by reminder time, from one indexed query.
+    Returns: [{'habit': Habit, 'done': int, 'quota': int, 'due_by': date}]
+
+    Args:
+        db_name: The name of the database.
+        now: Point in time the periods are relative to (default: now).
+
+    Returns:
+        list: One entry per due habit; 'done' counts completion days in the period.
+
+    Example:
+        get_due_list("momentum_demo.db")[0] ->
+        {'habit': <Habit Gym>, 'done': 1, 'quota': 3, 'due_by': date(2026, 1, 10)}
+    """
+    now = now or datetime.datetime.now()
+    agenda = []
+    for habit, done in db.get_due_habits(now, db_name):
+        quota = periods.parse_frequency(habit.frequency)[1]
+        agenda.append(
+            {
+                "habit": habit,
+                "done": done,
+                "quota": quota,
+                "due_by": periods.period_bounds(now, habit.frequency)[1].date(),
+            }
+        )
+    return agenda
+
+
+def get_day_index(
+    db_name: str,
+    habit_ids: Sequence[int],
+    start: datetime.date,
+    end: Optional[datetime.date] = None,
+) -> DayIndex:
+    """
+    Builds the per-day completion index of the given habits for [start, end] from
+    one grouped query, for calendar and heatmap views.
+
+    Args:
+        db_name: The name of the database.
+        habit_ids: Habits to include.
+        start: First day of the span.
+        end: Last day of the span (default: today).
+
+    Returns:
+        DayIndex: Completion flags per habit and day.
+
+    Example:
+        index = get_day_index("momentum_demo.db", [1, 2], date(2025, 1, 1))
+        index.counts()[0] -> 2
+    """
+    end = end or datetime.date.today()
+    rows = db.get_completion_days_for_habits(list(habit_ids), start, end, db_name)
+    return DayIndex(start, end, rows)
+
+
 def get_completion_history(habit_id: int, db_name: str) -> List[datetime.datetime]:
     """
     Returns a list of completion datetimes for the given habit_id, sorted ascending.
@@ -252,8 +612,8 @@ def calculate_goal_progress(
 ) -> dict:
     """
     Returns a dictionary with progress info for a given habit.
-    For daily: completions in last 28 days and percent.
-    For weekly: completions in last 4 weeks and percent.
+    Counts completed periods in the rolling window ending today:
+    28 days (daily), 4 weeks (weekly and N/week) or 3 months (monthly).
     Returns: {'count': int, 'total': int, 'percent': float}
 
     Args:
@@ -271,26 +631,145 @@ def calculate_goal_progress(
     if reference_date is None:
         reference_date = datetime.datetime.now().date()
     today = reference_date
-    if habit.frequency == "weekly":
-        total = 4
-        # Find the Saturday of each completion week in last 4 weeks
-        recent_saturdays = set()
-        for c in completions:
-            date = c.date()
-            # Find the Saturday of this week
-            while date.weekday() != 5:
-                date += datetime.timedelta(days=1)
-            if (today - date).days <= 7 * total:
-                recent_saturdays.add(date)
-        count = len(recent_saturdays)
-        percent = (count / total * 100) if total else 0.0
-    else:  # daily
-        total = 28
-        count = len([c for c in completions if 0 <= (today - c.date()).days < total])
-        percent = (count / total * 100) if total else 0.0
+    total = periods.rate_window(habit.frequency)
+    current = periods.period_key(today, habit.frequency)
+    count = sum(
+        1
+        for key in periods.completed_period_keys(completions, habit.frequency)
+        if current - total < key <= current
+    )
+    percent = (count / total * 100) if total else 0.0
     return {"count": count, "total": total, "percent": percent}
 
 
+def calculate_all_goal_progress(db_name: str, active_only: bool = True) -> List[dict]:
+    """
+    Progress for every goal, computed from one grouped completion count query.
+    Returns: [{'goal': Goal, 'habit': Habit or None, 'habit_name': str,
+               'progress': {'count', 'total', 'percent', 'achieved'}}]
+
+    Args:
+        db_name: The name of the database.
+        active_only: Only include active goals (default: True).
+
+    Returns:
+        List[dict]: One entry per goal, ordered by goal id.
+    """
+    results = []
+    for goal, habit, count in db.get_goals_with_completion_counts(
+        active_only=active_only, db_name=db_name
+    ):
+        if habit:
+            progress = goal.progress_from_count(count, habit)
+        else:
+            progress = {"count": 0, "total": 0, "percent": 0.0, "achieved": False}
+        results.append(
+            {
+                "goal": goal,
+                "habit": habit,
+                "habit_name": habit.name if habit else "Unknown Habit",
+                "progress": progress,
+            }
+        )
+    return results
+
+
+def _goal_deadline(goal) -> Optional[datetime.date]:
+    """Goal end date, or start + period when the goal has no explicit end."""
+    if goal.end_date:
+        return goal.end_date.date()
+    if goal.start_date:
+        return (
+            goal.start_date + datetime.timedelta(days=goal.target_period_days - 1)
+        ).date()
+    return None
+
+
+def forecast_goal_achievement(
+    db_name: str,
+    goal_progress: Optional[List[dict]] = None,
+    reference_date: Optional[datetime.date] = None,
+    method: str = "auto",
+    trials: int = forecast.DEFAULT_TRIALS,
+    seed: Optional[int] = None,
+) -> Dict[int, Optional[dict]]:
+    """
+    Estimates the probability of each goal reaching its target by its deadline,
+    treating every remaining day (week / month for weekly and monthly habits) as an
+    independent chance at the habit's recent completion rate.
+    Returns: {goal_id: {'probability': float, 'needed': int, 'slots': int,
+                        'rate': float, 'method': str} or None if no deadline}
+
+    Args:
+        db_name: The name of the database.
+        goal_progress: Result of calculate_all_goal_progress() (computed if omitted).
+        reference_date: Date to forecast from (default: today).
+        method: "exact" (closed-form binomial), "simulate" (Monte Carlo) or
+            "auto" (simulate with NumPy if installed, otherwise exact).
+        trials: Simulated trajectories per goal.
+        seed: Random seed for reproducible simulations.
+
+    Returns:
+        Dict[int, Optional[dict]]: Forecast per goal id.
+
+    Example:
+        forecast_goal_achievement("momentum_demo.db")[1]["probability"] -> 0.87
+    """
+    if method not in ("auto", "exact", "simulate"):
+        raise ValueError(f"Unknown forecast method: {method}")
+    if goal_progress is None:
+        goal_progress = calculate_all_goal_progress(db_name)
+    today = reference_date or datetime.datetime.now().date()
+    habits = {e["habit"].id: e["habit"] for e in goal_progress if e["habit"]}
+    histories = db.get_completions_for_habits(list(habits), db_name)
+
+    forecasts: Dict[int, Optional[dict]] = {}
+    pending = []
+    for entry in goal_progress:
+        goal, habit, progress = entry["goal"], entry["habit"], entry["progress"]
+        deadline = _goal_deadline(goal)
+        parsed = periods.parse_frequency(habit.frequency) if habit else None
+        if deadline is None or not parsed:
+            forecasts[goal.id] = None
+            continue
+        # N/week habits can be done on any day, so their chances are per day
+        unit = "day" if parsed[1] > 1 else parsed[0]
+        current = periods.unit_key(today, unit)
+        done = {periods.unit_key(c, unit) for c in histories[habit.id]}
+
+        created = periods.unit_key(habit.created_at or today, unit)
+        window = max(1, min(periods.RATE_WINDOWS[unit], current - created + 1))
+        rate = sum(1 for key in done if current - window < key <= current) / window
+
+        first = current + 1 if current in done else current
+        if goal.start_date:
+            first = max(first, periods.unit_key(goal.start_date, unit))
+        slots = max(0, periods.unit_key(deadline, unit) - first + 1)
+        needed = max(0, progress["total"] - progress["count"])
+        forecasts[goal.id] = {
+            "probability": forecast.binomial_tail(slots, rate, needed),
+            "needed": needed,
+            "slots": slots,
+            "rate": rate,
+            "method": "exact",
+        }
+        if needed and slots:
+            pending.append(goal.id)
+
+    simulate = method == "simulate" or (method == "auto" and forecast.np is not None)
+    if simulate and pending:
+        estimates = forecast.simulate_tails(
+            [forecasts[gid]["slots"] for gid in pending],
+            [forecasts[gid]["rate"] for gid in pending],
+            [forecasts[gid]["needed"] for gid in pending],
+            trials=trials,
+            seed=seed,
+        )
+        for gid, probability in zip(pending, estimates):
+            forecasts[gid].update(probability=probability, method="simulate")
+    return forecasts
+
+
 def calculate_goal_based_progress(habit_id: int, db_name: str) -> dict:
     """
     Calculate progress for a habit using its active goals.
@@ -352,14 +831,14 @@ def get_habit_analysis_with_goals(habit_id: int, db_name: str) -> dict:
     if not habit:
         return {}
 
-    completions = db.get_completions(habit_id, db_name)
+    metrics = get_habit_metrics(habit_id, db_name)
 
     return {
-        "completion_rate": calculate_completion_rate_for_habit(habit_id, db_name),
-        "longest_streak": calculate_longest_streak_for_habit(habit_id, db_name),
+        "completion_rate": metrics["completion_rate"],
+        "longest_streak": metrics["longest_streak"],
         "current_streak": habit.streak,
         "goal_progress": calculate_goal_based_progress(habit_id, db_name),
-        "total_completions": len(completions),
+        "total_completions": metrics["total_completions"],
     }
 
 
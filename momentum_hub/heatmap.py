@@ -0,0 +1,121 @@
+import calendar
+import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import periods
+
+# Design rationale: calendar views read a DayIndex built in one pass over the
+# distinct (habit, day) rows of the displayed span. Every cell is then an O(1)
+# offset lookup, so a year heatmap or a page of months costs the same however long
+# the habit's history is.
+
+LEVELS = 4  # intensity levels above "nothing completed"
+HEATMAP_WEEKS = 52
+WEEKDAY_NAMES = ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+
+
+class DayIndex:
+    """
+    Completion flags of several habits for every day in [start, end].
+
+    Example:
+        index = DayIndex(start, end, [(1, date(2026, 1, 5)), (2, date(2026, 1, 5))])
+        index.counts()[(date(2026, 1, 5) - start).days] -> 2
+    """
+
+    def __init__(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+        rows: Iterable[Tuple[int, datetime.date]],
+    ):
+        self.start = start
+        self.end = end
+        self.n_days = max(0, (end - start).days + 1)
+        self._flags: Dict[int, bytearray] = {}
+        for habit_id, day in rows:
+            offset = (day - start).days
+            if 0 <= offset < self.n_days:
+                flags = self._flags.get(habit_id)
+                if flags is None:
+                    flags = self._flags[habit_id] = bytearray(self.n_days)
+                flags[offset] = 1
+
+    def offset(self, day: datetime.date) -> Optional[int]:
+        """Position of day in the span, or None if it lies outside."""
+        offset = (day - self.start).days
+        return offset if 0 <= offset < self.n_days else None
+
+    def days(self, habit_id: int) -> List[datetime.date]:
+        """Completion days of one habit within the span, in order."""
+        flags = self._flags.get(habit_id, b"")
+        return [
+            self.start + datetime.timedelta(days=i) for i, f in enumerate(flags) if f
+        ]
+
+    def counts(self, habit_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """Number of the given habits (default: all) completed on each day."""
+        totals = [0] * self.n_days
+        ids = self._flags if habit_ids is None else habit_ids
+        for habit_id in ids:
+            flags = self._flags.get(habit_id)
+            if flags:
+                totals = [t + f for t, f in zip(totals, flags)]
+        return totals
+
+
+def intensity(count: int, peak: int) -> int:
+    """Maps a day's completion count to a level from 0 (none) to LEVELS (peak)."""
+    if count <= 0 or peak <= 0:
+        return 0
+    return min(LEVELS, -(-count * LEVELS // peak))
+
+
+def heatmap_span(
+    end: datetime.date, weeks: int = HEATMAP_WEEKS
+) -> Tuple[datetime.date, datetime.date]:
+    """First and last day of a heatmap with `weeks` Sunday-start columns up to end."""
+    return periods.week_start(end) - datetime.timedelta(weeks=weeks - 1), end
+
+
+def heatmap_grid(
+    index: DayIndex, counts: Sequence[int], peak: int
+) -> Tuple[List[datetime.date], List[List[Optional[int]]]]:
+    """
+    Lays the index span out as a GitHub-style grid: one column per week, one row per
+    weekday (Sunday first). Returns (week_starts, rows) where each cell is an
+    intensity level, or None for days outside the span.
+    """
+    first = periods.week_start(index.start)
+    n_weeks = (index.end - first).days // 7 + 1
+    week_starts = [first + datetime.timedelta(weeks=w) for w in range(n_weeks)]
+    rows: List[List[Optional[int]]] = [[] for _ in WEEKDAY_NAMES]
+    for week in week_starts:
+        for weekday, row in enumerate(rows):
+            offset = index.offset(week + datetime.timedelta(days=weekday))
+            row.append(None if offset is None else intensity(counts[offset], peak))
+    return week_starts, rows
+
+
+def month_grid(
+    index: DayIndex, year: int, month: int, counts: Sequence[int], peak: int
+) -> List[List[Optional[Tuple[int, Optional[int]]]]]:
+    """
+    One month as Sunday-start weeks of (day_number, level) cells; None pads the
+    first and last week, and the level is None for days outside the index span.
+    """
+    weeks = calendar.Calendar(firstweekday=calendar.SUNDAY).monthdayscalendar(
+        year, month
+    )
+    grid = []
+    for week in weeks:
+        cells: List[Optional[Tuple[int, Optional[int]]]] = []
+        for day in week:
+            if day == 0:
+                cells.append(None)
+                continue
+            offset = index.offset(datetime.date(year, month, day))
+            level = None if offset is None else intensity(counts[offset], peak)
+            cells.append((day, level))
+        grid.append(cells)
+    return grid
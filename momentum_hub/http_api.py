@@ -0,0 +1,316 @@
+import asyncio
+import datetime
+import json
+import re
+import secrets
+import signal
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import habit_analysis as analysis
+from . import momentum_db as db
+from .commands import to_json
+
+# Design rationale: a small read-only HTTP/1.1 server for local tools (status
+# bars, dashboards) built on asyncio streams, so it needs nothing outside the
+# standard library. As in the daemon, the event loop only parses requests and
+# writes responses; SQLite work runs in a thread pool, and a semaphore caps the
+# jobs handed to it so a burst of requests queues on the loop instead of in
+# memory. ETags come from data versions, not from the response bodies: per-habit
+# resources use the trigger-maintained habit write version and collections use
+# db.get_collection_version, built from those versions and the goals version.
+# PRAGMA data_version would be cheaper, but it also changes when analytics are
+# written to the cache, which reading /analytics itself does, so the server
+# would invalidate its own tags. A conditional GET whose version is unchanged is
+# answered with 304 without running the query. The version is read before the data, so a write racing a
+# request can only make the next ETag differ, never serve stale data as fresh.
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8737
+DEFAULT_WORKERS = 4
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+IDLE_TIMEOUT = 15  # seconds a keep-alive connection may wait for a request
+MAX_HEADER_LINES = 100
+
+
+class HTTPError(Exception):
+    """An error response: status code and message."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _int_param(query: Dict[str, List[str]], name: str, default: int) -> int:
+    try:
+        return int(query.get(name, [default])[0])
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{name}' must be an integer")
+
+
+def _flag_param(query: Dict[str, List[str]], name: str) -> bool:
+    return query.get(name, ["0"])[0].lower() in ("1", "true", "yes")
+
+
+def _habit_or_404(db_name: str, habit_id: int):
+    habit = db.get_habit(habit_id, db_name)
+    if habit is None:
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"No habit with ID {habit_id}")
+    return habit
+
+
+def _get_habits(db_name: str, query) -> Any:
+    return db.get_all_habits(not _flag_param(query, "all"), db_name)
+
+
+def _get_habit(db_name: str, query, habit_id: int) -> Any:
+    return _habit_or_404(db_name, habit_id)
+
+
+def _get_completions(db_name: str, query, habit_id: int) -> Any:
+    _habit_or_404(db_name, habit_id)
+    limit = _int_param(query, "limit", DEFAULT_PAGE_LIMIT)
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise HTTPError(
+            HTTPStatus.BAD_REQUEST, f"'limit' must be between 1 and {MAX_PAGE_LIMIT}"
+        )
+    after = _int_param(query, "after", 0) or None
+    page, cursor = db.get_completions_page(habit_id, after, limit, db_name)
+    return {
+        "habit_id": habit_id,
+        "completions": [{"id": cid, "date": date} for cid, date in page],
+        "next": cursor,
+    }
+
+
+def _get_analytics(db_name: str, query) -> Any:
+    habits = db.get_all_habits(active_only=True, db_name=db_name)
+    return {
+        str(habit_id): metrics
+        for habit_id, metrics in analysis.get_metrics_for_habits(
+            habits, db_name
+        ).items()
+    }
+
+
+def _get_habit_analytics(db_name: str, query, habit_id: int) -> Any:
+    _habit_or_404(db_name, habit_id)
+    return analysis.get_habit_metrics(habit_id, db_name)
+
+
+def _get_goals(db_name: str, query) -> Any:
+    return analysis.calculate_all_goal_progress(
+        db_name, active_only=not _flag_param(query, "all")
+    )
+
+
+# (path pattern, handler(db_name, query, *ids), ETag scope, whether the answer
+# also depends on today's date). Scope "habit" versions by the habit's write
+# version, "database" by db.get_collection_version.
+ROUTES: List[Tuple[re.Pattern, Callable[..., Any], str, bool]] = [
+    (re.compile(r"/habits"), _get_habits, "database", False),
+    (re.compile(r"/habits/(\d+)"), _get_habit, "habit", False),
+    (re.compile(r"/habits/(\d+)/completions"), _get_completions, "habit", False),
+    (re.compile(r"/habits/(\d+)/analytics"), _get_habit_analytics, "habit", True),
+    (re.compile(r"/analytics"), _get_analytics, "database", True),
+    (re.compile(r"/goals"), _get_goals, "database", True),
+]
+
+
+def match_route(path: str) -> Tuple[Callable[..., Any], str, bool, Tuple[int, ...]]:
+    """The route for a path and its integer path parameters; raises 404."""
+    path = path.rstrip("/") or "/"
+    for pattern, handler, scope, dated in ROUTES:
+        match = pattern.fullmatch(path)
+        if match:
+            return handler, scope, dated, tuple(int(g) for g in match.groups())
+    raise HTTPError(HTTPStatus.NOT_FOUND, f"No resource at {path}")
+
+
+class MomentumHTTPServer:
+    """
+    Serves ROUTES for one database as JSON over HTTP on a local address.
+
+    Example:
+        curl -i http://127.0.0.1:8737/habits/3/completions?limit=50
+        curl -i -H 'If-None-Match: "..."' http://127.0.0.1:8737/analytics
+    """
+
+    def __init__(
+        self,
+        db_name: str = db.DB_NAME,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        self.db_name = db_name
+        self.host = host
+        self.port = port
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="momentum-http")
+        # Tags from an earlier run (whose counters restarted) never match
+        self._instance = secrets.token_hex(4)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._workers = workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._writers: set = set()
+
+    def etag(self, scope: str, dated: bool, ids: Tuple[int, ...]) -> str:
+        """The current entity tag of a resource (runs SQLite work)."""
+        if scope == "habit":
+            version = f"h{ids[0]}v{db.get_habit_version(ids[0], self.db_name)}"
+        else:
+            version = "d" + ".".join(map(str, db.get_collection_version(self.db_name)))
+        if dated:
+            version += f"-{datetime.date.today():%Y%m%d}"
+        return f'"{self._instance}-{version}"'
+
+    def respond(
+        self, path: str, if_none_match: Optional[str] = None
+    ) -> Tuple[HTTPStatus, Dict[str, str], bytes]:
+        """Answers one GET synchronously: (status, headers, body)."""
+        url = urlsplit(path)
+        query = parse_qs(url.query)
+        try:
+            handler, scope, dated, ids = match_route(url.path)
+            tag = self.etag(scope, dated, ids)
+            headers = {"ETag": tag, "Cache-Control": "no-cache"}
+            if if_none_match and tag in (t.strip() for t in if_none_match.split(",")):
+                return HTTPStatus.NOT_MODIFIED, headers, b""
+            result = handler(self.db_name, query, *ids)
+            body = json.dumps(result, default=to_json).encode()
+            return HTTPStatus.OK, headers, body
+        except HTTPError as e:
+            status, message = e.status, str(e)
+        except (ValueError, LookupError, sqlite3.Error) as e:
+            status, message = HTTPStatus.INTERNAL_SERVER_ERROR, str(e)
+        return status, {}, json.dumps({"error": message}).encode()
+
+    async def _answer(
+        self, method: str, target: str, headers: Dict[str, str]
+    ) -> Tuple[HTTPStatus, Dict[str, str], bytes]:
+        if method not in ("GET", "HEAD"):
+            body = json.dumps({"error": f"Method {method} not allowed"}).encode()
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"Allow": "GET, HEAD"}, body
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            return await loop.run_in_executor(
+                self.executor, self.respond, target, headers.get("if-none-match")
+            )
+
+    async def _read_request(self, reader) -> Optional[Tuple[str, str, dict]]:
+        line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+        if not line.strip():
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        headers = {"version": version}
+        for _ in range(MAX_HEADER_LINES):
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                return method.upper(), target, headers
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+
+    async def _serve_client(self, reader, writer) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    body = json.dumps({"error": str(e)}).encode()
+                    self._write(writer, e.status, {"Connection": "close"}, body)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, headers = request
+                status, extra, body = await self._answer(method, target, headers)
+                keep_alive = (
+                    headers["version"] == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                extra["Connection"] = "keep-alive" if keep_alive else "close"
+                self._write(writer, status, extra, body, head=method == "HEAD")
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _write(
+        writer, status: HTTPStatus, headers: Dict[str, str], body: bytes, head=False
+    ) -> None:
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+        if status != HTTPStatus.NOT_MODIFIED:
+            headers = {
+                "Content-Type": "application/json",
+                "Content-Length": str(len(body)),
+                **headers,
+            }
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if not head and status != HTTPStatus.NOT_MODIFIED:
+            writer.write(body)
+
+    async def serve(self, ready: Optional[threading.Event] = None) -> None:
+        """Listens on host:port until stop() is called (port 0 picks a free port)."""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._slots = asyncio.Semaphore(self._workers)
+        server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        if ready:
+            ready.set()
+        try:
+            async with server:
+                await self._stop.wait()
+                for writer in list(self._writers):
+                    writer.close()
+        finally:
+            self.executor.shutdown(wait=False)
+
+    def stop(self) -> None:
+        """Stops serve(); safe to call from any thread."""
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+
+def run_http_server(
+    db_name: str,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = DEFAULT_WORKERS,
+) -> None:
+    """Runs the HTTP server in the foreground until SIGINT or SIGTERM (Ctrl+C)."""
+    server = MomentumHTTPServer(db_name, host, port, workers)
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, server.stop)
+            except NotImplementedError:
+                # Windows event loops have no signal handlers; Ctrl+C then
+                # arrives as KeyboardInterrupt below
+                break
+        await server.serve()
+
+    print(f"Momentum API serving {db_name} on http://{host}:{port}", flush=True)
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print()
@@ -1,43 +1,70 @@
+import importlib
 import sys
 
-import questionary
 from colorama import Fore, Style
 
 from . import momentum_db as db
-from .cli_analysis import (  # noqa: F401
-    analyze_best_worst_habit,
-    analyze_by_periodicity,
-    analyze_completion_history,
-    analyze_goal_progress,
-    analyze_habits,
-    analyze_list_all_habits,
-    analyze_longest_streak_all,
-    analyze_longest_streak_one,
-    analyze_streak_history_grid,
-)
-from .cli_category_management import manage_categories
-
-# Import CLI functions from modularized files
-from .cli_display import startup_message, view_habits
-from .cli_export import analyze_export_csv  # noqa: F401
-from .cli_goal_management import manage_goals
-from .cli_habit_management import (
-    create_new_habit,
-    delete_habit,
-    mark_habit_completed,
-    reactivate_habit,
-    update_habit,
-)
-from .cli_utils import _handle_habit_selection  # noqa: F401
+from .banner import startup_message
+from .error_manager import error_manager
 from .momentum_utils import press_enter_to_continue, show_colored_message
+from .precompute import start_warmer
+
+# Design rationale: the menu screens (and questionary, tabulate and the analytics
+# they pull in) are imported the first time they are used, not at startup, so
+# the banner appears as soon as the interpreter is up. Their names stay
+# attributes of this module through __getattr__, so callers and tests can keep
+# using or patching momentum_cli.<name>.
+
+_LAZY_ATTRIBUTES = {
+    "questionary": ("questionary", None),
+    "analyze_best_worst_habit": (".cli_analysis", "analyze_best_worst_habit"),
+    "analyze_by_periodicity": (".cli_analysis", "analyze_by_periodicity"),
+    "analyze_completion_history": (".cli_analysis", "analyze_completion_history"),
+    "analyze_goal_progress": (".cli_analysis", "analyze_goal_progress"),
+    "analyze_habits": (".cli_analysis", "analyze_habits"),
+    "analyze_list_all_habits": (".cli_analysis", "analyze_list_all_habits"),
+    "analyze_longest_streak_all": (".cli_analysis", "analyze_longest_streak_all"),
+    "analyze_longest_streak_one": (".cli_analysis", "analyze_longest_streak_one"),
+    "analyze_streak_history_grid": (".cli_analysis", "analyze_streak_history_grid"),
+    "manage_categories": (".cli_category_management", "manage_categories"),
+    "view_due_habits": (".cli_display", "view_due_habits"),
+    "view_habits": (".cli_display", "view_habits"),
+    "view_search": (".cli_display", "view_search"),
+    "analyze_export_csv": (".cli_export", "analyze_export_csv"),
+    "manage_goals": (".cli_goal_management", "manage_goals"),
+    "create_new_habit": (".cli_habit_management", "create_new_habit"),
+    "delete_habit": (".cli_habit_management", "delete_habit"),
+    "mark_habit_completed": (".cli_habit_management", "mark_habit_completed"),
+    "reactivate_habit": (".cli_habit_management", "reactivate_habit"),
+    "update_habit": (".cli_habit_management", "update_habit"),
+    "_handle_habit_selection": (".cli_utils", "_handle_habit_selection"),
+}
+
+
+def __getattr__(name: str):
+    """Imports a lazily loaded menu function (or questionary) on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name, __package__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str):
+    # Module globals first, so values patched onto this module win
+    return globals()[name] if name in globals() else __getattr__(name)
 
 
 def get_menu_options() -> list[str]:
     """Get the list of main menu options."""
     return [
         "Create a new habit",
+        "What's due",
         "Mark a habit as completed",
         "View habits",
+        "Search",
         "Update a habit",
         "Analyze habits",
         "Manage Goals",
@@ -51,15 +78,17 @@ def get_menu_options() -> list[str]:
 def get_menu_actions(db_name: str) -> dict:
     """Get menu action mappings for the given database name."""
     return {
-        "Create a new habit": lambda: create_new_habit(db_name),
-        "Mark a habit as completed": lambda: mark_habit_completed(db_name),
-        "View habits": lambda: view_habits(db_name),
-        "Update a habit": lambda: update_habit(db_name),
-        "Analyze habits": lambda: analyze_habits(db_name),
-        "Manage Goals": lambda: manage_goals(db_name),
-        "Manage Categories": lambda: manage_categories(db_name),
-        "Delete a habit": lambda: delete_habit(db_name),
-        "Reactivate a habit": lambda: reactivate_habit(db_name),
+        "Create a new habit": lambda: _lazy("create_new_habit")(db_name),
+        "What's due": lambda: _lazy("view_due_habits")(db_name),
+        "Mark a habit as completed": lambda: _lazy("mark_habit_completed")(db_name),
+        "View habits": lambda: _lazy("view_habits")(db_name),
+        "Search": lambda: _lazy("view_search")(db_name),
+        "Update a habit": lambda: _lazy("update_habit")(db_name),
+        "Analyze habits": lambda: _lazy("analyze_habits")(db_name),
+        "Manage Goals": lambda: _lazy("manage_goals")(db_name),
+        "Manage Categories": lambda: _lazy("manage_categories")(db_name),
+        "Delete a habit": lambda: _lazy("delete_habit")(db_name),
+        "Reactivate a habit": lambda: _lazy("reactivate_habit")(db_name),
         "Exit": lambda: sys.exit(),
     }
 
@@ -83,10 +112,14 @@ def main_menu(db_name: str):
         style=Style.BRIGHT,
     )
 
-    choice = questionary.select(
-        "What would you like to do? Let's keep the momentum going!",
-        choices=get_menu_options(),
-    ).ask()
+    choice = (
+        _lazy("questionary")
+        .select(
+            "What would you like to do? Let's keep the momentum going!",
+            choices=get_menu_options(),
+        )
+        .ask()
+    )
 
     # Handle user interruption (Ctrl+C)
     if choice is None:
@@ -104,16 +137,23 @@ def start_cli(db_name: str):
     """Starts the Momentum Hub CLI application."""
     # Initialize the database
     db.init_db(db_name)
+    error_manager.use_database(db_name)
+    # Fill the analytics cache while the user reads the menu
+    warmer = start_warmer(db_name)
 
     startup_message()
-    while True:
-        try:
-            main_menu(db_name)
-        except SystemExit:
-            break
-        except Exception as e:
-            show_colored_message(f"An error occurred: {str(e)}", color=Fore.RED)
-            press_enter_to_continue()
+    try:
+        while True:
+            try:
+                main_menu(db_name)
+            except SystemExit:
+                break
+            except Exception as e:
+                show_colored_message(f"An error occurred: {str(e)}", color=Fore.RED)
+                press_enter_to_continue()
+    finally:
+        if warmer is not None:
+            warmer.cancel()
 
 
 if __name__ == "__main__":
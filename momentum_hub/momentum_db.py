@@ -1,16 +1,31 @@
 import atexit
+import contextlib
 import datetime
+import re
 import sqlite3
 import threading
-from typing import List, Optional
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
+from . import periods
 from .habit import Habit
 
 DB_NAME = "momentum.db"
 
+# Stored in PRAGMA user_version. Bump whenever the schema or the layout of
+# cached analytics changes so stale analytics_cache rows are discarded.
+SCHEMA_VERSION = 1
+
+# Largest number of "?" parameters used in one IN (...) list (SQLite's historic
+# default limit is 999).
+MAX_QUERY_PARAMS = 900
+
 # Global list to track manually created connections for cleanup
 _open_connections = []
 
+# {db_name: sqlite3.Connection} of the transaction() blocks open on this thread
+_transactions = threading.local()
+
 
 class TrackedConnection:
     """A wrapper for SQLite connections that tracks them for proper cleanup."""
@@ -52,6 +67,31 @@ class TrackedConnection:
         return not self._closed
 
 
+class SharedConnection:
+    """
+    What get_connection() returns inside a transaction() block: the block's
+    connection, left open by `with` and whose commit() waits for the block to end.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
 def get_connection(db_name: str = DB_NAME):
     """
     Get's a connection to the sqlite database(db) and Returns a TrackedConnection object.
@@ -59,8 +99,14 @@ def get_connection(db_name: str = DB_NAME):
     When used with a context manager (with statement), the connection will be
     automatically closed on exit. Manually created connections should be tracked
     for cleanup.
+    db_name may also be an SQLite URI such as readonly_uri(path) returns.
+    Inside a transaction() block for db_name on the same thread, returns that
+    block's SharedConnection instead.
     """
-    conn = sqlite3.connect(db_name)
+    shared = getattr(_transactions, "connections", {}).get(db_name)
+    if shared is not None:
+        return SharedConnection(shared)
+    conn = sqlite3.connect(db_name, uri=db_name.startswith("file:"))
     # Enable foreign key constraints
     conn.execute("PRAGMA foreign_keys = ON")
     # Return tracked connection wrapper
@@ -86,6 +132,48 @@ def close_all_connections():
 atexit.register(close_all_connections)
 
 
+@contextlib.contextmanager
+def transaction(db_name: str = DB_NAME) -> Iterator[SharedConnection]:
+    """
+    Runs every call made with db_name on this thread inside the block as one
+    SQLite transaction: their commits are deferred, the block commits when it
+    exits and rolls everything back if it raises. Later calls see the block's
+    uncommitted writes, so validation (e.g. duplicate completions) still holds.
+    Nested blocks for the same database join the outer transaction.
+
+    Example:
+        with transaction(db_name):
+            add_completion(1, when, db_name)
+            add_completion(2, when, db_name)
+    """
+    connections = _transactions.__dict__.setdefault("connections", {})
+    if db_name in connections:
+        yield SharedConnection(connections[db_name])
+        return
+    tracked = get_connection(db_name)
+    conn = tracked._conn
+    conn.isolation_level = None  # BEGIN/COMMIT are issued here
+    conn.execute("BEGIN IMMEDIATE")
+    connections[db_name] = conn
+    try:
+        yield SharedConnection(conn)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        del connections[db_name]
+        tracked.close()
+
+
+def readonly_uri(db_path: str) -> str:
+    """
+    Returns an SQLite URI that opens db_path read-only; it can be passed anywhere a
+    db_name is expected. Writes through it fail with sqlite3.OperationalError.
+    """
+    return Path(db_path).resolve().as_uri().replace("file://", "file:", 1) + "?mode=ro"
+
+
 def init_db(db_name: str = DB_NAME):
     """
     Creates habits and completions tables if they do not exist.
@@ -170,9 +258,162 @@ def init_db(db_name: str = DB_NAME):
                 "ALTER TABLE habits ADD COLUMN category_id INTEGER REFERENCES categories(id);"
             )
 
+        # Serves per-habit history lookups and goal-window range scans
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_completions_habit_date ON completions(habit_id, date);"
+        )
+
+        _init_analytics_cache_schema(cursor)
+        _init_search_schema(cursor)
+
         conn.commit()
 
 
+def _init_analytics_cache_schema(cursor) -> None:
+    """
+    Creates the per-habit write version table, the triggers that maintain it and
+    the persistent analytics cache. Triggers bump a habit's version on every write
+    to its row or its completions, including writes made by other processes or the
+    maintenance scripts, so cached analytics can be validated with one lookup.
+    Writes to goals bump the "goals" row of table_versions the same way.
+    """
+    cursor.execute(
+        """
+    CREATE TABLE IF NOT EXISTS habit_versions(
+        habit_id INTEGER PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    );
+    """
+    )
+    cursor.execute(
+        """
+    CREATE TABLE IF NOT EXISTS table_versions(
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    );
+    """
+    )
+    cursor.execute(
+        """
+    CREATE TABLE IF NOT EXISTS analytics_cache(
+        habit_id INTEGER PRIMARY KEY,
+        version INTEGER NOT NULL,
+        payload TEXT NOT NULL
+    );
+    """
+    )
+
+    bump = """
+        INSERT INTO habit_versions(habit_id, version) VALUES ({ref}.{col}, 1)
+        ON CONFLICT(habit_id) DO UPDATE SET version = version + 1;
+    """
+    bump_goals = """
+        INSERT INTO table_versions(name, version) VALUES ('goals', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+    """
+    triggers = {
+        "trg_completions_insert_version": (
+            "AFTER INSERT ON completions",
+            bump.format(ref="NEW", col="habit_id"),
+        ),
+        "trg_completions_delete_version": (
+            "AFTER DELETE ON completions",
+            bump.format(ref="OLD", col="habit_id"),
+        ),
+        "trg_completions_update_version": (
+            "AFTER UPDATE ON completions",
+            bump.format(ref="OLD", col="habit_id")
+            + bump.format(ref="NEW", col="habit_id"),
+        ),
+        "trg_habits_insert_version": (
+            "AFTER INSERT ON habits",
+            bump.format(ref="NEW", col="id"),
+        ),
+        "trg_habits_update_version": (
+            "AFTER UPDATE ON habits",
+            bump.format(ref="NEW", col="id"),
+        ),
+        "trg_habits_delete_version": (
+            "AFTER DELETE ON habits",
+            """
+        DELETE FROM habit_versions WHERE habit_id = OLD.id;
+        DELETE FROM analytics_cache WHERE habit_id = OLD.id;
+    """,
+        ),
+        "trg_goals_insert_version": ("AFTER INSERT ON goals", bump_goals),
+        "trg_goals_update_version": ("AFTER UPDATE ON goals", bump_goals),
+        "trg_goals_delete_version": ("AFTER DELETE ON goals", bump_goals),
+    }
+    for name, (event, body) in triggers.items():
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name} {event} FOR EACH ROW BEGIN {body} END;"
+        )
+
+    # Cached payloads written by an older release may use a different layout.
+    cursor.execute("PRAGMA user_version;")
+    if cursor.fetchone()[0] != SCHEMA_VERSION:
+        cursor.execute("DELETE FROM analytics_cache;")
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+
+
+# (FTS table, source table, indexed columns); the FTS tables store no text of
+# their own (external content) and share the source table's ids as rowids.
+SEARCH_INDEXES = (
+    ("habits_fts", "habits", ("name", "notes")),
+    ("categories_fts", "categories", ("name", "description")),
+)
+
+
+def _init_search_schema(cursor) -> None:
+    """
+    Creates the FTS5 full-text indexes over habit and category text and the
+    triggers that keep them in sync with every write. Indexes created for an
+    existing database are filled from its rows. Does nothing when this SQLite
+    build lacks FTS5; search() then falls back to LIKE scans.
+    """
+    for fts, table, columns in SEARCH_INDEXES:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        )
+        if cursor.fetchone():
+            continue
+        cols = ", ".join(columns)
+        try:
+            cursor.execute(
+                f"""
+            CREATE VIRTUAL TABLE {fts} USING fts5(
+                {cols}, content='{table}', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            );
+            """
+            )
+        except sqlite3.OperationalError:
+            return  # no FTS5 module in this SQLite build
+        # Rank by BM25 with name matches weighing ten times the longer text
+        cursor.execute(
+            f"INSERT INTO {fts}({fts}, rank) VALUES ('rank', 'bm25(10.0, 1.0)');"
+        )
+        new = ", ".join(f"NEW.{c}" for c in columns)
+        old = ", ".join(f"OLD.{c}" for c in columns)
+        insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (NEW.id, {new});"
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', OLD.id, {old});"
+        )
+        triggers = {
+            f"trg_{fts}_insert": (f"AFTER INSERT ON {table}", insert),
+            f"trg_{fts}_delete": (f"AFTER DELETE ON {table}", delete),
+            f"trg_{fts}_update": (
+                f"AFTER UPDATE OF {cols} ON {table}",
+                delete + insert,
+            ),
+        }
+        for name, (event, body) in triggers.items():
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {name} {event} FOR EACH ROW BEGIN {body} END;"
+            )
+        cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild');")
+
+
 def clear_demo_data(db_name: str = DB_NAME) -> None:
     """
     Clears all demo data from the database.
@@ -185,6 +426,7 @@ def clear_demo_data(db_name: str = DB_NAME) -> None:
         cursor.execute("DELETE FROM completions;")
         cursor.execute("DELETE FROM habits;")
         cursor.execute("DELETE FROM categories;")
+        cursor.execute("DELETE FROM analytics_cache;")
         conn.commit()
 
 
@@ -367,27 +609,336 @@ def get_all_habits(active_only: bool = True, db_name: str = DB_NAME) -> list[Hab
             )
 
         rows = cursor.fetchall()
-    habits = []
-    for row in rows:
-        habit_dict = {
-            "id": row[0],
-            "name": row[1],
-            "frequency": row[2],
-            "notes": row[3],
-            "reminder_time": row[4],
-            "evening_reminder_time": row[5],
-            "streak": row[6],
-            "created_at": row[7],
-            "last_completed": row[8],
-            "is_active": bool(row[9]),
-            "reactivated_at": row[10],
-            "category_id": row[11],
-        }
-        habits.append(Habit.from_dict(habit_dict))
+    return [_habit_from_row(row) for row in rows]
 
+
+def iter_habits(
+    active_only: bool = True, db_name: str = DB_NAME, batch_size: int = 500
+) -> Iterator[Habit]:
+    """
+    Streams habits in id order, fetching batch_size rows at a time, for listings
+    that print as they go. Each batch is a separate keyset query that has
+    finished before its rows are yielded, so no read lock is held while the
+    caller waits (e.g. a pager at its prompt) and other processes can write.
+    """
+    where = " AND is_active = 1" if active_only else ""
+    query = (
+        """
+        SELECT id, name, frequency, notes, reminder_time, evening_reminder_time,
+               streak, created_at, last_completed, is_active, reactivated_at, category_id
+        FROM habits
+        WHERE id > ?"""
+        + where
+        + " ORDER BY id LIMIT ?"
+    )
+    last_id = 0
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        while rows := cursor.execute(query, (last_id, batch_size)).fetchall():
+            last_id = rows[-1][0]
+            for row in rows:
+                yield _habit_from_row(row)
+
+
+def _habit_from_row(row) -> Habit:
+    """Builds a Habit from the habit columns in get_all_habits() order."""
+    habit_dict = {
+        "id": row[0],
+        "name": row[1],
+        "frequency": row[2],
+        "notes": row[3],
+        "reminder_time": row[4],
+        "evening_reminder_time": row[5],
+        "streak": row[6],
+        "created_at": row[7],
+        "last_completed": row[8],
+        "is_active": bool(row[9]),
+        "reactivated_at": row[10],
+        "category_id": row[11],
+    }
+    return Habit.from_dict(habit_dict)
+
+
+def get_habits_by_ids(habit_ids: List[int], db_name: str = DB_NAME) -> list[Habit]:
+    """Fetches the given habits (active or not) in batched queries; unknown ids are skipped."""
+    ids = list(dict.fromkeys(habit_ids))
+    habits = []
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        for i in range(0, len(ids), MAX_QUERY_PARAMS):
+            chunk = ids[i : i + MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"""
+                SELECT id, name, frequency, notes, reminder_time, evening_reminder_time,
+                       streak, created_at, last_completed, is_active, reactivated_at, category_id
+                FROM habits
+                WHERE id IN ({placeholders})
+            """,
+                chunk,
+            )
+            habits.extend(_habit_from_row(row) for row in cursor.fetchall())
     return habits
 
 
+def _like_escape(text: str) -> str:
+    """Escapes LIKE wildcards so user text matches literally (with ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_habits(
+    query: str = "",
+    active: Optional[bool] = True,
+    after: Optional[Tuple[int, int]] = None,
+    limit: int = 20,
+    db_name: str = DB_NAME,
+) -> Tuple[list[Habit], Optional[Tuple[int, int]]]:
+    """
+    One page of habits matching query, best matches first: names starting with the
+    query, then names or notes containing it, then names containing its characters
+    in order (fuzzy, e.g. "rd" finds "Read"). Matching ignores ASCII case.
+    Pages are keyset-paginated on (rank, id), so no habit is repeated or skipped
+    when habits are added while paging. Each page still scans the habits
+    table, ranks every match and sorts the matches (O(m log m) for m matches),
+    because a rank computed from LIKE patterns cannot be served by an index; that
+    is cheap for the habit counts a picker shows.
+    active: True for active habits, False for deleted ones, None for all.
+    Returns (habits, cursor); pass cursor as `after` for the next page. The
+    cursor is None on the last page.
+    """
+    query = query.strip()
+    escaped = _like_escape(query)
+    fuzzy = "%" + "%".join(_like_escape(c) for c in query if not c.isspace()) + "%"
+    after_rank, after_id = after or (-1, -1)
+    status = "" if active is None else "AND is_active = ?"
+    params = [f"{escaped}%", f"%{escaped}%", f"%{escaped}%", fuzzy, f"%{escaped}%"]
+    if active is not None:
+        params.append(int(active))
+    params += [after_rank, after_rank, after_id, limit + 1]
+    with get_connection(db_name) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT * FROM (
+                SELECT id, name, frequency, notes, reminder_time, evening_reminder_time,
+                       streak, created_at, last_completed, is_active, reactivated_at,
+                       category_id,
+                       CASE
+                           WHEN name LIKE ? ESCAPE '\\' THEN 0
+                           WHEN name LIKE ? ESCAPE '\\'
+                                OR notes LIKE ? ESCAPE '\\' THEN 1
+                           ELSE 2
+                       END AS match_rank
+                FROM habits
+                WHERE (name LIKE ? ESCAPE '\\' OR notes LIKE ? ESCAPE '\\') {status}
+            )
+            WHERE match_rank > ? OR (match_rank = ? AND id > ?)
+            ORDER BY match_rank, id
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+    habits = [_habit_from_row(row) for row in rows[:limit]]
+    cursor = (rows[limit - 1][12], rows[limit - 1][0]) if len(rows) > limit else None
+    return habits, cursor
+
+
+def has_search_index(db_name: str = DB_NAME) -> bool:
+    """Whether db_name has the FTS5 search indexes (see _init_search_schema)."""
+    with get_connection(db_name) as conn:
+        row = conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN (?, ?)",
+            [fts for fts, _, _ in SEARCH_INDEXES],
+        ).fetchone()
+    return row[0] == len(SEARCH_INDEXES)
+
+
+def search(query: str, limit: int = 20, db_name: str = DB_NAME) -> list[dict]:
+    """
+    Full-text search over habit names and notes and category names and
+    descriptions, best matches first. Every word of the query must match the
+    start of a word in the item (e.g. "med morn" finds "Morning meditation").
+    Uses the FTS5 indexes (BM25 ranking, name matches weigh most) and falls back
+    to LIKE scans on databases without them.
+    Returns: [{'kind': 'habit' | 'category', 'id': int, 'name': str,
+               'snippet': str, 'is_active': bool}]
+    """
+    terms = re.findall(r"\w+", query)
+    if not terms or limit <= 0:
+        return []
+    if not has_search_index(db_name):
+        return _search_like(terms, limit, db_name)
+
+    match = " ".join(f'"{term}"*' for term in terms)
+    branches = []
+    for (fts, table, _), kind in zip(SEARCH_INDEXES, ("habit", "category")):
+        # Each branch takes its own top `limit` by rank before the merge
+        branches.append(
+            f"""
+            SELECT * FROM (
+                SELECT '{kind}' AS kind, t.id, t.name,
+                       snippet({fts}, 1, '[', ']', '...', 8) AS snippet,
+                       t.is_active, {fts}.rank AS score
+                FROM {fts} JOIN {table} t ON t.id = {fts}.rowid
+                WHERE {fts} MATCH ?
+                ORDER BY {fts}.rank
+                LIMIT ?
+            )"""
+        )
+    with get_connection(db_name) as conn:
+        rows = conn.execute(
+            " UNION ALL ".join(branches) + " ORDER BY score, kind DESC, id LIMIT ?",
+            [match, limit, match, limit, limit],
+        ).fetchall()
+    return [_search_result(row) for row in rows]
+
+
+def _search_result(row) -> dict:
+    return {
+        "kind": row[0],
+        "id": row[1],
+        "name": row[2],
+        "snippet": row[3] or "",
+        "is_active": bool(row[4]),
+    }
+
+
+def _search_like(terms: List[str], limit: int, db_name: str) -> list[dict]:
+    """search() for databases without FTS5: a LIKE scan per table."""
+    branches, params = [], []
+    for (_, table, (name, text)), kind in zip(SEARCH_INDEXES, ("habit", "category")):
+        conditions = " AND ".join(
+            f"({name} LIKE ? ESCAPE '\\' OR {text} LIKE ? ESCAPE '\\')" for _ in terms
+        )
+        branches.append(
+            f"""
+            SELECT '{kind}' AS kind, id, {name}, COALESCE({text}, ''), is_active,
+                   CASE WHEN {name} LIKE ? ESCAPE '\\' THEN 0 ELSE 1 END AS score
+            FROM {table} WHERE {conditions}"""
+        )
+        params.append(f"{_like_escape(terms[0])}%")
+        for term in terms:
+            params += [f"%{_like_escape(term)}%"] * 2
+    with get_connection(db_name) as conn:
+        rows = conn.execute(
+            " UNION ALL ".join(branches) + " ORDER BY score, kind DESC, id LIMIT ?",
+            params + [limit],
+        ).fetchall()
+    return [_search_result(row) for row in rows]
+
+
+def get_habit_versions(db_name: str = DB_NAME) -> dict[int, int]:
+    """
+    Returns {habit_id: write_version} for every habit. Versions are bumped by
+    triggers on any write to a habit or its completions, so comparing two snapshots
+    tells which habits changed; habits that were never written since the version
+    table was added report 0.
+    """
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT h.id, COALESCE(v.version, 0)
+            FROM habits h
+            LEFT JOIN habit_versions v ON v.habit_id = h.id
+        """
+        )
+        return dict(cursor.fetchall())
+
+
+def get_habit_version(habit_id: int, db_name: str = DB_NAME) -> int:
+    """The write version of one habit (see get_habit_versions); 0 if never written."""
+    with get_connection(db_name) as conn:
+        row = conn.execute(
+            "SELECT version FROM habit_versions WHERE habit_id = ?", (habit_id,)
+        ).fetchone()
+    return row[0] if row else 0
+
+
+def get_collection_version(db_name: str = DB_NAME) -> tuple[int, int, int, int]:
+    """
+    A version of the habit, completion and goal data as (habits, highest habit id,
+    sum of habit write versions, goals version). Any write to that data changes
+    it: edits raise the sum, deletes lower the count and, since habit ids are
+    never reused, an insert raises the highest id. Unlike PRAGMA data_version it
+    ignores commits that only touch derived tables such as analytics_cache.
+    """
+    with get_connection(db_name) as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(MAX(h.id), 0), COALESCE(SUM(v.version), 0),
+                   (SELECT COALESCE(MAX(version), 0) FROM table_versions
+                    WHERE name = 'goals')
+            FROM habits h
+            LEFT JOIN habit_versions v ON v.habit_id = h.id
+        """
+        ).fetchone()
+    return tuple(row)
+
+
+def get_due_habits(
+    now: Optional[datetime.datetime] = None, db_name: str = DB_NAME
+) -> list[tuple[Habit, int]]:
+    """
+    Returns the active habits that still need completions in their current period
+    (day, Sunday-start week or month) as (habit, days_completed_in_period) pairs,
+    ordered by reminder time (habits without one last).
+    One query: each habit's period count is a correlated lookup on the
+    (habit_id, date) index, so the cost does not grow with the history.
+    """
+    now = now or datetime.datetime.now()
+    today = now.date()
+    params = {
+        "day": datetime.datetime.combine(today, datetime.time.min).isoformat(),
+        "week": datetime.datetime.combine(
+            periods.week_start(today), datetime.time.min
+        ).isoformat(),
+        "month": datetime.datetime.combine(
+            today.replace(day=1), datetime.time.min
+        ).isoformat(),
+        "end": datetime.datetime.combine(today, datetime.time.max).isoformat(),
+        # Whole-string match, so the filter admits what parse_frequency accepts
+        "times_per_week": (
+            f"[{periods.MIN_TIMES_PER_WEEK}-{periods.MAX_TIMES_PER_WEEK}]/week"
+        ),
+    }
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        # CAST('3/week' AS INTEGER) reads the leading quota of N-per-week habits;
+        # MATERIALIZED keeps SQLite from re-running the count for the filter
+        cursor.execute(
+            """
+            WITH period_counts AS MATERIALIZED (
+                SELECT h.id, h.name, h.frequency, h.notes, h.reminder_time,
+                       h.evening_reminder_time, h.streak, h.created_at,
+                       h.last_completed, h.is_active, h.reactivated_at, h.category_id,
+                       (SELECT COUNT(DISTINCT substr(c.date, 1, 10))
+                        FROM completions c
+                        WHERE c.habit_id = h.id
+                          AND c.date >= MAX(
+                              CASE h.frequency
+                                  WHEN 'daily' THEN :day
+                                  WHEN 'monthly' THEN :month
+                                  ELSE :week
+                              END,
+                              COALESCE(h.reactivated_at, ''))
+                          AND c.date <= :end) AS done,
+                       CASE WHEN h.frequency GLOB :times_per_week
+                            THEN CAST(h.frequency AS INTEGER) ELSE 1 END AS quota
+                FROM habits h
+                WHERE h.is_active = 1
+                  AND (h.frequency IN ('daily', 'weekly', 'monthly')
+                       OR h.frequency GLOB :times_per_week)
+            )
+            SELECT * FROM period_counts
+            WHERE done < quota
+            ORDER BY reminder_time IS NULL, reminder_time, name
+        """,
+            params,
+        )
+        rows = cursor.fetchall()
+    return [(_habit_from_row(row), row[12]) for row in rows]
+
+
 _completion_lock = threading.Lock()
 
 
@@ -397,43 +948,36 @@ def add_completion(
     """
     Records a habit completion in database,
     Inserts a new row in the completions table with the habit_id and datetime.
-    Prevents duplicate completions for the same period (day or week).
-    For weekly habits, uses American week (Sunday to Saturday).
+    Prevents duplicate completions for the same period (day, week or month);
+    "N/week" habits allow one completion per day and N per week.
+    Weeks are American weeks (Sunday to Saturday).
     Only considers completions after the most recent reactivation (if any).
-    Robustly handles new habits and prevents false duplicate errors.
+    Duplicate checks are indexed range counts over the current period only.
     Uses a thread lock to ensure concurrency safety.
     """
     with _completion_lock:
         habit = get_habit(habit_id, db_name)
         if not habit:
             raise ValueError("Habit not found.")
-        completions = get_completions(habit_id, db_name)
-        dt_date = dt.date()
-        # Only consider completions after reactivated_at (if set)
-        if habit.reactivated_at:
-            completions = [c for c in completions if c >= habit.reactivated_at]
-        # Defensive: If no completions, always allow
-        if not completions:
-            pass  # No duplicate possible
-        elif habit.frequency == "daily":
-            # Only one completion per day
-            for c in completions:
-                if c.date() == dt_date:
+        parsed = periods.parse_frequency(habit.frequency)
+        if parsed:
+            unit, quota = parsed
+            start, end = periods.period_bounds(dt, habit.frequency)
+            # Only consider completions after reactivated_at (if set)
+            if habit.reactivated_at and habit.reactivated_at > start:
+                start = habit.reactivated_at
+            if quota > 1:
+                day_start, day_end = periods.period_bounds(dt, "daily")
+                if count_completions_in_range(
+                    habit_id, max(day_start, start), day_end, db_name
+                ):
+                    raise ValueError("This habit has already been completed today.")
+            if count_completions_in_range(habit_id, start, end, db_name) >= quota:
+                if unit == "day":
                     raise ValueError("This habit has already been completed.")
-        elif habit.frequency == "weekly":
-            # Only one completion per American week (Sunday to Saturday)
-            week_start = dt_date - datetime.timedelta(
-                days=dt_date.weekday() + 1 if dt_date.weekday() < 6 else 0
-            )
-            for c in completions:
-                c_date = c.date()
-                c_week_start = c_date - datetime.timedelta(
-                    days=c_date.weekday() + 1 if c_date.weekday() < 6 else 0
+                raise ValueError(
+                    f"This habit has already been completed for the {unit}."
                 )
-                if c_week_start == week_start:
-                    raise ValueError(
-                        "This habit has already been completed for the week."
-                    )
         with get_connection(db_name) as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -446,6 +990,28 @@ def add_completion(
             conn.commit()
 
 
+def complete_habit(
+    habit_id: int,
+    completion_time: Optional[datetime.datetime] = None,
+    db_name: str = DB_NAME,
+) -> Habit:
+    """
+    Records a completion of an active habit (default: now) and updates its
+    last_completed time and streak, as the "Mark a habit as completed" menu does.
+    Returns the updated habit. Raises ValueError if the habit is unknown or inactive,
+    or the completion is a duplicate for its period.
+    """
+    habit = get_habit(habit_id, db_name)
+    if not habit or not habit.is_active:
+        raise ValueError(f"No active habit with ID {habit_id}.")
+    completion_time = completion_time or datetime.datetime.now()
+    add_completion(habit_id, completion_time, db_name)
+    habit.mark_completed(completion_time)
+    update_habit(habit, db_name)
+    update_streak(habit_id, db_name)
+    return get_habit(habit_id, db_name)
+
+
 def get_completions(habit_id: int, db_name: str = DB_NAME) -> list[datetime.datetime]:
     """
     Fetches alll completions for a specified habit from the database.
@@ -475,6 +1041,255 @@ def get_completions(habit_id: int, db_name: str = DB_NAME) -> list[datetime.date
     return completions
 
 
+def get_completions_page(
+    habit_id: int,
+    after: Optional[int] = None,
+    limit: int = 100,
+    db_name: str = DB_NAME,
+) -> Tuple[list[Tuple[int, datetime.datetime]], Optional[int]]:
+    """
+    One page of a habit's completions in date order, as (completion_id, date)
+    pairs. `after` is the cursor returned with the previous page: the last
+    completion id shown. Pages are keyset-paginated on (date, id) over the
+    (habit_id, date) index, so deep pages cost the same as the first.
+    Returns (page, cursor); the cursor is None on the last page.
+    """
+    clause, params = "", []
+    if after is not None:
+        clause = " AND (date, id) > ((SELECT date FROM completions WHERE id = ?), ?)"
+        params = [after, after]
+    with get_connection(db_name) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT id, date FROM completions
+            WHERE habit_id = ? AND date IS NOT NULL{clause}
+            ORDER BY date, id
+            LIMIT ?
+        """,
+            [habit_id, *params, limit + 1],
+        ).fetchall()
+    page = [(row[0], datetime.datetime.fromisoformat(row[1])) for row in rows[:limit]]
+    cursor = page[-1][0] if len(rows) > limit else None
+    return page, cursor
+
+
+def get_completions_for_habits(
+    habit_ids: List[int], db_name: str = DB_NAME
+) -> dict[int, list[datetime.datetime]]:
+    """
+    Fetches the completions of several habits with a single query.
+    Returns {habit_id: [datetime, ...]} in ascending date order; every requested
+    habit is present, with an empty list if it has no completions.
+    """
+    completions: dict[int, list[datetime.datetime]] = {hid: [] for hid in habit_ids}
+    ids = list(completions)
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        # Chunked to stay below SQLite's bound-parameter limit
+        for i in range(0, len(ids), MAX_QUERY_PARAMS):
+            chunk = ids[i : i + MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"""
+                SELECT habit_id, date
+                FROM completions
+                WHERE habit_id IN ({placeholders})
+                ORDER BY habit_id, date ASC
+            """,
+                chunk,
+            )
+            for habit_id, date_str in cursor:
+                if date_str:
+                    completions[habit_id].append(
+                        datetime.datetime.fromisoformat(date_str)
+                    )
+    return completions
+
+
+def get_completion_days_for_habits(
+    habit_ids: List[int],
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    db_name: str = DB_NAME,
+) -> Iterator[tuple[int, datetime.date]]:
+    """
+    Streams the distinct (habit_id, day) pairs on which the given habits were
+    completed between start and end (inclusive dates, either optional), ordered by
+    habit and day. Days are grouped in SQL over the (habit_id, date) index.
+    """
+    clause, params = _completion_range_clause(
+        datetime.datetime.combine(start, datetime.time.min) if start else None,
+        datetime.datetime.combine(end, datetime.time.max) if end else None,
+    )
+    ids = list(dict.fromkeys(habit_ids))
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        for i in range(0, len(ids), MAX_QUERY_PARAMS):
+            chunk = ids[i : i + MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"""
+                SELECT habit_id, substr(date, 1, 10) AS day
+                FROM completions
+                WHERE habit_id IN ({placeholders}){clause}
+                GROUP BY habit_id, day
+                ORDER BY habit_id, day
+            """,
+                [*chunk, *params],
+            )
+            for habit_id, day in cursor.fetchall():
+                if day:
+                    yield habit_id, datetime.date.fromisoformat(day)
+
+
+def _completion_range_clause(
+    start: Optional[datetime.datetime], end: Optional[datetime.datetime]
+) -> tuple:
+    """Builds the WHERE clause and parameters for an inclusive date range."""
+    clause = ""
+    params: list = []
+    if start is not None:
+        clause += " AND date >= ?"
+        params.append(start.isoformat())
+    if end is not None:
+        clause += " AND date <= ?"
+        params.append(end.isoformat())
+    return clause, params
+
+
+def count_completions_in_range(
+    habit_id: int,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    db_name: str = DB_NAME,
+) -> int:
+    """
+    Counts completions of a habit between start and end (inclusive, either optional).
+    Served by the (habit_id, date) index, so the cost scales with the range.
+    """
+    clause, params = _completion_range_clause(start, end)
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT COUNT(*) FROM completions WHERE habit_id = ?{clause}",
+            [habit_id, *params],
+        )
+        return cursor.fetchone()[0]
+
+
+def get_completions_in_range(
+    habit_id: int,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    db_name: str = DB_NAME,
+) -> list[datetime.datetime]:
+    """
+    Fetches completions of a habit between start and end (inclusive, either optional),
+    in ascending date order.
+    """
+    clause, params = _completion_range_clause(start, end)
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT date FROM completions WHERE habit_id = ?{clause} ORDER BY date ASC",
+            [habit_id, *params],
+        )
+        rows = cursor.fetchall()
+    return [datetime.datetime.fromisoformat(row[0]) for row in rows if row[0]]
+
+
+def iter_completions(
+    habit_id: int,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    db_name: str = DB_NAME,
+    batch_size: int = 500,
+) -> Iterator[datetime.datetime]:
+    """
+    Streams completions of a habit in ascending date order, fetching batch_size rows
+    at a time, so long histories are never materialised as one list.
+    Like iter_habits, each batch is a finished keyset query on (date, id), so no
+    read lock is held between batches.
+    """
+    clause, params = _completion_range_clause(start, end)
+    query = (
+        f"SELECT date, id FROM completions WHERE habit_id = ?{clause}"
+        " AND (date, id) > (?, ?) ORDER BY date, id LIMIT ?"
+    )
+    last = ("", 0)
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        while rows := cursor.execute(
+            query, [habit_id, *params, *last, batch_size]
+        ).fetchall():
+            last = rows[-1]
+            for date, _ in rows:
+                if date:
+                    yield datetime.datetime.fromisoformat(date)
+
+
+def get_completion_day_span(
+    habit_id: int, db_name: str = DB_NAME
+) -> tuple[Optional[datetime.date], Optional[datetime.date], int]:
+    """
+    Returns (first_day, last_day, distinct_days) of a habit's completions from one
+    aggregate query over the (habit_id, date) index; (None, None, 0) if there are none.
+    Days are the calendar dates of the stored timestamps (the first 10 ISO characters).
+    """
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT MIN(substr(date, 1, 10)), MAX(substr(date, 1, 10)),
+                   COUNT(DISTINCT substr(date, 1, 10))
+            FROM completions
+            WHERE habit_id = ?
+        """,
+            (habit_id,),
+        )
+        first, last, distinct_days = cursor.fetchone()
+    if not first:
+        return None, None, 0
+    return (
+        datetime.date.fromisoformat(first),
+        datetime.date.fromisoformat(last),
+        distinct_days,
+    )
+
+
+def get_completion_gaps(
+    habit_id: int, db_name: str = DB_NAME
+) -> list[tuple[datetime.date, datetime.date]]:
+    """
+    Returns the runs of days without a completion between a habit's first and last
+    completion as inclusive (first_missed, last_missed) intervals, oldest first.
+    Gaps are found in SQL by comparing each completion day with the previous one.
+    """
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT date(prev_day, '+1 day'), date(day, '-1 day')
+            FROM (
+                SELECT day, LAG(day) OVER (ORDER BY day) AS prev_day
+                FROM (
+                    SELECT DISTINCT substr(date, 1, 10) AS day
+                    FROM completions
+                    WHERE habit_id = ?
+                )
+            )
+            WHERE julianday(day) - julianday(prev_day) > 1
+            ORDER BY day
+        """,
+            (habit_id,),
+        )
+        rows = cursor.fetchall()
+    return [
+        (datetime.date.fromisoformat(start), datetime.date.fromisoformat(end))
+        for start, end in rows
+    ]
+
+
 def update_streak(habit_id: int, db_name: str = DB_NAME) -> None:
     """
     Recalculates and updates the current streak for a habit based on its completions.
@@ -493,56 +1308,19 @@ def update_streak(habit_id: int, db_name: str = DB_NAME) -> None:
         habit.last_completed = None
         update_habit(habit, db_name)
         return
-    if habit.frequency == "weekly":
-        if len(completions) == 1:
-            habit.streak = 1
-            habit.last_completed = completions[-1]
-            update_habit(habit, db_name)
-            return
-        # Find the Saturday of each completion week
-        saturday_set = set()
-        for c in completions:
-            date = c.date()
-            while date.weekday() != 5:  # 5 is Saturday
-                date += datetime.timedelta(days=1)
-            saturday_set.add(date)
-        saturdays = sorted(saturday_set)
-        if not saturdays:
-            habit.streak = 0
-            habit.last_completed = None
-            update_habit(habit, db_name)
-            return
-        # Calculate current streak (consecutive weeks up to the most recent)
-        current_streak = 1
-        for i in range(len(saturdays) - 2, -1, -1):
-            if (saturdays[i + 1] - saturdays[i]).days == 7:
-                current_streak += 1
-            else:
-                break
-        habit.streak = current_streak
-        habit.last_completed = completions[-1]
-    else:  # daily
-        # Calculate current streak (consecutive days up to the most recent)
-        current_streak = 1
-        for i in range(len(completions) - 2, -1, -1):
-            if (completions[i + 1].date() - completions[i].date()).days == 1:
-                current_streak += 1
-            else:
-                break
-        habit.streak = current_streak
-        habit.last_completed = completions[-1]
+    # Current streak: consecutive completed periods up to the most recent one
+    habit.streak = periods.trailing_run(
+        periods.completed_period_keys(completions, habit.frequency)
+    )
+    habit.last_completed = completions[-1]
     update_habit(habit, db_name)
 
 
-def export_completions_to_csv(
-    output_path: str = "completions.csv", db_name: str = DB_NAME
-):
+def get_completion_export_rows(db_name: str = DB_NAME) -> Tuple[List[str], list]:
     """
-    Exports all completions to a CSV file.
+    Returns (column names, rows) of every completion joined with its habit,
+    oldest first; the shape written by export_completions_to_csv().
     """
-    import csv
-    from pathlib import Path
-
     with get_connection(db_name) as conn:
         cursor = conn.cursor()
 
@@ -559,7 +1337,19 @@ def export_completions_to_csv(
 
         cursor.execute(query)
         rows = cursor.fetchall()
-        columns = [d[0] for d in cursor.description]
+        return [d[0] for d in cursor.description], rows
+
+
+def export_completions_to_csv(
+    output_path: str = "completions.csv", db_name: str = DB_NAME
+):
+    """
+    Exports all completions to a CSV file.
+    """
+    import csv
+    from pathlib import Path
+
+    columns, rows = get_completion_export_rows(db_name)
 
     outp = Path(output_path)
     with outp.open("w", newline="", encoding="utf-8") as f:
@@ -907,3 +1697,69 @@ def get_all_goals(active_only: bool = True, db_name: str = DB_NAME) -> List:
         }
         goals.append(Goal.from_dict(goal_dict))
     return goals
+
+
+def get_goals_with_completion_counts(
+    active_only: bool = True, db_name: str = DB_NAME
+) -> List:
+    """
+    Gets goals together with their habit and the number of completions inside each
+    goal's start/end window, using a single grouped COUNT query.
+    Returns a list of (goal, habit or None, count) tuples.
+    """
+    from .goal import Goal
+
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT g.id, g.habit_id, g.target_period_days, g.target_completions,
+                   g.start_date, g.end_date, g.is_active, g.created_at,
+                   h.id, h.name, h.frequency, h.notes, h.reminder_time,
+                   h.evening_reminder_time, h.streak, h.created_at, h.last_completed,
+                   h.is_active, h.reactivated_at, h.category_id,
+                   COUNT(c.id)
+            FROM goals g
+            LEFT JOIN habits h ON h.id = g.habit_id
+            LEFT JOIN completions c
+                ON c.habit_id = g.habit_id
+                AND (g.start_date IS NULL OR c.date >= g.start_date)
+                AND (g.end_date IS NULL OR c.date <= g.end_date)
+            {"WHERE g.is_active = 1" if active_only else ""}
+            GROUP BY g.id
+            ORDER BY g.id
+        """
+        )
+        rows = cursor.fetchall()
+
+    results = []
+    for row in rows:
+        goal_dict = {
+            "id": row[0],
+            "habit_id": row[1],
+            "target_period_days": row[2],
+            "target_completions": row[3],
+            "start_date": row[4],
+            "end_date": row[5],
+            "is_active": bool(row[6]),
+            "created_at": row[7],
+        }
+        habit = None
+        if row[8] is not None:
+            habit_dict = {
+                "id": row[8],
+                "name": row[9],
+                "frequency": row[10],
+                "notes": row[11],
+                "reminder_time": row[12],
+                "evening_reminder_time": row[13],
+                "streak": row[14],
+                "created_at": row[15],
+                "last_completed": row[16],
+                "is_active": bool(row[17]),
+                "reactivated_at": row[18],
+                "category_id": row[19],
+            }
+            habit = Habit.from_dict(habit_dict)
+        results.append((Goal.from_dict(goal_dict), habit, row[20]))
+    return results
@@ -2,9 +2,9 @@ import argparse
 import os
 import sys
 
+from . import commands
 from . import momentum_db as db
-from .momentum_cli import start_cli
-from .seed_data import create_demo_habits
+from . import paged_table
 
 
 def validate_database_path(db_path: str) -> None:
@@ -55,6 +55,12 @@ def validate_database_path(db_path: str) -> None:
 
 
 def main():
+    # Scripting subcommands skip the interactive menu, its imports and the banner
+    if commands.find_command(sys.argv[1:]):
+        sys.exit(commands.main(sys.argv[1:]))
+    from .momentum_cli import start_cli
+    from .seed_data import create_demo_habits
+
     # Add the current directory to the Python path
     current_dir = os.path.dirname(os.path.abspath(__file__))
     if current_dir not in sys.path:
@@ -65,7 +71,10 @@ def main():
         epilog="Examples:\n"
         "  python momentum_main.py                          # Run with default DB (momentum.db)\n"
         "  python momentum_main.py --db ./my_habits.db      # Use a custom DB file\n"
-        "  MOMENTUM_DB=test.db python momentum_main.py      # Use env var to specify DB\n",
+        "  MOMENTUM_DB=test.db python momentum_main.py      # Use env var to specify DB\n"
+        "  python momentum_main.py habits list --json       # Scripting commands:\n"
+        "  python momentum_main.py complete 3 --at 2026-01-05T08:00\n"
+        "  (complete, habits list, due, stats, export, batch, serve, watch; see `momentum_main.py stats -h`)\n",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
@@ -80,6 +89,28 @@ def main():
         action="store_true",
         help="Start the app in demo mode using `momentum_demo.db` (isolated from momentum.db)",
     )
+    parser.add_argument(
+        "--daemon",
+        dest="daemon",
+        action="store_true",
+        help="Serve the database over a UNIX socket instead of starting the menu "
+        "(query it with `python -m momentum_hub.client`)",
+    )
+    parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        default=None,
+        help="Socket path for --daemon (default: $MOMENTUM_SOCKET or a per-user "
+        "socket in the temporary directory)",
+    )
+    parser.add_argument(
+        "--page-size",
+        dest="page_size",
+        type=int,
+        default=None,
+        help="Rows per page in habit and history listings (default: 20 or "
+        "$MOMENTUM_PAGE_SIZE)",
+    )
     # parse_known_args so other CLI modules can add args if needed
     args, _ = parser.parse_known_args()
     # If the user explicitly passed --db on the command line, respect it.
@@ -91,6 +122,11 @@ def main():
     else:
         db_name = args.db_name
 
+    if args.page_size is not None:
+        if args.page_size < 1:
+            parser.error("--page-size must be at least 1")
+        paged_table.set_page_size(args.page_size)
+
     print(f"Using database: {db_name} {'(demo mode)' if args.demo else ''}")
 
     # Validate database path before attempting to use it
@@ -112,6 +148,12 @@ def main():
             create_demo_habits(db_name)
     # For regular mode, just initialize the database and start clean
 
+    if args.daemon:
+        from .daemon import run_daemon
+
+        run_daemon(db_name, args.socket_path)
+        return
+
     # Start the CLI with the database name
     start_cli(db_name)
 
@@ -0,0 +1,172 @@
+import itertools
+import os
+import re
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+# Design rationale: tabulate needs every row in memory and measures every cell
+# before printing anything, so a 10k-completion history stalled the screen and
+# held the whole table. Listings instead stream rows from an iterator and print
+# them a page at a time in the same grid layout. Column widths are fixed by the
+# caller or sampled from the first rows, so a page can be printed as soon as its
+# rows exist; cells wider than their column are cut short with an ellipsis.
+
+PAGE_SIZE_ENV = "MOMENTUM_PAGE_SIZE"
+DEFAULT_PAGE_SIZE = 20
+SAMPLE_ROWS = 50
+MAX_COLUMN_WIDTH = 40
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+_page_size: Optional[int] = None
+
+
+def set_page_size(page_size: Optional[int]) -> None:
+    """Sets the rows per page for every listing (None restores the default)."""
+    if page_size is not None and page_size < 1:
+        raise ValueError("Page size must be at least 1.")
+    global _page_size
+    _page_size = page_size
+
+
+def get_page_size() -> int:
+    """The --page-size value, else $MOMENTUM_PAGE_SIZE, else DEFAULT_PAGE_SIZE."""
+    if _page_size is not None:
+        return _page_size
+    try:
+        return max(1, int(os.getenv(PAGE_SIZE_ENV, "")))
+    except ValueError:
+        return DEFAULT_PAGE_SIZE
+
+
+def visible_width(text: str) -> int:
+    """Length of text as shown on a terminal, ignoring colour codes."""
+    return len(_ANSI_ESCAPE.sub("", text))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _cell_text(value: Any) -> str:
+    return "" if value is None else str(value).replace("\n", " ")
+
+
+def _fit(value: Any, width: int, right: bool) -> str:
+    """A cell padded to width, right-aligned or centered."""
+    text = _cell_text(value)
+    if visible_width(text) > width:
+        text = _ANSI_ESCAPE.sub("", text)[: max(width - 1, 0)] + "…"
+    padding = width - visible_width(text)
+    if right:
+        return " " * padding + text
+    left = padding // 2
+    return " " * left + text + " " * (padding - left)
+
+
+def sample_widths(
+    headers: Sequence[str], rows: Sequence[Sequence[Any]], max_width=MAX_COLUMN_WIDTH
+) -> List[int]:
+    """
+    Column widths fitting the sampled rows (capped at max_width) and the headers
+    plus two spaces, as tabulate sizes them.
+    """
+    widths = [visible_width(header) + 2 for header in headers]
+    for row in rows:
+        for i, value in enumerate(row):
+            widths[i] = max(widths[i], min(visible_width(_cell_text(value)), max_width))
+    return widths
+
+
+def _border(widths: Sequence[int], fill: str = "-") -> str:
+    return "+" + "+".join(fill * (width + 2) for width in widths) + "+"
+
+
+def render_row(
+    values: Sequence[Any],
+    widths: Sequence[int],
+    right: Optional[Sequence[bool]] = None,
+) -> str:
+    """
+    One grid line of cells; without right, number cells are right-aligned.
+    Lets a screen redraw a single row of a table in place.
+    """
+    if right is None:
+        right = [_is_number(value) for value in values]
+    cells = (_fit(v, w, r) for v, w, r in zip(values, widths, right))
+    return "| " + " | ".join(cells) + " |"
+
+
+def render_table(
+    headers: Sequence[str], rows: Sequence[Sequence[Any]], widths: Sequence[int]
+) -> str:
+    """
+    One page of rows as a grid table in tabulate's "grid" layout: number columns
+    (judged by the page's first row) right-aligned, the rest centered.
+    """
+    right = [_is_number(value) for value in rows[0]] if rows else [False] * len(widths)
+    lines = [_border(widths), render_row(headers, widths, right), _border(widths, "=")]
+    for row in rows:
+        lines.append(render_row(row, widths, right))
+        lines.append(_border(widths))
+    return "\n".join(lines)
+
+
+def iter_pages(
+    rows: Iterable[Sequence[Any]],
+    headers: Sequence[str],
+    page_size: Optional[int] = None,
+    widths: Optional[Sequence[int]] = None,
+    sample_size: int = SAMPLE_ROWS,
+    source: Optional[Iterator[Any]] = None,
+) -> Iterator[tuple[str, int]]:
+    """
+    Renders rows lazily as (page_text, row_count) pages of page_size rows.
+    Without widths, the first sample_size rows are read ahead to size the columns.
+    Closing the iterator closes rows if it is a generator, and source: the
+    streaming query rows are formatted from (e.g. momentum_db.iter_habits).
+    """
+    page_size = page_size or get_page_size()
+    rows_iter = iter(rows)
+    try:
+        sample: List[Sequence[Any]] = []
+        if widths is None:
+            sample = list(itertools.islice(rows_iter, sample_size))
+            widths = sample_widths(headers, sample)
+        pending = itertools.chain(sample, rows_iter)
+        while page := list(itertools.islice(pending, page_size)):
+            yield render_table(headers, page, widths), len(page)
+    finally:
+        # Stopping early releases a streaming source (and its connection) now.
+        # Closing a map or generator expression would not close the query it
+        # reads from until garbage collection, hence the explicit source.
+        for iterator in (rows_iter, source):
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+
+def show_paged_table(
+    rows: Iterable[Sequence[Any]],
+    headers: Sequence[str],
+    page_size: Optional[int] = None,
+    widths: Optional[Sequence[int]] = None,
+    source: Optional[Iterator[Any]] = None,
+) -> int:
+    """
+    Prints rows a page at a time, asking before each further page; the user can
+    stop early with "q". Prints nothing for no rows. Returns the rows shown.
+    The source generator rows are built from is closed when printing stops.
+    """
+    pages = iter_pages(rows, headers, page_size, widths, source=source)
+    shown = 0
+    page = next(pages, None)
+    while page is not None:
+        text, count = page
+        print(text)
+        shown += count
+        page = next(pages, None)
+        if page is None:
+            break
+        answer = input(f"Rows 1-{shown} shown. Press Enter for more, or q to stop: ")
+        if answer.strip().lower() == "q":
+            pages.close()
+            break
+    return shown
@@ -0,0 +1,193 @@
+import datetime
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+
+# Design rationale: every period rule (duplicate checks, streaks, rates, goals,
+# exports) maps dates to integer period keys here, using arithmetic on epoch days
+# instead of weekday loops. Consecutive periods always have consecutive keys, so
+# streak logic only ever compares integers.
+#
+# Supported frequencies:
+#   "daily"    one completion per day
+#   "weekly"   one completion per Sunday-Saturday week
+#   "monthly"  one completion per calendar month
+#   "N/week"   N completions (on different days) per Sunday-Saturday week, 2 <= N <= 6
+#
+# The N/week quota is checked per calendar week, not over a sliding 7-day window:
+# a streak counts whole periods, and calendar weeks keep one key per period, the
+# same week boundaries "weekly" habits use and the same answer for every caller.
+
+EPOCH = datetime.date(1970, 1, 1)  # a Thursday
+_EPOCH_ORDINAL = EPOCH.toordinal()
+# Epoch day 3 (1970-01-04) is a Sunday, so shifting by 4 starts weeks on Sundays.
+_SUNDAY_OFFSET = 4
+
+FREQUENCIES = ("daily", "weekly", "monthly")
+MIN_TIMES_PER_WEEK = 2
+MAX_TIMES_PER_WEEK = 6
+
+# Rolling completion-rate windows, in periods of each unit.
+RATE_WINDOWS = {"day": 28, "week": 4, "month": 3}
+
+_TIMES_PER_WEEK = re.compile(r"^([2-6])/week$")
+
+
+def times_per_week(n: int) -> str:
+    """Returns the frequency string for a habit done n times per week."""
+    if not MIN_TIMES_PER_WEEK <= n <= MAX_TIMES_PER_WEEK:
+        raise ValueError(
+            f"Times per week must be between {MIN_TIMES_PER_WEEK} and {MAX_TIMES_PER_WEEK}."
+        )
+    return f"{n}/week"
+
+
+def parse_frequency(frequency: Optional[str]) -> Optional[Tuple[str, int]]:
+    """
+    Returns (unit, quota) for a frequency, or None if it is not supported.
+
+    Example:
+        parse_frequency("weekly") -> ("week", 1)
+        parse_frequency("3/week") -> ("week", 3)
+    """
+    if frequency == "daily":
+        return "day", 1
+    if frequency == "weekly":
+        return "week", 1
+    if frequency == "monthly":
+        return "month", 1
+    match = _TIMES_PER_WEEK.match(frequency or "")
+    if match:
+        return "week", int(match.group(1))
+    return None
+
+
+def is_valid_frequency(frequency: Optional[str]) -> bool:
+    """True if the frequency string is supported."""
+    return parse_frequency(frequency) is not None
+
+
+def _as_date(d) -> datetime.date:
+    return d.date() if isinstance(d, datetime.datetime) else d
+
+
+def epoch_day(d) -> int:
+    """Days since 1970-01-01 for a date or datetime."""
+    return _as_date(d).toordinal() - _EPOCH_ORDINAL
+
+
+def day_key(d) -> int:
+    return epoch_day(d)
+
+
+def week_key(d) -> int:
+    """Sunday-start week number; changes on every Sunday."""
+    return (epoch_day(d) + _SUNDAY_OFFSET) // 7
+
+
+def month_key(d) -> int:
+    d = _as_date(d)
+    return d.year * 12 + d.month - 1
+
+
+def unit_key(d, unit: str) -> int:
+    """Period key of a date for a unit ("day", "week" or "month")."""
+    if unit == "week":
+        return week_key(d)
+    if unit == "month":
+        return month_key(d)
+    return day_key(d)
+
+
+def period_key(d, frequency: str) -> int:
+    """Period key of a date for a habit frequency (daily habits default to days)."""
+    parsed = parse_frequency(frequency)
+    return unit_key(d, parsed[0] if parsed else "day")
+
+
+def key_start(key: int, unit: str) -> datetime.date:
+    """First date of the period with the given key."""
+    if unit == "week":
+        return datetime.date.fromordinal(key * 7 - _SUNDAY_OFFSET + _EPOCH_ORDINAL)
+    if unit == "month":
+        return datetime.date(key // 12, key % 12 + 1, 1)
+    return datetime.date.fromordinal(key + _EPOCH_ORDINAL)
+
+
+def key_end(key: int, unit: str) -> datetime.date:
+    """Last date of the period with the given key."""
+    return key_start(key + 1, unit) - datetime.timedelta(days=1)
+
+
+def period_bounds(d, frequency: str) -> Tuple[datetime.datetime, datetime.datetime]:
+    """
+    Returns the [start, end] datetimes of the period containing d, suitable for
+    inclusive range queries on completion timestamps.
+    """
+    parsed = parse_frequency(frequency)
+    unit = parsed[0] if parsed else "day"
+    key = unit_key(d, unit)
+    start = datetime.datetime.combine(key_start(key, unit), datetime.time.min)
+    end = datetime.datetime.combine(key_end(key, unit), datetime.time.max)
+    return start, end
+
+
+def week_start(d) -> datetime.date:
+    """Sunday that starts the week containing d."""
+    return key_start(week_key(d), "week")
+
+
+def completed_period_keys(dates: Iterable, frequency: str) -> List[int]:
+    """
+    Sorted keys of the periods in which the habit met its quota.
+    Multiple completions on one day count once.
+    """
+    parsed = parse_frequency(frequency)
+    if not parsed:
+        return []
+    unit, quota = parsed
+    days = {_as_date(d) for d in dates}
+    if quota == 1:
+        return sorted({unit_key(d, unit) for d in days})
+    per_period = Counter(unit_key(d, unit) for d in days)
+    return sorted(key for key, count in per_period.items() if count >= quota)
+
+
+def longest_run(keys: List[int]) -> int:
+    """Longest run of consecutive integers in a sorted list of distinct keys."""
+    longest = current = 0
+    previous = None
+    for key in keys:
+        current = current + 1 if previous is not None and key == previous + 1 else 1
+        longest = max(longest, current)
+        previous = key
+    return longest
+
+
+def trailing_run(keys: List[int]) -> int:
+    """Length of the run of consecutive keys ending at the last key."""
+    run = 0
+    for i in range(len(keys) - 1, -1, -1):
+        if run and keys[i] != keys[i + 1] - 1:
+            break
+        run += 1
+    return run
+
+
+def rate_window(frequency: str) -> int:
+    """Number of periods in the rolling completion-rate window (0 if unsupported)."""
+    parsed = parse_frequency(frequency)
+    return RATE_WINDOWS[parsed[0]] if parsed else 0
+
+
+def expected_per_window(frequency: str, days: int) -> int:
+    """Completions a habit should reach over a span of days (at least 1)."""
+    parsed = parse_frequency(frequency)
+    if not parsed:
+        return days
+    unit, quota = parsed
+    if unit == "week":
+        return max(1, days // 7) * quota
+    if unit == "month":
+        return max(1, days // 30)
+    return days
@@ -0,0 +1,112 @@
+import datetime
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+
+from . import momentum_db as db
+from .habit import Habit
+
+# Design rationale: the menu spends most of its time waiting for a keypress, so a
+# daemon thread fills the persistent analytics cache meanwhile. It goes through
+# habit_analysis.get_metrics_for_habits, the same path the analysis screens use,
+# so whatever it stores is validated by the usual write-version check and a habit
+# changed in the meantime is simply recomputed on demand. Work is done in small
+# batches, most recently used habits first, and stops at the next batch boundary
+# when cancelled.
+
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_PAUSE = 0.05  # seconds between batches, leaving the GIL to the menu
+_EPOCH = datetime.datetime.min
+
+
+def _last_used(habit: Habit) -> datetime.datetime:
+    """When the habit was last completed, reactivated or created."""
+    return max(
+        habit.last_completed or _EPOCH,
+        habit.reactivated_at or _EPOCH,
+        habit.created_at or _EPOCH,
+    )
+
+
+def habits_by_recent_use(db_name: str = db.DB_NAME) -> List[Habit]:
+    """Active habits, most recently completed (or created) first."""
+    habits = db.get_all_habits(active_only=True, db_name=db_name)
+    return sorted(habits, key=lambda h: (_last_used(h), h.id), reverse=True)
+
+
+class AnalyticsWarmer:
+    """
+    Precomputes today's analytics of every active habit into the analytics cache
+    on a background thread.
+
+    Example:
+        warmer = AnalyticsWarmer("momentum.db").start()
+        ...
+        warmer.cancel()
+    """
+
+    def __init__(
+        self,
+        db_name: str = db.DB_NAME,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        pause: float = DEFAULT_PAUSE,
+    ):
+        self.db_name = db_name
+        self.batch_size = batch_size
+        self.pause = pause
+        self.warmed = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def warm(self) -> int:
+        """
+        Fills the cache batch by batch until done or cancelled; returns the number
+        of habits warmed. Databases that are missing or unreadable are skipped.
+        """
+        if not os.path.exists(self.db_name):
+            return 0
+        from .habit_analysis import get_metrics_for_habits
+
+        try:
+            habits = habits_by_recent_use(self.db_name)
+            for i in range(0, len(habits), self.batch_size):
+                if self._stop.is_set():
+                    break
+                batch = habits[i : i + self.batch_size]
+                get_metrics_for_habits(batch, self.db_name)
+                self.warmed += len(batch)
+                if self._stop.wait(self.pause):
+                    break
+        except sqlite3.Error:
+            pass  # busy or locked: the screens compute on demand as before
+        return self.warmed
+
+    def start(self) -> "AnalyticsWarmer":
+        """Starts warming on a daemon thread; returns self."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.warm, name="momentum-analytics-warmer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def cancel(self, timeout: Optional[float] = 1.0) -> None:
+        """Stops after the current batch and waits up to timeout seconds for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def start_warmer(db_name: str) -> Optional[AnalyticsWarmer]:
+    """
+    Starts an AnalyticsWarmer for db_name unless $MOMENTUM_PRECOMPUTE is "0".
+    Returns the running warmer, or None when precomputation is disabled.
+    """
+    if os.getenv("MOMENTUM_PRECOMPUTE", "1") == "0":
+        return None
+    return AnalyticsWarmer(db_name).start()
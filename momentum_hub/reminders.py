@@ -0,0 +1,286 @@
+import argparse
+import datetime
+import heapq
+import itertools
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import momentum_db as db
+from . import periods
+from .habit import Habit
+
+# Design rationale: every (habit, reminder kind) pair is one entry in a min-heap
+# keyed by its next fire time. Rescheduling pushes a new entry and marks the old
+# one dead instead of searching the heap, so each change costs O(log n). Changes
+# made elsewhere are picked up by diffing the per-habit write versions maintained
+# by database triggers, so a reload only refetches the habits that changed.
+
+REMINDER_KINDS = (("morning", "reminder_time"), ("evening", "evening_reminder_time"))
+DEFAULT_RELOAD_INTERVAL = 60  # seconds between checks for changed habits
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+class Reminder(NamedTuple):
+    habit_id: int
+    habit_name: str
+    kind: str  # "morning" or "evening"
+    fire_at: datetime.datetime
+
+    @property
+    def message(self) -> str:
+        return f"Time for '{self.habit_name}' ({self.kind} reminder)"
+
+
+class StdoutSink:
+    """Prints reminders to a stream (default: stdout)."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def send(self, reminder: Reminder) -> None:
+        print(reminder.message, file=self.stream or sys.stdout, flush=True)
+
+
+class LogFileSink:
+    """Appends one timestamped line per reminder to a log file."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, reminder: Reminder) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(f"{reminder.fire_at:%Y-%m-%d %H:%M} {reminder.message}\n")
+
+
+class CommandSink:
+    """
+    Runs a local command per reminder with the message as its last argument.
+
+    Example:
+        CommandSink(["notify-send", "Momentum Hub"])
+    """
+
+    def __init__(self, command: Sequence[str], timeout: float = 10):
+        self.command = list(command)
+        self.timeout = timeout
+
+    def send(self, reminder: Reminder) -> None:
+        try:
+            subprocess.run(
+                [*self.command, reminder.message], check=False, timeout=self.timeout
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Reminder command failed: {e}", file=sys.stderr)
+
+
+def parse_reminder_time(value: Optional[str]) -> Optional[datetime.time]:
+    """Parses an HH:MM reminder time; returns None when unset or invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, "%H:%M").time()
+    except ValueError:
+        return None
+
+
+def next_fire_time(at: datetime.time, now: datetime.datetime) -> datetime.datetime:
+    """The first moment strictly after now whose clock time is `at`."""
+    fire_at = datetime.datetime.combine(now.date(), at)
+    return fire_at if fire_at > now else fire_at + _ONE_DAY
+
+
+class ReminderScheduler:
+    """
+    Schedules the morning and evening reminders of all active habits and sends the
+    due ones to a sink (any object with a send(reminder) method). Reminders of
+    habits already completed in their current period are skipped.
+
+    Example:
+        scheduler = ReminderScheduler("momentum.db", StdoutSink())
+        scheduler.run()
+    """
+
+    def __init__(
+        self,
+        db_name: str = db.DB_NAME,
+        sink=None,
+        clock: Callable[[], datetime.datetime] = datetime.datetime.now,
+    ):
+        self.db_name = db_name
+        self.sink = sink or StdoutSink()
+        self.clock = clock
+        self._heap: List[list] = []  # [fire_at, sequence, key]; key None = dead
+        self._entries: Dict[Tuple[int, str], list] = {}
+        self._times: Dict[Tuple[int, str], datetime.time] = {}
+        self._habits: Dict[int, Habit] = {}
+        self._versions: Dict[int, int] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _push(self, key: Tuple[int, str], fire_at: datetime.datetime) -> None:
+        self._remove(key)
+        entry = [fire_at, next(self._sequence), key]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _remove(self, key: Tuple[int, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry[-1] = None
+            # Drop dead entries once they outnumber the live ones
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._heap = [e for e in self._heap if e[-1] is not None]
+                heapq.heapify(self._heap)
+
+    def schedule(self, habit: Habit, now: Optional[datetime.datetime] = None) -> None:
+        """Adds, moves or removes the reminders of one habit."""
+        now = now or self.clock()
+        self._habits[habit.id] = habit
+        for kind, attribute in REMINDER_KINDS:
+            key = (habit.id, kind)
+            at = (
+                parse_reminder_time(getattr(habit, attribute))
+                if habit.is_active
+                else None
+            )
+            if at is None:
+                self._remove(key)
+                self._times.pop(key, None)
+            elif self._times.get(key) != at or key not in self._entries:
+                self._times[key] = at
+                self._push(key, next_fire_time(at, now))
+
+    def unschedule(self, habit_id: int) -> None:
+        """Removes all reminders of a habit."""
+        for kind, _ in REMINDER_KINDS:
+            self._remove((habit_id, kind))
+            self._times.pop((habit_id, kind), None)
+        self._habits.pop(habit_id, None)
+
+    def refresh(self, now: Optional[datetime.datetime] = None) -> int:
+        """
+        Reloads the habits whose write version changed since the last load (all of
+        them on the first call) and drops deleted ones. Returns the number reloaded.
+        """
+        versions = db.get_habit_versions(self.db_name)
+        changed = [hid for hid, v in versions.items() if self._versions.get(hid) != v]
+        for habit_id in set(self._versions) - set(versions):
+            self.unschedule(habit_id)
+        for habit in db.get_habits_by_ids(changed, self.db_name):
+            self.schedule(habit, now)
+        self._versions = versions
+        return len(changed)
+
+    def load(self, now: Optional[datetime.datetime] = None) -> int:
+        """Loads all habits from scratch; returns the number of reminders scheduled."""
+        self._heap, self._entries, self._times = [], {}, {}
+        self._habits, self._versions = {}, {}
+        self.refresh(now)
+        return len(self)
+
+    def next_fire_time(self) -> Optional[datetime.datetime]:
+        """When the earliest scheduled reminder fires, or None if none is scheduled."""
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def _completed_this_period(self, habit: Habit, now: datetime.datetime) -> bool:
+        start, end = periods.period_bounds(now, habit.frequency)
+        if habit.reactivated_at and habit.reactivated_at > start:
+            start = habit.reactivated_at
+        parsed = periods.parse_frequency(habit.frequency)
+        quota = parsed[1] if parsed else 1
+        if quota > 1:
+            # N/week habits take one completion a day (as add_completion enforces),
+            # so there is nothing to remind about once today is done
+            day_start, day_end = periods.period_bounds(now, "daily")
+            if db.count_completions_in_range(
+                habit.id, max(day_start, start), day_end, self.db_name
+            ):
+                return True
+        done = db.count_completions_in_range(habit.id, start, end, self.db_name)
+        return done >= quota
+
+    def run_pending(self, now: Optional[datetime.datetime] = None) -> List[Reminder]:
+        """
+        Sends every reminder due at or before now, reschedules each for its next
+        day and returns the reminders that were sent.
+        """
+        now = now or self.clock()
+        sent = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, _, key = heapq.heappop(self._heap)
+            if key is None:
+                continue
+            del self._entries[key]
+            self._push(key, next_fire_time(self._times[key], now))
+            habit = self._habits[key[0]]
+            if self._completed_this_period(habit, now):
+                continue
+            reminder = Reminder(habit.id, habit.name, key[1], fire_at)
+            self.sink.send(reminder)
+            sent.append(reminder)
+        return sent
+
+    def run(
+        self,
+        stop: Optional[threading.Event] = None,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+    ) -> None:
+        """Sends reminders until stop is set, checking for changed habits periodically."""
+        stop = stop or threading.Event()
+        self.load()
+        next_reload = time.monotonic() + reload_interval
+        while not stop.is_set():
+            self.run_pending()
+            wait = next_reload - time.monotonic()
+            next_fire = self.next_fire_time()
+            if next_fire is not None:
+                wait = min(wait, (next_fire - self.clock()).total_seconds())
+            if stop.wait(max(0.0, wait)):
+                break
+            if time.monotonic() >= next_reload:
+                self.refresh()
+                next_reload = time.monotonic() + reload_interval
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Send Momentum Hub habit reminders at their reminder times"
+    )
+    parser.add_argument("--db", dest="db_name", default=db.DB_NAME)
+    sinks = parser.add_mutually_exclusive_group()
+    sinks.add_argument("--log-file", help="Append reminders to this file")
+    sinks.add_argument(
+        "--command", help="Run this command per reminder, message appended"
+    )
+    parser.add_argument(
+        "--reload-interval",
+        type=float,
+        default=DEFAULT_RELOAD_INTERVAL,
+        help="Seconds between checks for changed habits",
+    )
+    args = parser.parse_args(argv)
+
+    if args.log_file:
+        sink = LogFileSink(args.log_file)
+    elif args.command:
+        sink = CommandSink(shlex.split(args.command))
+    else:
+        sink = StdoutSink()
+    scheduler = ReminderScheduler(args.db_name, sink)
+    try:
+        scheduler.run(reload_interval=args.reload_interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
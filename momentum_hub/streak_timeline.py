@@ -0,0 +1,119 @@
+import datetime
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Tuple
+
+from . import periods
+
+# Design rationale: a habit's history is stored as runs of consecutive completed
+# periods, [(start, end), ...], plus prefix aggregates over those runs. Any "as of
+# date X" question then becomes a binary search over the runs instead of a replay
+# of the full completion history.
+
+
+def period_index(d: datetime.date, frequency: str) -> int:
+    """Maps a date to a consecutive integer period number (see periods.period_key)."""
+    return periods.period_key(d, frequency)
+
+
+class StreakTimeline:
+    """
+    Run-length index of a habit's completed periods.
+    Queries have period granularity: for weekly habits a completion later in the
+    same week as as_of already counts towards that week.
+
+    Example:
+        timeline = StreakTimeline.from_dates(dates, "daily")
+        timeline.current_streak(date(2026, 1, 10)) -> 3
+    """
+
+    def __init__(self, runs: List[Tuple[int, int]], frequency: str):
+        self.frequency = frequency
+        self.runs = runs
+        self._starts = [start for start, _ in runs]
+        # _longest[i]: longest run among runs[0..i]
+        # _completed[i]: number of completed periods in runs[0..i]
+        self._longest: List[int] = []
+        self._completed: List[int] = []
+        longest = completed = 0
+        for start, end in runs:
+            longest = max(longest, end - start + 1)
+            completed += end - start + 1
+            self._longest.append(longest)
+            self._completed.append(completed)
+
+    @classmethod
+    def from_dates(
+        cls, dates: Iterable[datetime.date], frequency: str
+    ) -> "StreakTimeline":
+        """Builds the timeline in one pass over the sorted completed periods."""
+        runs: List[Tuple[int, int]] = []
+        for p in periods.completed_period_keys(dates, frequency):
+            if runs and runs[-1][1] == p - 1:
+                runs[-1] = (runs[-1][0], p)
+            else:
+                runs.append((p, p))
+        return cls(runs, frequency)
+
+    def _last_run(self, p: int) -> int:
+        """Index of the last run starting at or before period p (-1 if none)."""
+        return bisect_right(self._starts, p) - 1
+
+    def _completed_up_to(self, p: int) -> int:
+        """Number of completed periods <= p."""
+        i = self._last_run(p)
+        if i < 0:
+            return 0
+        start, end = self.runs[i]
+        before = self._completed[i - 1] if i > 0 else 0
+        return before + min(end, p) - start + 1
+
+    def current_streak(self, as_of: datetime.date) -> int:
+        """
+        Streak standing on the given date. The period containing as_of does not
+        break the streak while it is still open, so a run ending in the previous
+        period still counts.
+        """
+        p = period_index(as_of, self.frequency)
+        i = self._last_run(p)
+        if i < 0:
+            return 0
+        start, end = self.runs[i]
+        if end >= p:
+            return p - start + 1
+        if end == p - 1:
+            return end - start + 1
+        return 0
+
+    def longest_streak(self, as_of: Optional[datetime.date] = None) -> int:
+        """Longest streak achieved up to and including as_of (default: ever)."""
+        if not self.runs:
+            return 0
+        if as_of is None:
+            return self._longest[-1]
+        p = period_index(as_of, self.frequency)
+        i = self._last_run(p)
+        if i < 0:
+            return 0
+        start, end = self.runs[i]
+        before = self._longest[i - 1] if i > 0 else 0
+        return max(before, min(end, p) - start + 1)
+
+    def completion_rate(self, as_of: datetime.date) -> float:
+        """Completion rate over the rolling window (see periods.RATE_WINDOWS) ending at as_of."""
+        window = periods.rate_window(self.frequency)
+        if not window:
+            return 0.0
+        p = period_index(as_of, self.frequency)
+        count = self._completed_up_to(p) - self._completed_up_to(p - window)
+        return count / window
+
+    def snapshot(self, as_of: datetime.date) -> dict:
+        """
+        Returns: {'current_streak': int, 'longest_streak': int, 'completion_rate': float}
+        as they stood on the given date.
+        """
+        return {
+            "current_streak": self.current_streak(as_of),
+            "longest_streak": self.longest_streak(as_of),
+            "completion_rate": self.completion_rate(as_of),
+        }
@@ -0,0 +1,174 @@
+import datetime
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from . import periods
+
+# Design rationale: trend analytics are generators over a date-ordered stream of
+# completions (e.g. momentum_db.iter_completions). Each day is visited once and
+# only a ring buffer as long as the widest window is kept, so reports over
+# multi-year histories run in one pass and constant memory.
+
+DEFAULT_WINDOWS = (7, 28, 90)
+DEFAULT_HALF_LIFE = 14  # days for an EWMA weight to halve
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+def _as_date(d) -> datetime.date:
+    return d.date() if isinstance(d, datetime.datetime) else d
+
+
+def completion_days(completions: Iterable) -> Iterator[datetime.date]:
+    """Collapses date-ordered completions into distinct completion days."""
+    last = None
+    for c in completions:
+        day = _as_date(c)
+        if day != last:
+            yield day
+            last = day
+
+
+def day_flags(
+    completions: Iterable,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+) -> Iterator[Tuple[datetime.date, bool]]:
+    """
+    Yields (date, completed) for every calendar day from start (default: first
+    completion) to end (default: today), merging the ordered completion stream.
+    """
+    days = completion_days(completions)
+    next_day = next(days, None)
+    if start is None:
+        if next_day is None:
+            return
+        start = next_day
+    end = end or datetime.date.today()
+    while next_day is not None and next_day < start:
+        next_day = next(days, None)
+    current = start
+    while current <= end:
+        done = next_day == current
+        if done:
+            next_day = next(days, None)
+        yield current, done
+        current += _ONE_DAY
+
+
+def trend_report(
+    completions: Iterable,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+    half_life: float = DEFAULT_HALF_LIFE,
+) -> Iterator[dict]:
+    """
+    One-pass daily trend rows: rolling completion rates for each window (completed
+    days in the last w days / w) and an exponentially weighted consistency score.
+    Yields: {'date': date, 'done': bool, 'rates': {w: float}, 'ewma': float}
+
+    Example:
+        for row in trend_report(db.iter_completions(1)):
+            print(row["date"], row["rates"][28])
+    """
+    size = max(windows)
+    ring = [False] * size  # last `size` day flags, indexed by day number % size
+    counts = {w: 0 for w in windows}
+    alpha = 1 - 0.5 ** (1 / half_life)
+    score = 0.0
+    for i, (day, done) in enumerate(day_flags(completions, start, end)):
+        for w in windows:
+            if i >= w and ring[(i - w) % size]:
+                counts[w] -= 1
+            if done:
+                counts[w] += 1
+        ring[i % size] = done
+        score += alpha * (done - score)
+        yield {
+            "date": day,
+            "done": done,
+            "rates": {w: counts[w] / w for w in windows},
+            "ewma": score,
+        }
+
+
+def rolling_rates(
+    completions: Iterable,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+) -> Iterator[Tuple[datetime.date, dict]]:
+    """Yields (date, {window: rate}) for every day; see trend_report()."""
+    for row in trend_report(completions, start, end, windows):
+        yield row["date"], row["rates"]
+
+
+def ewma_scores(
+    completions: Iterable,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    half_life: float = DEFAULT_HALF_LIFE,
+) -> Iterator[Tuple[datetime.date, float]]:
+    """Yields (date, consistency score in [0, 1]) for every day; see trend_report()."""
+    for row in trend_report(completions, start, end, half_life=half_life):
+        yield row["date"], row["ewma"]
+
+
+def _completed_keys(completions: Iterable, frequency: str) -> Iterator[int]:
+    """Streams the keys of periods that met the habit's quota, in order."""
+    unit, quota = periods.parse_frequency(frequency)
+    key, count = None, 0
+    for day in completion_days(completions):
+        day_key = periods.unit_key(day, unit)
+        if day_key != key:
+            if key is not None and count >= quota:
+                yield key
+            key, count = day_key, 0
+        count += 1
+    if key is not None and count >= quota:
+        yield key
+
+
+def streak_breaks(
+    completions: Iterable,
+    frequency: str,
+    as_of: Optional[datetime.date] = None,
+) -> Iterator[dict]:
+    """
+    Yields an event each time a streak ends, in date order.
+    A trailing streak counts as broken only if as_of is given and at least one full
+    period has passed since it ended (the current period is still open).
+    Yields: {'length': int, 'start': date, 'end': date, 'broken_on': date,
+             'missed_periods': int}
+
+    Example:
+        daily completions on Jan 1-3 and Jan 6 ->
+        {'length': 3, 'start': date(2026, 1, 1), 'end': date(2026, 1, 3),
+         'broken_on': date(2026, 1, 4), 'missed_periods': 2}
+    """
+    parsed = periods.parse_frequency(frequency)
+    if not parsed:
+        return
+    unit = parsed[0]
+
+    def event(run_start: int, run_end: int, next_key: int) -> dict:
+        return {
+            "length": run_end - run_start + 1,
+            "start": periods.key_start(run_start, unit),
+            "end": periods.key_end(run_end, unit),
+            "broken_on": periods.key_start(run_end + 1, unit),
+            "missed_periods": next_key - run_end - 1,
+        }
+
+    run_start = previous = None
+    for key in _completed_keys(completions, frequency):
+        if previous is not None and key != previous + 1:
+            yield event(run_start, previous, key)
+            run_start = key
+        elif previous is None:
+            run_start = key
+        previous = key
+    if previous is not None and as_of is not None:
+        current = periods.unit_key(as_of, unit)
+        if current - previous > 1:
+            yield event(run_start, previous, current)
@@ -0,0 +1,193 @@
+import datetime
+import shutil
+import sqlite3
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from . import habit_analysis as analysis
+from . import momentum_db as db
+from .habit import Habit
+from .paged_table import render_row, render_table
+
+# Design rationale: the dashboard polls PRAGMA data_version on its own connection
+# every tick, which costs no table read and only changes when another connection
+# commits. When it does, the per-habit write versions maintained by database
+# triggers are diffed against the last tick (as the reminder scheduler does), so
+# only habits that gained, lost or edited completions are refetched and
+# recomputed. Those are more than a watermark on completions.id would catch,
+# since deletes and habit edits bump the version too. On a terminal the changed
+# rows are rewritten in place with cursor moves; the whole table is redrawn when
+# rows appear or disappear, or when it is taller than the terminal (it scrolled,
+# so the cursor positions no longer match). Every row is recomputed when the day
+# changes, because completion rates depend on today's date.
+
+DEFAULT_INTERVAL = 1.0  # seconds between data_version polls
+HEADERS = ("ID", "Habit", "Frequency", "Streak", "Longest", "Rate", "Total", "Last")
+WIDTHS = (4, 24, 10, 6, 7, 5, 5, 16)
+RIGHT = (True, False, False, True, True, True, True, False)
+TITLE_LINES = 1
+HEADER_LINES = 3  # top border, headers, "=" border
+
+
+def dashboard_row(habit: Habit, metrics: dict) -> Tuple:
+    """The dashboard cells of one habit."""
+    last = (
+        habit.last_completed.strftime("%Y-%m-%d %H:%M") if habit.last_completed else "-"
+    )
+    return (
+        habit.id,
+        habit.name,
+        habit.frequency,
+        habit.streak,
+        metrics["longest_streak"],
+        f"{metrics['completion_rate']:.0%}",
+        metrics["total_completions"],
+        last,
+    )
+
+
+class WatchDashboard:
+    """
+    A live table of the active habits that redraws only the rows whose data
+    changed since the previous tick.
+
+    Example:
+        dashboard = WatchDashboard("momentum.db")
+        dashboard.run(interval=1.0)
+    """
+
+    def __init__(
+        self,
+        db_name: str = db.DB_NAME,
+        stream: Optional[TextIO] = None,
+        clock: Callable[[], datetime.datetime] = datetime.datetime.now,
+    ):
+        self.db_name = db_name
+        self.stream = stream or sys.stdout
+        self.clock = clock
+        self.rows: Dict[int, Tuple] = {}
+        self.order: List[int] = []  # habit ids in display order
+        self._versions: Dict[int, int] = {}
+        self._collection_version: Optional[tuple] = None
+        self._data_version: Optional[int] = None
+        self._day: Optional[datetime.date] = None
+        self._stamp_conn = sqlite3.connect(
+            db_name, uri=db_name.startswith("file:"), check_same_thread=False
+        )
+
+    def close(self) -> None:
+        self._stamp_conn.close()
+
+    def refresh(self) -> List[int]:
+        """
+        Recomputes the rows of habits changed since the last call (every row on
+        the first call and when the day changes) and drops deactivated or deleted
+        ones. Returns the ids of the rows that changed; empty if nothing was
+        committed in between.
+        """
+        data_version = self._stamp_conn.execute("PRAGMA data_version").fetchone()[0]
+        today = self.clock().date()
+        if data_version == self._data_version and today == self._day:
+            return []
+        # Recomputing stores metrics in the analytics cache, a commit of its own
+        # that moves data_version once after every change. The one-row collection
+        # version ignores cache writes, so those ticks skip the per-habit diff.
+        collection_version = db.get_collection_version(self.db_name)
+        if collection_version == self._collection_version and today == self._day:
+            self._data_version = data_version
+            return []
+        self._collection_version = collection_version
+        versions = db.get_habit_versions(self.db_name)
+        if today != self._day:
+            changed = list(versions)
+        else:
+            changed = [
+                hid for hid, v in versions.items() if self._versions.get(hid) != v
+            ]
+        gone = set(self._versions) - set(versions)
+        self._data_version, self._versions, self._day = data_version, versions, today
+        if not changed and not gone:
+            return []
+
+        habits = db.get_habits_by_ids(changed, self.db_name)
+        active = [habit for habit in habits if habit.is_active]
+        gone |= {habit.id for habit in habits if not habit.is_active}
+        metrics = analysis.get_metrics_for_habits(active, self.db_name, today)
+        removed = {hid for hid in gone if self.rows.pop(hid, None) is not None}
+        for habit in active:
+            self.rows[habit.id] = dashboard_row(habit, metrics[habit.id])
+        return sorted({habit.id for habit in active} | removed)
+
+    def _status(self, count: int) -> str:
+        return (
+            f"Updated {self.clock():%H:%M:%S}: {count} row(s) refreshed. "
+            "Press Ctrl+C to stop."
+        )
+
+    def _draw_all(self, count: int) -> None:
+        self.order = sorted(self.rows)
+        table = render_table(HEADERS, [self.rows[hid] for hid in self.order], WIDTHS)
+        prefix = "\x1b[H\x1b[2J" if self.stream.isatty() else ""
+        self.stream.write(
+            f"{prefix}Momentum Hub: watching {self.db_name}\n{table}\n"
+            f"{self._status(count)}\n"
+        )
+
+    def _fits_screen(self) -> bool:
+        """Whether the table and status line fit on the terminal without scrolling."""
+        status_line = 1 + TITLE_LINES + HEADER_LINES + 2 * len(self.order)
+        return status_line < shutil.get_terminal_size().lines
+
+    def _draw_rows(self, habit_ids: Sequence[int]) -> None:
+        lines = [render_row(self.rows[hid], WIDTHS, RIGHT) for hid in habit_ids]
+        if not self.stream.isatty():
+            self.stream.write("\n".join(lines + [self._status(len(lines))]) + "\n")
+            return
+        # Row i sits on terminal line 1 + TITLE_LINES + HEADER_LINES + 2i
+        first = 1 + TITLE_LINES + HEADER_LINES
+        moves = [
+            f"\x1b[{first + 2 * self.order.index(hid)};1H\x1b[2K{line}"
+            for hid, line in zip(habit_ids, lines)
+        ]
+        status_line = first + 2 * len(self.order)
+        moves.append(f"\x1b[{status_line};1H\x1b[2K{self._status(len(lines))}\n")
+        self.stream.write("".join(moves))
+
+    def tick(self) -> List[int]:
+        """Refreshes and redraws what changed; returns the changed habit ids."""
+        first_tick = self._data_version is None
+        changed = self.refresh()
+        if first_tick or sorted(self.rows) != self.order:
+            self._draw_all(len(changed))
+        elif changed and self.stream.isatty() and not self._fits_screen():
+            self._draw_all(len(changed))
+        elif changed:
+            self._draw_rows(changed)
+        self.stream.flush()
+        return changed
+
+    def run(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """Ticks every interval seconds until stop is set."""
+        stop = stop or threading.Event()
+        try:
+            while True:
+                self.tick()
+                if stop.wait(interval):
+                    break
+        finally:
+            self.close()
+
+
+def run_watch(db_name: str, interval: float = DEFAULT_INTERVAL) -> None:
+    """Runs the dashboard in the foreground until Ctrl+C."""
+    if interval <= 0:
+        raise ValueError("Interval must be positive.")
+    try:
+        WatchDashboard(db_name).run(interval)
+    except KeyboardInterrupt:
+        print()
@@ -0,0 +1,89 @@
+import datetime
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import analytics_cache, habit_analysis
+from momentum_hub.habit import Habit
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_analytics_cache.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def habit_with_history(tmp_db_path):
+    hid = db.add_habit(Habit(name="Read", frequency="daily"), db_name=tmp_db_path)
+    base = datetime.datetime(2026, 1, 1, 9, 0)
+    for i in range(3):
+        db.add_completion(hid, base + datetime.timedelta(days=i), tmp_db_path)
+    return tmp_db_path, hid
+
+
+class TestAnalyticsCache:
+    """Tests the persistent per-habit analytics cache."""
+
+    def test_warm_lookup_skips_history_scan(self, habit_with_history):
+        db_name, hid = habit_with_history
+        ref = datetime.date(2026, 1, 3)
+        cold = habit_analysis.get_habit_metrics(hid, db_name, ref)
+        assert cold["longest_streak"] == 3
+        assert cold["total_completions"] == 3
+
+        # Simulate a relaunch: drop every open connection first.
+        db.close_all_connections()
+        with patch("momentum_hub.habit_analysis.db.get_completions") as mock_get:
+            warm = habit_analysis.get_habit_metrics(hid, db_name, ref)
+        mock_get.assert_not_called()
+        assert warm == cold
+
+    def test_new_completion_invalidates_entry(self, habit_with_history):
+        db_name, hid = habit_with_history
+        ref = datetime.date(2026, 1, 4)
+        assert (
+            habit_analysis.get_habit_metrics(hid, db_name, ref)["longest_streak"] == 3
+        )
+        db.add_completion(hid, datetime.datetime(2026, 1, 4, 9, 0), db_name)
+        version, cached = analytics_cache.load(hid, db_name)
+        assert cached is None
+        assert (
+            habit_analysis.get_habit_metrics(hid, db_name, ref)["longest_streak"] == 4
+        )
+
+    def test_reference_date_change_recomputes_rate(self, habit_with_history):
+        db_name, hid = habit_with_history
+        rate_then = habit_analysis.calculate_completion_rate_for_habit(
+            hid, db_name, reference_date=datetime.date(2026, 1, 3)
+        )
+        rate_later = habit_analysis.calculate_completion_rate_for_habit(
+            hid, db_name, reference_date=datetime.date(2026, 3, 1)
+        )
+        assert rate_then == pytest.approx(3 / 28)
+        assert rate_later == 0.0
+
+    def test_schema_version_change_clears_cache(self, habit_with_history):
+        db_name, hid = habit_with_history
+        habit_analysis.get_habit_metrics(hid, db_name)
+        with sqlite3.connect(db_name) as conn:
+            conn.execute("PRAGMA user_version = 0")
+        db.init_db(db_name)
+        assert analytics_cache.load(hid, db_name)[1] is None
+
+    def test_uninitialised_database_bypasses_cache(self, tmp_path):
+        db_name = str(tmp_path / "bare.db")
+        assert analytics_cache.load(1, db_name) == (None, None)
+        assert analytics_cache.load_many([1], db_name) == {}
+
+    def test_bulk_metrics_match_single_lookups(self, habit_with_history):
+        db_name, hid = habit_with_history
+        other = db.add_habit(Habit(name="Blog", frequency="weekly"), db_name=db_name)
+        habits = db.get_all_habits(db_name=db_name)
+        ref = datetime.date(2026, 1, 3)
+        bulk = habit_analysis.get_metrics_for_habits(habits, db_name, ref)
+        assert bulk[hid] == habit_analysis.get_habit_metrics(hid, db_name, ref)
+        assert bulk[other]["total_completions"] == 0
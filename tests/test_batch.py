@@ -0,0 +1,171 @@
+import datetime
+import io
+import time
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import batch
+from momentum_hub.habit import Habit
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_batch.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def habit_id(tmp_db_path):
+    return db.add_habit(Habit(name="Read", frequency="daily"), db_name=tmp_db_path)
+
+
+def run(db_name, text, reader=batch.read_jsonl, transaction_size=100):
+    results = []
+    summary = batch.BatchRunner(db_name, transaction_size).run(
+        reader(io.StringIO(text)), results.append
+    )
+    return summary, results
+
+
+class TestReaders:
+    """Tests parsing JSONL and CSV command streams."""
+
+    def test_jsonl(self):
+        text = '# header\n{"op": "complete", "habit_id": 1}\n\n[1]\nnope\n'
+        commands = list(batch.read_jsonl(io.StringIO(text)))
+        assert commands[0] == (2, {"op": "complete", "habit_id": 1})
+        assert [line for line, _ in commands] == [2, 4, 5]
+        assert all(isinstance(c, ValueError) for _, c in commands[1:])
+
+    def test_csv_drops_empty_cells(self):
+        text = "op,habit_id,at,name\ncomplete,1,2026-01-05T08:00,\ncreate,,,Gym\n"
+        assert list(batch.read_csv(io.StringIO(text))) == [
+            (2, {"op": "complete", "habit_id": "1", "at": "2026-01-05T08:00"}),
+            (3, {"op": "create", "name": "Gym"}),
+        ]
+
+
+class TestBatchRunner:
+    """Tests applying commands with the usual validation."""
+
+    def test_operations_and_validation(self, tmp_db_path, habit_id):
+        text = "\n".join(
+            [
+                '{"op": "create", "name": "Gym", "frequency": "3/week"}',
+                '{"op": "create", "name": " ", "frequency": "daily"}',
+                '{"op": "create", "name": "Run", "frequency": "hourly"}',
+                f'{{"op": "update", "habit_id": {habit_id}, "notes": "books"}}',
+                f'{{"op": "update", "habit_id": {habit_id}, "reminder_time": "8am"}}',
+                f'{{"op": "add_goal", "habit_id": {habit_id}, '
+                '"target_completions": 20}',
+                f'{{"op": "deactivate", "habit_id": {habit_id}}}',
+                f'{{"op": "complete", "habit_id": {habit_id}}}',
+                f'{{"op": "reactivate", "habit_id": {habit_id}}}',
+                '{"op": "deactivate", "habit_id": 99}',
+                '{"op": "rename"}',
+            ]
+        )
+        summary, results = run(tmp_db_path, text)
+        assert [r["ok"] for r in results] == [
+            True,
+            False,
+            False,
+            True,
+            False,
+            True,
+            True,
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert results[2]["error"] == "Unsupported frequency 'hourly'."
+        assert results[7]["error"] == f"No active habit with ID {habit_id}."
+        assert results[9]["error"] == "No habit with ID 99."
+        assert summary == {"applied": 5, "failed": 6, "streaks_rebuilt": 1}
+
+        habit = db.get_habit(habit_id, tmp_db_path)
+        assert habit.notes == "books" and habit.reminder_time is None
+        assert habit.is_active and habit.reactivated_at is not None
+        assert db.get_habit(results[0]["habit_id"], tmp_db_path).frequency == "3/week"
+        assert db.get_goal(results[5]["goal_id"], tmp_db_path).target_completions == 20
+
+    def test_completions_replay_and_rebuild_streaks_once(self, tmp_db_path, habit_id):
+        lines = [
+            f'{{"op": "complete", "habit_id": {habit_id}, "at": "2026-01-0{d}T08:00"}}'
+            for d in (3, 1, 2, 2)
+        ]
+        with pytest.MonkeyPatch.context() as mp:
+            calls = []
+            mp.setattr(db, "update_streak", lambda hid, name: calls.append(hid))
+            summary, results = run(tmp_db_path, "\n".join(lines), transaction_size=2)
+        assert [r["ok"] for r in results] == [True, True, True, False]
+        # The duplicate is caught against the same transaction's earlier lines
+        assert results[3]["error"] == "This habit has already been completed."
+        assert calls == [habit_id] and summary["streaks_rebuilt"] == 1
+
+        # Rebuilding counts every completion, whichever batch wrote it
+        run(tmp_db_path, lines[0].replace("01-03", "01-04"))
+        habit = db.get_habit(habit_id, tmp_db_path)
+        assert habit.streak == 4
+        assert habit.last_completed == datetime.datetime(2026, 1, 4, 8)
+
+    def test_rejected_line_is_rolled_back_alone(self, tmp_db_path, habit_id):
+        runner = batch.BatchRunner(tmp_db_path)
+        original = runner._create
+
+        def create_then_fail(command):
+            original(command)
+            raise ValueError("rejected after writing")
+
+        runner._create = create_then_fail
+        results = []
+        runner.run(
+            batch.read_jsonl(
+                io.StringIO(
+                    '{"op": "create", "name": "Gym", "frequency": "daily"}\n'
+                    f'{{"op": "complete", "habit_id": {habit_id}}}\n'
+                )
+            ),
+            results.append,
+        )
+        assert [r["ok"] for r in results] == [False, True]
+        assert [h.name for h in db.get_all_habits(db_name=tmp_db_path)] == ["Read"]
+        assert len(db.get_completions(habit_id, tmp_db_path)) == 1
+
+    def test_wrong_types_fail_their_line_alone(self, tmp_db_path):
+        text = "\n".join(
+            [
+                '{"op": "create", "name": "A", "frequency": "daily"}',
+                '{"op": "create", "name": 5, "frequency": "daily"}',
+                '{"op": "create", "name": "B", "frequency": 7}',
+                '{"op": "create", "name": "C", "frequency": "daily", "notes": [1]}',
+                '{"op": "create", "name": "D", "frequency": "daily", "notes": null}',
+            ]
+        )
+        summary, results = run(tmp_db_path, text)
+        assert [r["ok"] for r in results] == [True, False, False, False, True]
+        assert results[1]["error"] == "'name' must be a string."
+        assert results[2]["error"] == "'frequency' must be a string."
+        assert summary["applied"] == 2
+        names = [h.name for h in db.get_all_habits(db_name=tmp_db_path)]
+        assert names == ["A", "D"]
+
+    def test_thousands_of_completions(self, tmp_db_path, habit_id):
+        start = datetime.datetime(2020, 1, 1, 8)
+        text = "\n".join(
+            f'{{"op": "complete", "habit_id": {habit_id}, '
+            f'"at": "{(start + datetime.timedelta(days=i)).isoformat()}"}}'
+            for i in range(2000)
+        )
+        began = time.perf_counter()
+        summary, _ = run(tmp_db_path, text)
+        assert summary["applied"] == 2000
+        assert time.perf_counter() - began < 20
+        assert db.get_habit(habit_id, tmp_db_path).streak == 2000
+
+    def test_invalid_transaction_size(self, tmp_db_path):
+        with pytest.raises(ValueError):
+            batch.BatchRunner(tmp_db_path, transaction_size=0)
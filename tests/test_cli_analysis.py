@@ -12,12 +12,16 @@ import momentum_hub.momentum_db as db
 from momentum_hub.cli_analysis import (
     analyze_best_worst_habit,
     analyze_by_periodicity,
+    analyze_co_completion,
     analyze_completion_history,
     analyze_goal_progress,
+    analyze_leaderboard,
     analyze_list_all_habits,
     analyze_longest_streak_all,
     analyze_longest_streak_one,
+    analyze_month_calendars,
     analyze_streak_history_grid,
+    analyze_year_heatmap,
 )
 from momentum_hub.habit import Habit
 
@@ -103,9 +107,7 @@ class TestAnalyzeLongestStreakOne:
     def test_analyze_longest_streak_one_success(self, sample_habits, capsys):
         db_name, hid1, hid2 = sample_habits
         habits = db.get_all_habits(active_only=True, db_name=db_name)
-        with patch(
-            "momentum_hub.cli_analysis._handle_habit_selection", return_value=habits[0]
-        ):
+        with patch("momentum_hub.cli_analysis.select_habit", return_value=habits[0]):
             with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
                 analyze_longest_streak_one(db_name)
         captured = capsys.readouterr()
@@ -121,9 +123,7 @@ class TestAnalyzeStreakHistoryGrid:
         # Add a completion to the habit
         now = datetime.datetime.now()
         db.add_completion(hid1, now, db_name)
-        with patch(
-            "momentum_hub.cli_analysis._handle_habit_selection", return_value=habits[0]
-        ):
+        with patch("momentum_hub.cli_analysis.select_habit", return_value=habits[0]):
             with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
                 analyze_streak_history_grid(db_name)
         captured = capsys.readouterr()
@@ -132,9 +132,7 @@ class TestAnalyzeStreakHistoryGrid:
     def test_analyze_streak_history_grid_weekly(self, sample_habits, capsys):
         db_name, hid1, hid2 = sample_habits
         habits = db.get_all_habits(active_only=True, db_name=db_name)
-        with patch(
-            "momentum_hub.cli_analysis._handle_habit_selection", return_value=habits[1]
-        ):
+        with patch("momentum_hub.cli_analysis.select_habit", return_value=habits[1]):
             with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
                 analyze_streak_history_grid(db_name)
         captured = capsys.readouterr()
@@ -179,14 +177,35 @@ class TestAnalyzeGoalProgress:
         goal = Goal(habit_id=hid1, target_period_days=28, target_completions=10)
         db.add_goal(goal, db_name)
         habits = db.get_all_habits(active_only=True, db_name=db_name)
-        with patch(
-            "momentum_hub.cli_analysis._handle_habit_selection", return_value=habits[0]
-        ):
+        with patch("momentum_hub.cli_analysis.select_habit", return_value=habits[0]):
             with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
                 analyze_goal_progress(db_name)
         captured = capsys.readouterr()
         assert "Progress" in captured.out
 
+    def test_analyze_goal_progress_shows_forecast(self, sample_habits, capsys):
+        from momentum_hub.goal import Goal
+
+        db_name, hid1, hid2 = sample_habits
+        today = datetime.datetime.now().replace(hour=0, minute=0)
+        db.add_goal(
+            Goal(
+                habit_id=hid1,
+                target_completions=2,
+                start_date=today,
+                end_date=today + datetime.timedelta(days=7),
+            ),
+            db_name,
+        )
+        db.add_goal(Goal(habit_id=hid2, target_period_days=28), db_name)
+        with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
+            analyze_goal_progress(db_name)
+        captured = capsys.readouterr()
+        assert "Chance to Reach" in captured.out
+        # No recent completions: the dated goal is forecast at 0%, the open one at "-"
+        assert "0%" in captured.out
+        assert " - " in captured.out
+
 
 class TestAnalyzeCompletionHistory:
     """Tests CLI analysis: completion history view."""
@@ -197,9 +216,7 @@ class TestAnalyzeCompletionHistory:
         now = datetime.datetime.now()
         db.add_completion(hid1, now, db_name)
         habits = db.get_all_habits(active_only=True, db_name=db_name)
-        with patch(
-            "momentum_hub.cli_analysis._handle_habit_selection", return_value=habits[0]
-        ):
+        with patch("momentum_hub.cli_analysis.select_habit", return_value=habits[0]):
             with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
                 analyze_completion_history(db_name)
         captured = capsys.readouterr()
@@ -208,12 +225,149 @@ class TestAnalyzeCompletionHistory:
     def test_analyze_completion_history_no_data(self, sample_habits):
         db_name, hid1, hid2 = sample_habits
         habits = db.get_all_habits(active_only=True, db_name=db_name)
-        with patch(
-            "momentum_hub.cli_analysis._handle_habit_selection", return_value=habits[0]
-        ):
+        with patch("momentum_hub.cli_analysis.select_habit", return_value=habits[0]):
             with patch("momentum_hub.cli_analysis.show_colored_message") as mock_show:
                 with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
                     analyze_completion_history(db_name)
         mock_show.assert_called_with(
             "No completions recorded yet for this habit.", color=Fore.YELLOW
         )
+
+
+class TestAnalyzeLeaderboard:
+    """Tests CLI analysis: habit leaderboard."""
+
+    def test_analyze_leaderboard_shows_top_and_bottom(self, sample_habits, capsys):
+        db_name, hid1, hid2 = sample_habits
+        db.add_completion(hid1, datetime.datetime.now(), db_name)
+        db.update_streak(hid1, db_name)
+        with patch("questionary.select") as mock_select:
+            mock_select.return_value.ask.return_value = "Current streak"
+            with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
+                analyze_leaderboard(db_name)
+        captured = capsys.readouterr()
+        assert "Top 2 by current streak" in captured.out
+        assert "Bottom 2 by current streak" in captured.out
+        assert captured.out.index("Daily Habit") < captured.out.index("Weekly Habit")
+
+    def test_analyze_leaderboard_category_filter(self, sample_habits, capsys):
+        from momentum_hub.category import Category
+
+        db_name, hid1, hid2 = sample_habits
+        category_id = db.add_category(Category(name="Health"), db_name)
+        habit = db.get_habit(hid2, db_name)
+        habit.category_id = category_id
+        db.update_habit(habit, db_name)
+        with patch("questionary.select") as mock_select:
+            mock_select.return_value.ask.side_effect = [
+                "Longest streak",
+                f"{category_id}. Health",
+            ]
+            with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
+                analyze_leaderboard(db_name)
+        captured = capsys.readouterr()
+        assert "Weekly Habit" in captured.out
+        assert "Daily Habit" not in captured.out
+
+    def test_analyze_leaderboard_cancel(self, sample_habits):
+        db_name, hid1, hid2 = sample_habits
+        with patch("questionary.select") as mock_select:
+            mock_select.return_value.ask.return_value = "Cancel"
+            with patch("momentum_hub.cli_analysis.show_colored_message") as mock_show:
+                with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
+                    analyze_leaderboard(db_name)
+        mock_show.assert_called_with("Operation cancelled.", color=Fore.YELLOW)
+
+
+class TestAnalyzeCoCompletion:
+    """Tests CLI analysis: habits done together."""
+
+    def test_shows_pair_table(self, sample_habits, capsys):
+        db_name, hid1, hid2 = sample_habits
+        now = datetime.datetime.now()
+        db.add_completion(hid1, now, db_name)
+        db.add_completion(hid2, now, db_name)
+        with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
+            analyze_co_completion(db_name)
+        captured = capsys.readouterr()
+        assert "Daily Habit + Weekly Habit" in captured.out
+        assert "Days Together" in captured.out
+
+    def test_no_overlap_message(self, sample_habits):
+        db_name, hid1, hid2 = sample_habits
+        with patch("momentum_hub.cli_analysis.show_colored_message") as mock_show:
+            with patch("momentum_hub.cli_analysis.press_enter_to_continue"):
+                analyze_co_completion(db_name)
+        mock_show.assert_called_with(
+            "Not enough completions to compare habits yet.", color=Fore.RED
+        )
+
+
+class TestCalendarViews:
+    """Tests CLI analysis: year heatmap and monthly calendars."""
+
+    def test_year_heatmap_marks_weeks_of_weekly_habit(self, sample_habits, capsys):
+        db_name, hid1, hid2 = sample_habits
+        db.add_completion(hid2, datetime.datetime.now(), db_name)
+        habit = db.get_habit(hid2, db_name)
+        with (
+            patch("questionary.select") as mock_select,
+            patch("momentum_hub.cli_analysis.select_habit", return_value=habit),
+            patch("momentum_hub.cli_analysis.press_enter_to_continue"),
+        ):
+            mock_select.return_value.ask.return_value = "One habit..."
+            analyze_year_heatmap(db_name)
+        # Single habits come from the habit picker, not from a flat list
+        choices = mock_select.call_args.kwargs["choices"]
+        assert choices == ["All habits", "One habit...", "Cancel"]
+        captured = capsys.readouterr()
+        assert "Sun " in captured.out
+        assert "Met " in captured.out
+        assert "Days with a completion: 1 of" in captured.out
+
+    def test_month_calendars_scroll(self, sample_habits, capsys):
+        db_name, hid1, hid2 = sample_habits
+        db.add_completion(hid1, datetime.datetime.now(), db_name)
+        with patch("questionary.select") as mock_select:
+            mock_select.return_value.ask.side_effect = [
+                "All habits",
+                "Earlier months",
+                "Later months",
+                "Back",
+            ]
+            analyze_month_calendars(db_name)
+        today = datetime.date.today()
+        captured = capsys.readouterr()
+        assert captured.out.count(f"{today:%B} {today.year}") == 2
+        scroll_choices = [c.kwargs["choices"] for c in mock_select.call_args_list[1:]]
+        assert scroll_choices[0] == ["Earlier months", "Back"]
+        assert "Later months" in scroll_choices[1]
+
+    def test_cancel_selection(self, sample_habits):
+        db_name, hid1, hid2 = sample_habits
+        with patch("questionary.select") as mock_select:
+            mock_select.return_value.ask.return_value = "Cancel"
+            with patch("momentum_hub.cli_analysis.show_colored_message") as mock_show:
+                with patch(
+                    "momentum_hub.cli_analysis.press_enter_to_continue"
+                ) as mock_press:
+                    analyze_year_heatmap(db_name)
+        mock_show.assert_called_with("Operation cancelled.", color=Fore.YELLOW)
+        mock_press.assert_called_once()
+
+    def test_analyze_completion_history_pages(self, sample_habits, capsys):
+        db_name, hid1, hid2 = sample_habits
+        start = datetime.datetime(2026, 1, 1, 8)
+        for day in range(5):
+            db.add_completion(hid1, start + datetime.timedelta(days=day), db_name)
+        habit = db.get_habit(hid1, db_name)
+        with (
+            patch("momentum_hub.cli_analysis.select_habit", return_value=habit),
+            patch("momentum_hub.cli_analysis.press_enter_to_continue"),
+            patch("momentum_hub.paged_table.get_page_size", return_value=2),
+            patch("builtins.input", side_effect=["", "q"]) as mock_input,
+        ):
+            analyze_completion_history(db_name)
+        out = capsys.readouterr().out
+        assert "2026-01-04 08:00" in out and "2026-01-05 08:00" not in out
+        assert mock_input.call_count == 2
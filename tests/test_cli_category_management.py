@@ -445,9 +445,7 @@ class TestAssignHabitToCategory:
         tmp_db_path, cat_id1, cat_id2, hid1, hid2 = sample_data
 
         with (
-            patch(
-                "momentum_hub.cli_category_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_category_management.select_habit") as mock_handle,
             patch("questionary.select") as mock_select,
             patch("momentum_hub.cli_category_management.show_colored_message"),
             patch("momentum_hub.cli_category_management.press_enter_to_continue"),
@@ -473,9 +471,7 @@ class TestAssignHabitToCategory:
         db.update_habit(habit, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_category_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_category_management.select_habit") as mock_handle,
             patch("questionary.select") as mock_select,
             patch("momentum_hub.cli_category_management.show_colored_message"),
             patch("momentum_hub.cli_category_management.press_enter_to_continue"),
@@ -493,10 +489,8 @@ class TestAssignHabitToCategory:
 
     def test_assign_habit_no_habits(self, tmp_db_path):
         with (
-            patch(
-                "momentum_hub.cli_category_management.show_colored_message"
-            ) as mock_show,
-            patch("momentum_hub.cli_category_management.press_enter_to_continue"),
+            patch("momentum_hub.cli_utils.show_colored_message") as mock_show,
+            patch("momentum_hub.cli_utils.press_enter_to_continue"),
         ):
 
             assign_habit_to_category(tmp_db_path)
@@ -510,9 +504,7 @@ class TestAssignHabitToCategory:
         habit = db.get_habit(hid, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_category_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_category_management.select_habit") as mock_handle,
             patch(
                 "momentum_hub.cli_category_management.show_colored_message"
             ) as mock_show,
@@ -531,9 +523,7 @@ class TestAssignHabitToCategory:
         tmp_db_path, cat_id1, cat_id2, hid1, hid2 = sample_data
 
         with (
-            patch(
-                "momentum_hub.cli_category_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_category_management.select_habit") as mock_handle,
             patch("questionary.select") as mock_select,
             patch(
                 "momentum_hub.cli_category_management.show_colored_message"
@@ -553,9 +543,7 @@ class TestAssignHabitToCategory:
         tmp_db_path, cat_id1, cat_id2, hid1, hid2 = sample_data
 
         with (
-            patch(
-                "momentum_hub.cli_category_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_category_management.select_habit") as mock_handle,
             patch("questionary.select") as mock_select,
             patch(
                 "momentum_hub.cli_category_management.show_colored_message"
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 import momentum_hub.momentum_db as db
+from momentum_hub import banner
 from momentum_hub.habit import Habit
 
 
@@ -24,16 +25,19 @@ def sample_habit(tmp_db_path):
 
 
 class TestStartupMessage:
-    """Tests CLI display: startup banner rendering."""
+    """Tests CLI display: startup banner rendering and caching."""
 
-    @patch("momentum_hub.cli_display.shutil.get_terminal_size")
-    @patch("momentum_hub.cli_display.Figlet")
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MOMENTUM_CACHE_DIR", str(tmp_path / "cache"))
+        banner.render_banner.cache_clear()
+        yield tmp_path / "cache"
+        banner.render_banner.cache_clear()
+
+    @patch("momentum_hub.banner.shutil.get_terminal_size")
     @patch("builtins.print")
-    def test_startup_message(self, mock_print, mock_figlet, mock_get_terminal_size):
+    def test_startup_message(self, mock_print, mock_get_terminal_size):
         mock_get_terminal_size.return_value = MagicMock(columns=80)
-        mock_figlet_instance = MagicMock()
-        mock_figlet_instance.renderText.return_value = "MOMENTUM HUB"
-        mock_figlet.return_value = mock_figlet_instance
 
         from momentum_hub.cli_display import startup_message
 
@@ -41,6 +45,22 @@ class TestStartupMessage:
 
         mock_print.assert_called()
 
+    def test_banner_is_rendered_once_and_cached(self, cache_dir):
+        art = banner.render_banner()
+        cached = cache_dir / "banner-standard.txt"
+        assert cached.read_text() == f"Momentum Hub\n{art}"
+
+        # Later launches read the file instead of rendering with pyfiglet
+        cached.write_text("Momentum Hub\nCACHED ART\n")
+        banner.render_banner.cache_clear()
+        with patch("pyfiglet.Figlet") as mock_figlet:
+            assert banner.render_banner() == "CACHED ART\n"
+        mock_figlet.assert_not_called()
+
+    def test_unwritable_cache_still_renders(self, cache_dir):
+        cache_dir.write_text("not a directory")
+        assert "|" in banner.render_banner()
+
 
 class TestViewHabits:
     """Tests CLI display: view habits table."""
@@ -69,3 +89,101 @@ class TestViewHabits:
             mock_show.assert_called_with(
                 "No active habits found. Let's create one!", color="\x1b[31m"
             )
+
+    def test_quitting_early_closes_the_habit_query(self, tmp_db_path, sample_habit):
+        closed = []
+
+        def iter_habits(active_only, db_name):
+            # Endless, so only closing it ends the query
+            try:
+                while True:
+                    yield sample_habit
+            finally:
+                closed.append(True)
+
+        # Closed before the screen waits, not when view_habits returns
+        def press_enter():
+            assert closed == [True]
+
+        with (
+            patch("momentum_hub.cli_display.db.iter_habits", iter_habits),
+            patch("momentum_hub.cli_display.press_enter_to_continue", press_enter),
+            patch("momentum_hub.paged_table.get_page_size", return_value=1),
+            patch("builtins.input", return_value="q"),
+            patch("builtins.print"),
+        ):
+            from momentum_hub.cli_display import view_habits
+
+            view_habits(tmp_db_path)
+
+        assert closed == [True]
+
+
+class TestViewDueHabits:
+    """Tests CLI display: the "What's due" agenda."""
+
+    def test_lists_due_habits_by_reminder(self, tmp_db_path, capsys):
+        db.add_habit(
+            Habit(name="Evening Read", frequency="daily", reminder_time="21:00"),
+            tmp_db_path,
+        )
+        db.add_habit(
+            Habit(name="Morning Gym", frequency="2/week", reminder_time="07:00"),
+            tmp_db_path,
+        )
+        from momentum_hub.cli_display import view_due_habits
+
+        with patch("momentum_hub.cli_display.press_enter_to_continue"):
+            view_due_habits(tmp_db_path)
+        out = capsys.readouterr().out
+        assert out.index("Morning Gym") < out.index("Evening Read")
+        assert "0/2" in out
+        assert "Today" in out
+
+    def test_nothing_due(self, tmp_db_path, sample_habit):
+        db.add_completion(sample_habit.id, datetime.datetime.now(), tmp_db_path)
+        from momentum_hub.cli_display import view_due_habits
+
+        with (
+            patch("momentum_hub.cli_display.show_colored_message") as mock_show,
+            patch("momentum_hub.cli_display.press_enter_to_continue"),
+        ):
+            view_due_habits(tmp_db_path)
+        assert "Nothing is due" in mock_show.call_args_list[-1].args[0]
+
+
+class TestViewSearch:
+    """Tests CLI display: the full-text search screen."""
+
+    def test_shows_ranked_matches(self, tmp_db_path, capsys):
+        db.add_habit(Habit(name="Read", frequency="daily"), tmp_db_path)
+        db.add_habit(
+            Habit(name="Stretch", frequency="daily", notes="after reading"),
+            tmp_db_path,
+        )
+        from momentum_hub.cli_display import view_search
+
+        with (
+            patch("questionary.text") as mock_text,
+            patch("momentum_hub.cli_display.press_enter_to_continue"),
+        ):
+            mock_text.return_value.ask.return_value = "read"
+            view_search(tmp_db_path)
+        out = capsys.readouterr().out
+        assert out.index("Read") < out.index("Stretch")
+        assert "[reading]" in out
+
+    def test_no_matches_and_cancel(self, tmp_db_path, sample_habit):
+        from momentum_hub.cli_display import view_search
+
+        with (
+            patch("questionary.text") as mock_text,
+            patch("momentum_hub.cli_display.show_colored_message") as mock_show,
+            patch("momentum_hub.cli_display.press_enter_to_continue") as mock_enter,
+        ):
+            mock_text.return_value.ask.return_value = "zzz"
+            view_search(tmp_db_path)
+            assert "No habits or categories match" in mock_show.call_args.args[0]
+            mock_text.return_value.ask.return_value = None
+            view_search(tmp_db_path)
+        assert mock_enter.call_count == 1
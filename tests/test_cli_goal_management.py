@@ -45,9 +45,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
@@ -76,9 +74,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
@@ -107,9 +103,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
@@ -135,8 +129,8 @@ class TestCreateGoal:
 
     def test_create_goal_no_habits(self, tmp_db_path):
         with (
-            patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
-            patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
+            patch("momentum_hub.cli_utils.show_colored_message") as mock_show,
+            patch("momentum_hub.cli_utils.press_enter_to_continue"),
         ):
 
             create_goal(tmp_db_path)
@@ -151,9 +145,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
@@ -181,9 +173,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
@@ -210,9 +200,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
@@ -241,9 +229,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
@@ -273,9 +259,7 @@ class TestCreateGoal:
         hid = db.add_habit(h, tmp_db_path)
 
         with (
-            patch(
-                "momentum_hub.cli_goal_management._handle_habit_selection"
-            ) as mock_handle,
+            patch("momentum_hub.cli_goal_management.select_habit") as mock_handle,
             patch("questionary.text") as mock_text,
             patch("momentum_hub.cli_goal_management.show_colored_message") as mock_show,
             patch("momentum_hub.cli_goal_management.press_enter_to_continue"),
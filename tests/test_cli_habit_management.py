@@ -275,7 +275,7 @@ class TestMarkHabitCompleted:
     """Tests CLI: mark habit as completed."""
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.db.add_completion")
     @patch("momentum_hub.cli_habit_management.db.update_habit")
     @patch("momentum_hub.cli_habit_management.db.update_streak")
@@ -317,7 +317,7 @@ class TestMarkHabitCompleted:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.show_colored_message")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_mark_habit_completed_no_habits(
@@ -334,7 +334,7 @@ class TestMarkHabitCompleted:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.db.add_completion")
     @patch("momentum_hub.cli_habit_management.db.update_habit")
     @patch("momentum_hub.cli_habit_management.db.update_streak")
@@ -376,7 +376,7 @@ class TestMarkHabitCompleted:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.db.add_completion")
     @patch("momentum_hub.cli_habit_management.db.update_habit")
     @patch("momentum_hub.cli_habit_management.db.update_streak")
@@ -414,12 +414,51 @@ class TestMarkHabitCompleted:
         # Should show encouragement message
         mock_show.assert_any_call("Great job!", color="\x1b[36m", style="\x1b[1m")
 
+    @pytest.mark.parametrize(
+        "frequency, streak, expected",
+        [
+            ("daily", 7, (7, False, False)),
+            ("weekly", 4, (4, True, False)),
+            ("3/week", 12, (12, True, False)),
+            ("monthly", 3, (3, False, True)),
+            ("monthly", 4, None),
+        ],
+    )
+    @patch("momentum_hub.cli_habit_management.select_habit")
+    @patch("momentum_hub.cli_habit_management.db")
+    @patch("momentum_hub.cli_habit_management.get_streak_encouragement")
+    @patch("momentum_hub.cli_habit_management.show_colored_message")
+    @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
+    def test_streak_milestones_follow_the_period_unit(
+        self,
+        mock_press,
+        mock_show,
+        mock_streak,
+        mock_db,
+        mock_select,
+        frequency,
+        streak,
+        expected,
+    ):
+        mock_select.return_value = MagicMock(id=1, frequency=frequency)
+        mock_db.get_habit.return_value = MagicMock(streak=streak)
+
+        mark_habit_completed("test.db")
+
+        if expected is None:
+            mock_streak.assert_not_called()
+        else:
+            count, weekly, monthly = expected
+            mock_streak.assert_called_once_with(
+                count, is_weekly=weekly, is_monthly=monthly
+            )
+
 
 class TestDeleteHabit:
     """Tests CLI: delete habit flow."""
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.confirm")
     @patch("momentum_hub.cli_habit_management.db.delete_habit")
     @patch("momentum_hub.cli_habit_management.show_colored_message")
@@ -447,11 +486,11 @@ class TestDeleteHabit:
             "Habit 'Test Habit' deleted (deactivated) successfully!", color="\x1b[32m"
         )
 
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management.show_colored_message")
-    @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
-    def test_delete_habit_no_habits(self, mock_press, mock_show, mock_get_habits):
-        mock_get_habits.return_value = []
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
+    @patch("momentum_hub.cli_utils.show_colored_message")
+    @patch("momentum_hub.cli_utils.press_enter_to_continue")
+    def test_delete_habit_no_habits(self, mock_press, mock_show, mock_search):
+        mock_search.return_value = ([], None)
 
         delete_habit("test.db")
 
@@ -460,7 +499,7 @@ class TestDeleteHabit:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.confirm")
     @patch("momentum_hub.cli_habit_management.show_colored_message")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
@@ -479,7 +518,7 @@ class TestDeleteHabit:
         mock_show.assert_any_call("Deletion cancelled.", color="\x1b[33m")
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.show_colored_message")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_delete_habit_cancel_selection(
@@ -499,38 +538,33 @@ class TestDeleteHabit:
 class TestReactivateHabit:
     """Tests CLI: reactivate habit flow."""
 
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management.questionary.select")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.db.reactivate_habit")
     @patch("momentum_hub.cli_habit_management.show_colored_message")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_reactivate_habit_success(
-        self, mock_press, mock_show, mock_reactivate, mock_select, mock_get_habits
+        self, mock_press, mock_show, mock_reactivate, mock_select
     ):
         habit = MagicMock()
         habit.id = 1
         habit.name = "Test Habit"
-        habit.frequency = "daily"
-        habit.is_active = False
-        mock_get_habits.return_value = [habit]
-        mock_select.return_value = MagicMock(
-            ask=MagicMock(return_value="1. Test Habit (daily)")
-        )
+        mock_select.return_value = habit
 
         reactivate_habit("test.db")
 
+        assert mock_select.call_args.kwargs == {"active": False}
         mock_reactivate.assert_called_once_with(1, "test.db")
         mock_show.assert_any_call(
             "Habit 'Test Habit' reactivated successfully!", color="\x1b[32m"
         )
 
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management.show_colored_message")
-    @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
+    @patch("momentum_hub.cli_utils.show_colored_message")
+    @patch("momentum_hub.cli_utils.press_enter_to_continue")
     def test_reactivate_habit_no_deleted_habits(
-        self, mock_press, mock_show, mock_get_habits
+        self, mock_press, mock_show, mock_search
     ):
-        mock_get_habits.return_value = []
+        mock_search.return_value = ([], None)
 
         reactivate_habit("test.db")
 
@@ -538,27 +572,21 @@ class TestReactivateHabit:
             "No deleted habits found to reactivate.", color="\x1b[31m"
         )
 
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management.questionary.select")
-    @patch("momentum_hub.cli_habit_management.show_colored_message")
-    @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
-    def test_reactivate_habit_cancel(
-        self, mock_press, mock_show, mock_select, mock_get_habits
-    ):
-        habit = MagicMock(id=1, name="Test Habit", frequency="daily", is_active=False)
-        mock_get_habits.return_value = [habit]
-        mock_select.return_value = MagicMock(ask=MagicMock(return_value="Cancel"))
+    @patch("momentum_hub.cli_habit_management.select_habit")
+    @patch("momentum_hub.cli_habit_management.db.reactivate_habit")
+    def test_reactivate_habit_cancel(self, mock_reactivate, mock_select):
+        mock_select.return_value = None
 
         reactivate_habit("test.db")
 
-        mock_show.assert_called_with("Reactivation cancelled.", color="\x1b[33m")
+        mock_reactivate.assert_not_called()
 
 
 class TestUpdateHabit:
     """Tests CLI: update habit flow."""
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.text")
     @patch("momentum_hub.cli_habit_management.questionary.select")
     @patch("momentum_hub.cli_habit_management.db.get_all_categories")
@@ -613,15 +641,14 @@ class TestUpdateHabit:
         )
         mock_update.assert_called_once_with(habit, "test.db")
 
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
-    @patch("momentum_hub.cli_habit_management.show_colored_message")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
+    @patch("momentum_hub.cli_utils.show_colored_message")
+    @patch("momentum_hub.cli_utils.press_enter_to_continue")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_update_habit_no_habits(
-        self, mock_press, mock_show, mock_handle, mock_get_habits
+        self, mock_press, mock_utils_press, mock_show, mock_search
     ):
-        mock_get_habits.return_value = []
-        mock_handle.return_value = None
+        mock_search.return_value = ([], None)
 
         update_habit("test.db")
 
@@ -630,7 +657,7 @@ class TestUpdateHabit:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.text")
     @patch("momentum_hub.cli_habit_management.show_colored_message")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
@@ -647,7 +674,7 @@ class TestUpdateHabit:
         mock_show.assert_any_call("Update cancelled.", color="\x1b[33m")
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.select")
     @patch("momentum_hub.cli_habit_management.questionary.text")
     @patch("momentum_hub.cli_habit_management.db.get_all_categories")
@@ -701,7 +728,7 @@ class TestUpdateHabit:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.select")
     @patch("momentum_hub.cli_habit_management.questionary.text")
     @patch("momentum_hub.cli_habit_management.db.get_all_categories")
@@ -755,7 +782,7 @@ class TestUpdateHabit:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.select")
     @patch("momentum_hub.cli_habit_management.questionary.text")
     @patch("momentum_hub.cli_habit_management.db.get_all_categories")
@@ -814,7 +841,7 @@ class TestUpdateHabit:
         )
 
     @patch("momentum_hub.cli_habit_management.db.get_all_habits")
-    @patch("momentum_hub.cli_habit_management._handle_habit_selection")
+    @patch("momentum_hub.cli_habit_management.select_habit")
     @patch("momentum_hub.cli_habit_management.questionary.select")
     @patch("momentum_hub.cli_habit_management.questionary.text")
     @patch("momentum_hub.cli_habit_management.db.get_all_categories")
@@ -12,6 +12,7 @@ from momentum_hub.cli_utils import (
     _handle_habit_selection,
     _to_date,
     _validate_time_format,
+    select_habit,
 )
 from momentum_hub.habit import Habit
 
@@ -103,3 +104,67 @@ class TestPressEnterToContinue:
 
             press_enter_to_continue()
             mock_input.assert_called_once_with("Press Enter to continue...")
+
+
+class TestSelectHabit:
+    """Tests CLI utils: the paginated, searchable habit picker."""
+
+    @pytest.fixture
+    def db_name(self, tmp_path):
+        import momentum_hub.momentum_db as db
+
+        db_name = str(tmp_path / "picker.db")
+        db.init_db(db_name)
+        for i in range(5):
+            db.add_habit(Habit(name=f"Walk {i}", frequency="daily"), db_name)
+        db.add_habit(Habit(name="Read", frequency="daily", notes="novel"), db_name)
+        return db_name
+
+    def _answers(self, *answers):
+        """Patches questionary.select to return answers in order; returns the mock."""
+        mock_select = patch("questionary.select").start()
+        mock_select.return_value.ask.side_effect = list(answers)
+        return mock_select
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_pages_and_returns_selected_habit(self, db_name):
+        mock_select = self._answers("next", 4)
+        habit = select_habit(db_name, "Pick:", page_size=3)
+        assert habit.id == 4 and habit.name == "Walk 3"
+
+        first, second = mock_select.call_args_list
+        assert [c.value for c in first.kwargs["choices"]][:4] == [1, 2, 3, "next"]
+        assert "previous" in [c.value for c in second.kwargs["choices"]]
+        assert second.args[0] == "Pick: (page 2)"
+
+    def test_search_by_notes(self, db_name):
+        mock_select = self._answers("search", 6)
+        with patch("questionary.text") as mock_text:
+            mock_text.return_value.ask.return_value = "novel"
+            habit = select_habit(db_name, "Pick:")
+        assert habit.name == "Read"
+        labels = [c.title for c in mock_select.call_args_list[1].kwargs["choices"]]
+        assert labels == [
+            "6. Read (daily) - Streak: 0",
+            "Search...",
+            "Clear search",
+            "Cancel",
+        ]
+
+    def test_empty_and_cancel(self, db_name, tmp_path):
+        import momentum_hub.momentum_db as db
+
+        empty = str(tmp_path / "empty.db")
+        db.init_db(empty)
+        with (
+            patch("momentum_hub.cli_utils.show_colored_message") as mock_show,
+            patch("momentum_hub.cli_utils.press_enter_to_continue"),
+        ):
+            assert select_habit(empty, "Pick:", "Nothing here") is None
+            mock_show.assert_called_with("Nothing here", color=Fore.RED)
+
+            self._answers("cancel")
+            assert select_habit(db_name, "Pick:") is None
+            mock_show.assert_called_with("Operation cancelled.", color=Fore.YELLOW)
@@ -0,0 +1,114 @@
+import datetime
+import random
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import habit_analysis
+from momentum_hub.co_completion import CompletionMatrix, day_bitset
+from momentum_hub.habit import Habit
+
+START = datetime.date(2026, 1, 1)
+
+
+def _days(*offsets):
+    return {START + datetime.timedelta(days=o) for o in offsets}
+
+
+def _pearson(xs, ys):
+    """Reference implementation over explicit 0/1 series."""
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    cov = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    vx = sum((x - mx) ** 2 for x in xs)
+    vy = sum((y - my) ** 2 for y in ys)
+    return cov / (vx * vy) ** 0.5 if vx and vy else 0.0
+
+
+class TestCompletionMatrix:
+    """Tests bitset-based pairwise co-completion statistics."""
+
+    def test_bitset_ignores_days_outside_span(self):
+        bits = day_bitset(_days(0, 2, 9), START, 5)
+        assert bits == 0b101
+
+    def test_co_occurrence_and_jaccard(self):
+        matrix = CompletionMatrix(
+            [1, 2, 3], {1: _days(0, 1, 2), 2: _days(1, 2, 3)}, START, 5
+        )
+        co = matrix.co_occurrence()
+        # Habit 3 never shares a day with anything, so it has no pairs
+        assert co == {(0, 1): 2}
+        assert matrix.counts == [3, 3, 0]
+        assert matrix.jaccard(co) == {(0, 1): pytest.approx(2 / 4)}
+
+    def test_only_co_occurring_pairs_are_visited(self):
+        # 3000 habits on distinct days: none co-occur, and none are paired up
+        days = {hid: _days(hid) for hid in range(3000)}
+        matrix = CompletionMatrix(list(days), days, START, 3000)
+        assert matrix.co_occurrence() == {}
+        assert matrix.candidate_pairs(lag=1) == {(i, i + 1) for i in range(2999)}
+
+    def test_correlations_match_reference(self):
+        rng = random.Random(7)
+        n = 120
+        days = {
+            hid: {d for d in _days(*range(n)) if rng.random() < p}
+            for hid, p in ((1, 0.6), (2, 0.4), (3, 0.8))
+        }
+        matrix = CompletionMatrix([1, 2, 3], days, START, n)
+        series = [
+            [int(START + datetime.timedelta(days=o) in days[hid]) for o in range(n)]
+            for hid in (1, 2, 3)
+        ]
+        same_day = matrix.correlation()
+        next_day = matrix.correlation(lag=1)
+        assert set(same_day) == {(0, 1), (0, 2), (1, 2)}
+        assert len(next_day) == 6
+        for (i, j), phi in same_day.items():
+            assert phi == pytest.approx(_pearson(series[i], series[j]))
+        for (i, j), phi in next_day.items():
+            assert phi == pytest.approx(_pearson(series[i][:-1], series[j][1:]))
+
+    def test_lag_longer_than_span_is_zero(self):
+        matrix = CompletionMatrix([1, 2], {1: _days(0), 2: _days(0)}, START, 1)
+        assert matrix.correlation([(0, 1)], lag=3) == {(0, 1): 0.0}
+        assert matrix.correlation(lag=3) == {}
+
+
+class TestCoCompletionAnalysis:
+    """Tests the database-backed co-completion helpers."""
+
+    def test_pairs_are_ranked_by_overlap(self, tmp_path):
+        db_name = str(tmp_path / "co.db")
+        db.init_db(db_name)
+        ids = [
+            db.add_habit(Habit(name=name, frequency="daily"), db_name=db_name)
+            for name in ("Meditate", "Code", "Run")
+        ]
+        for day in range(10):
+            dt = datetime.datetime(2026, 1, 1 + day, 8)
+            db.add_completion(ids[0], dt, db_name)
+            db.add_completion(ids[1], dt, db_name)
+            if day % 3 == 0:
+                db.add_completion(ids[2], dt, db_name)
+
+        result = habit_analysis.calculate_co_completion(
+            db_name, end=datetime.date(2026, 1, 10)
+        )
+        assert result["start"] == datetime.date(2026, 1, 1)
+        pairs = habit_analysis.get_co_completion_pairs(result, n=2)
+        assert {pairs[0]["first"].name, pairs[0]["second"].name} == {"Meditate", "Code"}
+        assert pairs[0]["co_days"] == 10
+        assert pairs[0]["jaccard"] == 1.0
+        assert pairs[1]["co_days"] == 4
+        # Every pair shares a day here, so each one is listed
+        every = habit_analysis.get_co_completion_pairs(result)
+        assert len(every) == 3 and all(p["co_days"] for p in every)
+
+    def test_empty_database(self, tmp_path):
+        db_name = str(tmp_path / "empty.db")
+        db.init_db(db_name)
+        result = habit_analysis.calculate_co_completion(db_name)
+        assert result["habits"] == []
+        assert habit_analysis.get_co_completion_pairs(result) == []
@@ -0,0 +1,103 @@
+import datetime
+import json
+import os
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import cohort
+from momentum_hub.category import Category
+from momentum_hub.habit import Habit
+
+REFERENCE = datetime.date(2026, 1, 28)
+
+
+def _make_db(path, days, category=None):
+    db_name = str(path)
+    db.init_db(db_name=db_name)
+    category_id = None
+    if category:
+        category_id = db.add_category(Category(name=category), db_name=db_name)
+    hid = db.add_habit(
+        Habit(name="Read", frequency="daily", category_id=category_id),
+        db_name=db_name,
+    )
+    for d in days:
+        db.add_completion(hid, datetime.datetime(2026, 1, d, 9), db_name)
+    db.add_habit(Habit(name="Plan", frequency="weekly"), db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def cohort_dir(tmp_path):
+    _make_db(tmp_path / "alice.db", range(1, 29), category="Health")
+    _make_db(tmp_path / "bob.db", [20, 21, 22])
+    (tmp_path / "notes.txt").write_text("not a database")
+    db.close_all_connections()
+    return tmp_path
+
+
+class TestFindDatabases:
+    """Tests resolving directories, globs and lists of databases."""
+
+    def test_directory_and_glob(self, cohort_dir):
+        names = [os.path.basename(p) for p in cohort.find_databases(str(cohort_dir))]
+        assert names == ["alice.db", "bob.db"]
+        assert cohort.find_databases(str(cohort_dir / "b*.db")) == [
+            str(cohort_dir / "bob.db")
+        ]
+        assert len(cohort.find_databases([str(cohort_dir), str(cohort_dir)])) == 2
+
+
+class TestAggregateDatabases:
+    """Tests merging per-database summaries into cohort statistics."""
+
+    def test_merged_totals(self, cohort_dir):
+        calls = []
+        summary = cohort.aggregate_databases(
+            str(cohort_dir),
+            workers=1,
+            reference_date=REFERENCE,
+            progress=lambda done, total: calls.append((done, total)),
+        )
+        assert summary["databases"] == 2
+        assert summary["habits"] == 4
+        assert summary["completions"] == 31
+        assert summary["rate_histogram"][-1] == 1  # alice: 28 of 28 days
+        assert summary["rate_histogram"][1] == 1  # bob: 3 of 28 days
+        assert summary["rate_histogram"][0] == 2  # weekly habits never completed
+        assert summary["longest_streaks"][28] == 1
+        assert summary["categories"] == {"Health": 1, "Uncategorized": 3}
+        assert summary["frequencies"] == {"daily": 2, "weekly": 2}
+        assert calls == [(1, 2), (2, 2)]
+
+    def test_process_pool_matches_inline(self, cohort_dir):
+        inline = cohort.aggregate_databases(
+            str(cohort_dir), workers=1, reference_date=REFERENCE
+        )
+        pooled = cohort.aggregate_databases(
+            str(cohort_dir), workers=2, reference_date=REFERENCE, chunksize=1
+        )
+        assert pooled == inline
+
+    def test_databases_are_opened_read_only(self, cohort_dir):
+        path = cohort_dir / "alice.db"
+        before = (path.stat().st_mtime_ns, path.read_bytes())
+        cohort.summarize_database(str(path), REFERENCE)
+        assert (path.stat().st_mtime_ns, path.read_bytes()) == before
+
+    def test_unreadable_file_is_reported(self, cohort_dir):
+        bad = cohort_dir / "broken.db"
+        bad.write_text("not a database")
+        summary = cohort.aggregate_databases(
+            str(cohort_dir), workers=1, reference_date=REFERENCE
+        )
+        assert summary["databases"] == 2
+        assert len(summary["errors"]) == 1
+        assert "broken.db" in summary["errors"][0]
+
+    def test_main_prints_json(self, cohort_dir, capsys):
+        cohort.main([str(cohort_dir), "--workers", "1", "--json", "--quiet"])
+        output = json.loads(capsys.readouterr().out)
+        assert output["databases"] == 2
+        assert output["frequencies"] == {"daily": 2, "weekly": 2}
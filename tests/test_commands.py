@@ -0,0 +1,176 @@
+import csv
+import datetime
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import commands
+from momentum_hub.habit import Habit
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_commands.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def habit_id(tmp_db_path):
+    return db.add_habit(Habit(name="Read", frequency="daily"), db_name=tmp_db_path)
+
+
+def run(capsys, *argv):
+    status = commands.main(list(argv))
+    captured = capsys.readouterr()
+    return status, captured.out, captured.err
+
+
+class TestFindCommand:
+    """Tests telling scripting commands apart from interactive runs."""
+
+    def test_find_command(self):
+        assert commands.find_command(["complete", "3"]) == "complete"
+        assert commands.find_command(["--db", "x.db", "stats"]) == "stats"
+        assert commands.find_command(["--db", "stats.db"]) is None
+        assert commands.find_command(["--demo"]) is None
+        assert commands.find_command([]) is None
+
+
+class TestCommands:
+    """Tests each subcommand's text and JSON output."""
+
+    def test_complete(self, tmp_db_path, habit_id, capsys):
+        status, out, _ = run(
+            capsys,
+            "--db",
+            tmp_db_path,
+            "complete",
+            str(habit_id),
+            "--at",
+            "2026-01-05T08:00",
+            "--json",
+        )
+        assert status == 0
+        habit = json.loads(out)
+        assert habit["streak"] == 1
+        assert habit["last_completed"] == "2026-01-05T08:00:00"
+
+        status, _, err = run(
+            capsys,
+            "complete",
+            str(habit_id),
+            "--db",
+            tmp_db_path,
+            "--at",
+            "2026-01-05T09:00",
+        )
+        assert status == 1
+        assert "already been completed" in err
+
+    def test_unknown_habit_and_missing_database(self, tmp_db_path, tmp_path, capsys):
+        assert run(capsys, "--db", tmp_db_path, "complete", "99")[0] == 1
+        status, _, err = run(capsys, "--db", str(tmp_path / "none.db"), "stats")
+        assert status == 1 and "does not exist" in err
+
+    def test_habits_list(self, tmp_db_path, habit_id, capsys):
+        db.add_habit(
+            Habit(name="Old", frequency="weekly", is_active=False), db_name=tmp_db_path
+        )
+        _, out, _ = run(capsys, "--db", tmp_db_path, "habits", "list", "--json")
+        assert [h["name"] for h in json.loads(out)] == ["Read"]
+        _, out, _ = run(capsys, "--db", tmp_db_path, "habits", "list", "--all")
+        assert out.splitlines() == [
+            f"{habit_id}\tRead\tdaily\tstreak 0",
+            f"{habit_id + 1}\tOld\tweekly\tstreak 0\tinactive",
+        ]
+
+    def test_due_and_stats(self, tmp_db_path, habit_id, capsys):
+        _, out, _ = run(capsys, "--db", tmp_db_path, "due", "--json")
+        assert json.loads(out)[0]["habit"]["id"] == habit_id
+
+        db.complete_habit(habit_id, datetime.datetime.now(), tmp_db_path)
+        _, out, _ = run(capsys, "--db", tmp_db_path, "due", "--json")
+        assert json.loads(out) == []
+        _, out, _ = run(capsys, "--db", tmp_db_path, "stats", "--json")
+        stats = json.loads(out)
+        assert stats["total_completions"] == 1
+        assert stats["longest_streak"] == {"habit": "Read", "streak": 1}
+        assert stats["habits"][0]["current_streak"] == 1
+
+    def test_export(self, tmp_db_path, habit_id, tmp_path, capsys):
+        db.add_completion(habit_id, datetime.datetime(2026, 1, 5, 8), tmp_db_path)
+        _, out, _ = run(capsys, "--db", tmp_db_path, "export", "completions")
+        rows = list(csv.reader(io.StringIO(out)))
+        assert rows[0][:3] == ["completion_id", "habit_id", "habit_name"]
+        assert rows[1][2:] == ["Read", "daily", "2026-01-05T08:00:00"]
+
+        target = tmp_path / "habits.csv"
+        _, _, err = run(
+            capsys, "--db", tmp_db_path, "export", "habits", "-o", str(target)
+        )
+        assert "Exported 1 rows" in err
+        with target.open(newline="") as f:
+            assert next(csv.DictReader(f))["name"] == "Read"
+
+    def test_batch(self, tmp_db_path, habit_id, tmp_path, capsys, monkeypatch):
+        script = tmp_path / "events.csv"
+        script.write_text(
+            "op,habit_id,at\n"
+            f"complete,{habit_id},2026-01-05T08:00\n"
+            f"complete,{habit_id},2026-01-05T09:00\n"
+        )
+        status, out, err = run(capsys, "--db", tmp_db_path, "batch", str(script))
+        assert status == 1
+        assert out.splitlines() == [
+            f"2\tok\tcomplete\thabit_id={habit_id} at=2026-01-05T08:00:00",
+            "3\terror\tcomplete\tThis habit has already been completed.",
+        ]
+        assert "Applied 1 commands, 1 failed" in err
+
+        events = f'{{"op": "complete", "habit_id": {habit_id}, "at": "2026-01-06"}}\n'
+        monkeypatch.setattr("sys.stdin", io.StringIO(events))
+        status, out, _ = run(capsys, "--db", tmp_db_path, "batch", "--json")
+        assert status == 0
+        assert json.loads(out) == {
+            "line": 1,
+            "op": "complete",
+            "habit_id": habit_id,
+            "at": "2026-01-06T00:00:00",
+            "ok": True,
+        }
+        assert db.get_habit(habit_id, tmp_db_path).streak == 2
+
+    def test_serve_and_watch_dispatch(self, tmp_db_path, monkeypatch, capsys):
+        calls = []
+        monkeypatch.setattr(
+            "momentum_hub.http_api.run_http_server", lambda *a: calls.append(a)
+        )
+        monkeypatch.setattr("momentum_hub.watch.run_watch", lambda *a: calls.append(a))
+        assert run(capsys, "--db", tmp_db_path, "serve", "--port", "0")[0] == 0
+        assert run(capsys, "--db", tmp_db_path, "watch", "--interval", "2")[0] == 0
+        assert calls == [(tmp_db_path, "127.0.0.1", 0, 4), (tmp_db_path, 2.0)]
+        assert commands.find_command(["watch"]) == "watch"
+
+
+class TestEntryPoint:
+    """Tests that scripting commands bypass the interactive menu."""
+
+    def test_subcommand_skips_tui_imports(self, tmp_db_path, habit_id):
+        code = (
+            "import sys; from momentum_hub.momentum_main import main\n"
+            "try:\n    main()\n"
+            "finally:\n    assert 'questionary' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, "--db", tmp_db_path, "habits", "list"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.startswith(f"{habit_id}\tRead")
@@ -0,0 +1,115 @@
+import asyncio
+import datetime
+import json
+import socket
+import threading
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import client, daemon
+from momentum_hub.habit import Habit
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="UNIX domain sockets are unavailable"
+)
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_daemon.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def habit_id(tmp_db_path):
+    return db.add_habit(Habit(name="Read", frequency="daily"), db_name=tmp_db_path)
+
+
+@pytest.fixture
+def server(tmp_db_path, tmp_path):
+    instance = daemon.MomentumDaemon(tmp_db_path, str(tmp_path / "d.sock"))
+    ready = threading.Event()
+    thread = threading.Thread(target=asyncio.run, args=(instance.serve(ready),))
+    thread.start()
+    assert ready.wait(5)
+    yield instance
+    instance.stop()
+    thread.join(5)
+
+
+class TestExecute:
+    """Tests request dispatch, errors and the result cache."""
+
+    def test_complete_and_duplicate(self, tmp_db_path, habit_id):
+        instance = daemon.MomentumDaemon(tmp_db_path, "unused.sock")
+        response = instance.execute(
+            {"id": 1, "op": "complete", "args": {"habit_id": habit_id}}
+        )
+        assert response["ok"] and response["id"] == 1
+        assert response["result"]["streak"] == 1
+        again = instance.execute(
+            {"id": 2, "op": "complete", "args": {"habit_id": habit_id}}
+        )
+        assert again == {
+            "id": 2,
+            "ok": False,
+            "error": "This habit has already been completed.",
+        }
+
+    def test_errors(self, tmp_db_path):
+        instance = daemon.MomentumDaemon(tmp_db_path, "unused.sock")
+        assert "Unknown operation" in instance.execute({"op": "drop"})["error"]
+        assert not instance.execute({"op": "habit", "args": {"bogus": 1}})["ok"]
+        assert (
+            "No habit"
+            in instance.execute({"op": "habit", "args": {"habit_id": 9}})["error"]
+        )
+        assert b"Invalid request" in instance.handle_line(b"not json\n")
+
+    def test_cached_reads_see_outside_writes(self, tmp_db_path, habit_id):
+        instance = daemon.MomentumDaemon(tmp_db_path, "unused.sock")
+        first = instance.execute({"op": "completions", "args": {"habit_id": habit_id}})
+        assert first["result"] == []
+        # A write from another connection (e.g. the interactive CLI)
+        db.add_completion(habit_id, datetime.datetime(2026, 1, 5, 9), tmp_db_path)
+        second = instance.execute({"op": "completions", "args": {"habit_id": habit_id}})
+        assert second["result"] == ["2026-01-05T09:00:00"]
+
+
+class TestSocketServer:
+    """Tests the asyncio server and the thin client over a real socket."""
+
+    def test_round_trips(self, server, habit_id):
+        with client.DaemonClient(server.socket_path) as conn:
+            assert conn.call("ping") == "pong"
+            assert [h["name"] for h in conn.call("habits")] == ["Read"]
+            assert conn.call("complete", habit_id=habit_id)["streak"] == 1
+            assert conn.call("due") == []
+            with pytest.raises(client.DaemonError, match="already been completed"):
+                conn.call("complete", habit_id=habit_id)
+            metrics = conn.call("metrics")
+            assert metrics[str(habit_id)]["total_completions"] == 1
+
+    def test_stop_with_idle_client_connected(self, tmp_db_path, tmp_path):
+        instance = daemon.MomentumDaemon(tmp_db_path, str(tmp_path / "idle.sock"))
+        ready = threading.Event()
+        thread = threading.Thread(target=asyncio.run, args=(instance.serve(ready),))
+        thread.start()
+        assert ready.wait(5)
+        conn = client.DaemonClient(instance.socket_path)
+        assert conn.call("ping") == "pong"
+        instance.stop()
+        thread.join(5)
+        assert not thread.is_alive()
+        conn.close()
+
+    def test_client_main(self, server, habit_id, capsys):
+        client.main(["habit", f"habit_id={habit_id}", "--socket", server.socket_path])
+        assert json.loads(capsys.readouterr().out)["name"] == "Read"
+
+    def test_client_reports_missing_daemon(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            client.main(["ping", "--socket", str(tmp_path / "missing.sock")])
+        assert "daemon is not running" in capsys.readouterr().err
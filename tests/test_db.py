@@ -3,11 +3,13 @@ import datetime
 import os
 import sqlite3
 import sys
+from unittest.mock import patch
 
 import pytest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import momentum_hub.momentum_db as db
+from momentum_hub.category import Category
 from momentum_hub.habit import Habit
 
 
@@ -129,3 +131,268 @@ def test_soft_delete_and_reactivate(tmp_db_path):
     # Reactivated streak is expected to be reset by DB logic
     assert h_re.streak == 0
     assert h_re.reactivated_at is not None
+
+
+def test_completions_in_range(tmp_db_path):
+    hid = db.add_habit(Habit(name="Ranged", frequency="daily"), db_name=tmp_db_path)
+    base = datetime.datetime(2026, 1, 1, 9, 0)
+    for i in range(10):
+        db.add_completion(hid, base + datetime.timedelta(days=i), db_name=tmp_db_path)
+
+    start = datetime.datetime(2026, 1, 3)
+    end = datetime.datetime(2026, 1, 5, 23, 59)
+    assert db.count_completions_in_range(hid, start, end, tmp_db_path) == 3
+    assert db.count_completions_in_range(hid, start=start, db_name=tmp_db_path) == 8
+    assert db.count_completions_in_range(hid, db_name=tmp_db_path) == 10
+    ranged = db.get_completions_in_range(hid, start, end, tmp_db_path)
+    assert [c.day for c in ranged] == [3, 4, 5]
+
+
+def test_completion_day_span_and_gaps(tmp_db_path):
+    hid = db.add_habit(Habit(name="Gappy", frequency="daily"), db_name=tmp_db_path)
+    assert db.get_completion_day_span(hid, tmp_db_path) == (None, None, 0)
+    for day in (1, 2, 5, 6, 10):
+        db.add_completion(hid, datetime.datetime(2026, 1, day, 9, 0), tmp_db_path)
+
+    first, last, distinct_days = db.get_completion_day_span(hid, tmp_db_path)
+    assert (first, last, distinct_days) == (
+        datetime.date(2026, 1, 1),
+        datetime.date(2026, 1, 10),
+        5,
+    )
+    assert db.get_completion_gaps(hid, tmp_db_path) == [
+        (datetime.date(2026, 1, 3), datetime.date(2026, 1, 4)),
+        (datetime.date(2026, 1, 7), datetime.date(2026, 1, 9)),
+    ]
+
+
+def test_completion_range_uses_date_index(tmp_db_path):
+    with db.get_connection(tmp_db_path) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM completions "
+            "WHERE habit_id = ? AND date >= ? AND date <= ?",
+            (1, "2026-01-01", "2026-02-01"),
+        ).fetchall()
+    assert any("idx_completions_habit_date" in row[-1] for row in plan)
+
+
+def test_due_habits_respect_period_and_quota(tmp_db_path):
+    now = datetime.datetime(2026, 1, 7, 12)  # a Wednesday
+    read = db.add_habit(
+        Habit(name="Read", frequency="daily", reminder_time="21:00"),
+        db_name=tmp_db_path,
+    )
+    gym = db.add_habit(
+        Habit(name="Gym", frequency="3/week", reminder_time="07:00"),
+        db_name=tmp_db_path,
+    )
+    plan = db.add_habit(Habit(name="Plan", frequency="weekly"), db_name=tmp_db_path)
+    budget = db.add_habit(
+        Habit(name="Budget", frequency="monthly"), db_name=tmp_db_path
+    )
+    db.add_completion(read, datetime.datetime(2026, 1, 6, 9), tmp_db_path)
+    db.add_completion(gym, datetime.datetime(2026, 1, 3, 9), tmp_db_path)  # last week
+    db.add_completion(gym, datetime.datetime(2026, 1, 5, 9), tmp_db_path)
+    db.add_completion(plan, datetime.datetime(2026, 1, 4, 9), tmp_db_path)  # Sunday
+    db.add_completion(budget, datetime.datetime(2026, 1, 2, 9), tmp_db_path)
+
+    due = db.get_due_habits(now, tmp_db_path)
+    assert [(h.name, done) for h, done in due] == [("Gym", 1), ("Read", 0)]
+
+    db.add_completion(read, datetime.datetime(2026, 1, 7, 8), tmp_db_path)
+    assert [h.name for h, _ in db.get_due_habits(now, tmp_db_path)] == ["Gym"]
+
+
+def test_due_habits_skip_unsupported_frequencies(tmp_db_path):
+    from momentum_hub.habit_analysis import get_due_list
+
+    now = datetime.datetime(2026, 1, 7, 12)
+    for frequency in ("3/week", "7/week", "1/week", "x/week", "23/week"):
+        db.add_habit(Habit(name=frequency, frequency="daily"), db_name=tmp_db_path)
+    # Rows written before validation or by hand, which parse_frequency rejects
+    with db.get_connection(tmp_db_path) as conn:
+        conn.execute("UPDATE habits SET frequency = name")
+        conn.commit()
+
+    assert [h.name for h, _ in db.get_due_habits(now, tmp_db_path)] == ["3/week"]
+    assert [entry["quota"] for entry in get_due_list(tmp_db_path, now)] == [3]
+
+
+def test_search_habits_ranks_and_escapes(tmp_db_path):
+    for name, notes in [
+        ("Read", "books"),
+        ("Meditate", "read one page first"),
+        ("Breakfast", None),
+        ("Drink_water", None),
+        ("Running", None),
+    ]:
+        db.add_habit(Habit(name=name, frequency="daily", notes=notes), tmp_db_path)
+
+    def names(query, **kwargs):
+        return [
+            h.name for h in db.search_habits(query, db_name=tmp_db_path, **kwargs)[0]
+        ]
+
+    # Prefix match first, then name/notes substrings, then in-order characters
+    assert names("rea") == ["Read", "Meditate", "Breakfast"]
+    assert names("RNG") == ["Running"]
+    # LIKE wildcards in the query match literally
+    assert names("_") == ["Drink_water"]
+    assert names("%") == []
+
+
+def test_search_habits_keyset_pages(tmp_db_path):
+    ids = [
+        db.add_habit(Habit(name=f"Habit {i:02d}", frequency="daily"), tmp_db_path)
+        for i in range(7)
+    ]
+    db.delete_habit(ids[3], tmp_db_path)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = db.search_habits(after=cursor, limit=3, db_name=tmp_db_path)
+        seen.append([h.id for h in page])
+        if cursor is None:
+            break
+    assert seen == [ids[:3], ids[4:7]]
+    deleted, cursor = db.search_habits(active=False, db_name=tmp_db_path)
+    assert [h.id for h in deleted] == [ids[3]] and cursor is None
+    assert len(db.search_habits(active=None, db_name=tmp_db_path)[0]) == 7
+
+
+def test_search_full_text_ranks_and_stays_in_sync(tmp_db_path):
+    assert db.has_search_index(tmp_db_path)
+    gym = db.add_habit(
+        Habit(name="Evening walk", frequency="daily", notes="after the gym"),
+        tmp_db_path,
+    )
+    morning = db.add_habit(
+        Habit(name="Morning meditation", frequency="daily"), tmp_db_path
+    )
+    db.add_category(Category(name="Gym", description="Strength work"), tmp_db_path)
+
+    results = db.search("gym", db_name=tmp_db_path)
+    # Name matches outrank notes matches
+    assert [(r["kind"], r["name"]) for r in results] == [
+        ("category", "Gym"),
+        ("habit", "Evening walk"),
+    ]
+    assert results[1]["snippet"] == "after the [gym]"
+    assert [r["id"] for r in db.search("med morn", db_name=tmp_db_path)] == [morning]
+    assert db.search("  ", db_name=tmp_db_path) == []
+
+    habit = db.get_habit(gym, tmp_db_path)
+    habit.notes = "along the river"
+    db.update_habit(habit, tmp_db_path)
+    assert [r["kind"] for r in db.search("gym", db_name=tmp_db_path)] == ["category"]
+    assert [r["id"] for r in db.search("river", db_name=tmp_db_path)] == [gym]
+
+
+def test_search_falls_back_to_like_without_fts5(tmp_path):
+    db_name = str(tmp_path / "no_fts.db")
+    with patch.object(db, "_init_search_schema"):
+        db.init_db(db_name)
+    assert not db.has_search_index(db_name)
+    db.add_habit(Habit(name="Read", frequency="daily", notes="books"), db_name)
+    db.add_habit(Habit(name="Library", frequency="weekly", notes="read"), db_name)
+
+    results = db.search("rea", db_name=db_name)
+    assert [r["name"] for r in results] == ["Read", "Library"]
+    assert db.search("read book", db_name=db_name)[0]["name"] == "Read"
+
+    # Opening the database again builds the index for existing rows
+    db.init_db(db_name)
+    assert db.has_search_index(db_name)
+    assert [r["name"] for r in db.search("books", db_name=db_name)] == ["Read"]
+
+
+def test_iter_habits_streams_in_id_order(tmp_db_path):
+    ids = [
+        db.add_habit(Habit(name=f"Habit {i}", frequency="daily"), tmp_db_path)
+        for i in range(5)
+    ]
+    db.delete_habit(ids[1], tmp_db_path)
+    active = db.iter_habits(db_name=tmp_db_path, batch_size=2)
+    assert [h.id for h in active] == [ids[0], *ids[2:]]
+    every = db.iter_habits(active_only=False, db_name=tmp_db_path)
+    assert [h.id for h in every] == ids
+
+
+@pytest.mark.parametrize(
+    "listing",
+    [
+        lambda hid, db_name: db.iter_habits(db_name=db_name, batch_size=5),
+        lambda hid, db_name: db.iter_completions(hid, db_name=db_name, batch_size=5),
+    ],
+    ids=["habits", "completions"],
+)
+def test_other_connections_can_write_while_a_listing_is_paused(tmp_db_path, listing):
+    from momentum_hub.paged_table import show_paged_table
+
+    for i in range(12):
+        db.add_habit(Habit(name=f"Habit {i}", frequency="daily"), tmp_db_path)
+    habit_id = db.add_habit(Habit(name="Read", frequency="daily"), tmp_db_path)
+    for day in range(1, 13):
+        db.add_completion(habit_id, datetime.datetime(2026, 1, day, 8), tmp_db_path)
+
+    def write_from_another_process(prompt):
+        # The scheduler, daemon or an import writing while the user reads a page
+        other = sqlite3.connect(tmp_db_path, timeout=0.1)
+        try:
+            other.execute(
+                "UPDATE habits SET notes = 'paused' WHERE id = ?", (habit_id,)
+            )
+            other.commit()
+        finally:
+            other.close()
+        return ""
+
+    source = listing(habit_id, tmp_db_path)
+    with (
+        patch("builtins.input", side_effect=write_from_another_process),
+        patch("builtins.print"),
+    ):
+        shown = show_paged_table(
+            ([item] for item in source),
+            ["Row"],
+            page_size=2,
+            widths=[30],
+            source=source,
+        )
+    assert shown >= 12
+    assert db.get_habit(habit_id, tmp_db_path).notes == "paused"
+
+
+def test_transaction_commits_once_or_rolls_back(tmp_db_path):
+    habit_id = db.add_habit(Habit(name="Read", frequency="daily"), tmp_db_path)
+    with pytest.raises(RuntimeError):
+        with db.transaction(tmp_db_path):
+            db.add_completion(habit_id, datetime.datetime(2026, 1, 5, 8), tmp_db_path)
+            # Validation sees the transaction's own uncommitted writes
+            with pytest.raises(ValueError):
+                db.add_completion(
+                    habit_id, datetime.datetime(2026, 1, 5, 9), tmp_db_path
+                )
+            raise RuntimeError("abort")
+    assert db.get_completions(habit_id, tmp_db_path) == []
+
+    with db.transaction(tmp_db_path):
+        db.add_completion(habit_id, datetime.datetime(2026, 1, 5, 8), tmp_db_path)
+        with db.transaction(tmp_db_path):
+            db.add_completion(habit_id, datetime.datetime(2026, 1, 6, 8), tmp_db_path)
+    assert len(db.get_completions(habit_id, tmp_db_path)) == 2
+
+
+def test_completions_page_cursor_and_habit_version(tmp_db_path):
+    habit_id = db.add_habit(Habit(name="Read", frequency="daily"), tmp_db_path)
+    version = db.get_habit_version(habit_id, tmp_db_path)
+    # Inserted out of order: pages follow the dates, not the ids
+    for day in (3, 1, 2):
+        db.add_completion(habit_id, datetime.datetime(2026, 1, day, 8), tmp_db_path)
+    assert db.get_habit_version(habit_id, tmp_db_path) > version
+    assert db.get_habit_version(999, tmp_db_path) == 0
+
+    first, cursor = db.get_completions_page(habit_id, limit=2, db_name=tmp_db_path)
+    assert [d.day for _, d in first] == [1, 2] and cursor == first[-1][0]
+    rest, cursor = db.get_completions_page(habit_id, cursor, 2, tmp_db_path)
+    assert [d.day for _, d in rest] == [3] and cursor is None
@@ -86,6 +86,12 @@ class TestGetStreakEncouragement:
         # The message might not contain the number, check for content instead
         assert len(result) > 0
 
+    def test_monthly_streaks(self):
+        """Test monthly streak encouragement across milestones."""
+        for streak in (3, 6, 12):
+            result = encouragements.get_streak_encouragement(streak, is_monthly=True)
+            assert "week" not in result and "day" not in result
+
 
 class TestGetCompletionRateEncouragement:
     """Tests encouragement messages for completion rates."""
@@ -84,3 +84,54 @@ class TestGlobalErrorManager:
         mock_show.assert_called_once_with(
             "That's not a number in my book! Please enter a digit.", color=Fore.RED
         )
+
+
+class TestLazyMessages:
+    """Tests compiled-in defaults and lazily read custom messages."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        error_manager.load_custom_errors.cache_clear()
+        yield
+        error_manager.load_custom_errors.cache_clear()
+
+    def test_defaults_need_no_database(self, tmp_path):
+        db_path = tmp_path / "never_created.db"
+        em = error_manager.ErrorManager(db_path=str(db_path))
+        assert em.get_message("empty_input").startswith("Even a snail")
+        assert em.get_message("missing") == error_manager.FALLBACK_ERROR_MESSAGE
+        assert not db_path.exists()
+
+    def test_custom_messages_follow_selected_database(self, tmp_path):
+        import sqlite3
+
+        db_path = str(tmp_path / "custom.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE errors (key TEXT PRIMARY KEY, message TEXT)")
+            conn.execute("INSERT INTO errors VALUES ('quota', 'Quota of {n} hit.')")
+        conn.close()
+
+        em = error_manager.ErrorManager(db_path=str(tmp_path / "other.db"))
+        assert em.get_message("quota") == error_manager.FALLBACK_ERROR_MESSAGE
+        em.use_database(db_path)
+        with patch("momentum_hub.error_manager.show_colored_message") as mock_show:
+            em.display_error("quota", n=3)
+        mock_show.assert_called_once_with("Quota of 3 hit.", color=Fore.RED)
+        assert error_manager.load_custom_errors.cache_info().misses == 2
+
+    def test_database_rows_override_built_in_messages(self, tmp_path):
+        import sqlite3
+
+        db_path = str(tmp_path / "custom.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE errors (key TEXT PRIMARY KEY, message TEXT)")
+            conn.execute("INSERT INTO errors VALUES ('empty_input', 'Say something.')")
+        conn.close()
+
+        em = error_manager.ErrorManager(db_path=db_path)
+        assert em.get_message("empty_input") == "Say something."
+        assert em.get_message("invalid_number").startswith("That's not a number")
+
+    def test_env_var_selects_default_database(self, monkeypatch):
+        monkeypatch.setenv("MOMENTUM_DB", "from_env.db")
+        assert error_manager.ErrorManager().db_path == "from_env.db"
@@ -14,6 +14,7 @@ from momentum_hub.cli_export import (
     analyze_export_csv,
     export_all_completions_to_csv,
     export_all_habits_to_csv,
+    export_co_completion_to_csv,
     export_habit_completions_to_csv,
 )
 from momentum_hub.completion import export_completions_to_csv
@@ -196,7 +197,7 @@ def test_export_habit_completions_to_csv_success(sample_data, tmp_path):
     with (
         patch("momentum_hub.cli_export.press_enter_to_continue"),
         patch(
-            "momentum_hub.cli_export._handle_habit_selection",
+            "momentum_hub.cli_export.select_habit",
             return_value=selected_habit,
         ),
     ):
@@ -226,7 +227,7 @@ def test_export_habit_completions_to_csv_no_completions(tmp_db_path, tmp_path):
     habit = db.get_habit(hid, db_name=tmp_db_path)
     with (
         patch("momentum_hub.cli_export.press_enter_to_continue"),
-        patch("momentum_hub.cli_export._handle_habit_selection", return_value=habit),
+        patch("momentum_hub.cli_export.select_habit", return_value=habit),
     ):
         export_habit_completions_to_csv(tmp_db_path, base_dir=str(tmp_path))
     # Should not create file or handle gracefully
@@ -329,8 +330,8 @@ def test_export_all_completions_to_csv_no_habits(tmp_db_path):
 
 def test_export_habit_completions_to_csv_no_habits(tmp_db_path):
     with (
-        patch("momentum_hub.cli_export.show_colored_message") as mock_show,
-        patch("momentum_hub.cli_export.press_enter_to_continue"),
+        patch("momentum_hub.cli_utils.show_colored_message") as mock_show,
+        patch("momentum_hub.cli_utils.press_enter_to_continue"),
     ):
         export_habit_completions_to_csv(tmp_db_path)
         mock_show.assert_called_with(
@@ -342,7 +343,7 @@ def test_export_habit_completions_to_csv_cancel_selection(tmp_db_path):
     # Add habit
     h = Habit(name="Test Habit", frequency="daily")
     hid = db.add_habit(h, db_name=tmp_db_path)
-    with patch("momentum_hub.cli_export._handle_habit_selection", return_value=None):
+    with patch("momentum_hub.cli_export.select_habit", return_value=None):
         export_habit_completions_to_csv(tmp_db_path)
         # Should return without doing anything
 
@@ -393,7 +394,7 @@ def test_export_habit_completions_to_csv_error_handling(tmp_db_path, tmp_path):
     db.add_completion(hid, now, db_name=tmp_db_path)
     habit = db.get_habit(hid, db_name=tmp_db_path)
     with (
-        patch("momentum_hub.cli_export._handle_habit_selection", return_value=habit),
+        patch("momentum_hub.cli_export.select_habit", return_value=habit),
         patch("builtins.open", side_effect=OSError("Permission denied")),
         patch("momentum_hub.cli_export.show_colored_message") as mock_show,
         patch("momentum_hub.cli_export.press_enter_to_continue"),
@@ -402,3 +403,26 @@ def test_export_habit_completions_to_csv_error_handling(tmp_db_path, tmp_path):
         mock_show.assert_called_with(
             "Error exporting completions: Permission denied", color=Fore.RED
         )
+
+
+def test_export_co_completion_to_csv_success(sample_data, tmp_path):
+    db_name, hid1, hid2 = sample_data
+    base_dir = str(tmp_path / "export")
+    with patch("momentum_hub.cli_export.press_enter_to_continue"):
+        export_co_completion_to_csv(db_name, base_dir=base_dir)
+    (csv_file,) = os.listdir(base_dir)
+    with open(os.path.join(base_dir, csv_file), newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert {rows[0]["Habit A"], rows[0]["Habit B"]} == {"Daily Habit", "Weekly Habit"}
+    assert rows[0]["Days Together"] == "1"
+
+
+def test_export_co_completion_to_csv_needs_two_habits(tmp_db_path, tmp_path):
+    db.add_habit(Habit(name="Solo", frequency="daily"), db_name=tmp_db_path)
+    with patch("momentum_hub.cli_export.show_colored_message") as mock_show:
+        with patch("momentum_hub.cli_export.press_enter_to_continue"):
+            export_co_completion_to_csv(tmp_db_path, base_dir=str(tmp_path / "x"))
+    mock_show.assert_called_with(
+        "At least two active habits are needed to compare.", color=Fore.RED
+    )
@@ -0,0 +1,116 @@
+import datetime
+import itertools
+import math
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import forecast, habit_analysis
+from momentum_hub.goal import Goal
+from momentum_hub.habit import Habit
+
+
+def _brute_force_tail(n, p, k):
+    """Reference: enumerate every trajectory of n slots."""
+    total = 0.0
+    for outcome in itertools.product((0, 1), repeat=n):
+        hits = sum(outcome)
+        if hits >= k:
+            total += p**hits * (1 - p) ** (n - hits)
+    return total
+
+
+class TestBinomialTail:
+    """Tests the closed-form goal forecast."""
+
+    @pytest.mark.parametrize("n, p, k", [(10, 0.5, 5), (12, 0.3, 2), (8, 0.9, 8)])
+    def test_matches_enumeration(self, n, p, k):
+        assert forecast.binomial_tail(n, p, k) == pytest.approx(
+            _brute_force_tail(n, p, k)
+        )
+
+    def test_edge_cases(self):
+        assert forecast.binomial_tail(5, 0.5, 0) == 1.0
+        assert forecast.binomial_tail(5, 0.5, 6) == 0.0
+        assert forecast.binomial_tail(5, 0.0, 1) == 0.0
+        assert forecast.binomial_tail(5, 1.0, 5) == 1.0
+
+    def test_long_horizon_is_stable(self):
+        value = forecast.binomial_tail(3650, 0.5, 1800)
+        assert 0.0 < value < 1.0 and not math.isnan(value)
+
+    def test_simulation_agrees_with_closed_form(self, monkeypatch):
+        monkeypatch.setattr(forecast, "np", None)
+        estimate = forecast.simulate_tails([20], [0.4], [8], trials=4000, seed=1)[0]
+        assert estimate == pytest.approx(forecast.binomial_tail(20, 0.4, 8), abs=0.03)
+
+    def test_numpy_simulation(self):
+        pytest.importorskip("numpy")
+        estimates = forecast.simulate_tails(
+            [20, 30], [0.4, 0.9], [8, 25], trials=20000, seed=1
+        )
+        assert estimates[0] == pytest.approx(
+            forecast.binomial_tail(20, 0.4, 8), abs=0.02
+        )
+        assert estimates[1] == pytest.approx(
+            forecast.binomial_tail(30, 0.9, 25), abs=0.02
+        )
+
+
+class TestGoalForecast:
+    """Tests batched goal forecasts from the database."""
+
+    @pytest.fixture
+    def goal_db(self, tmp_path):
+        db_name = str(tmp_path / "forecast.db")
+        db.init_db(db_name)
+        created = datetime.datetime(2026, 1, 1)
+        hid = db.add_habit(
+            Habit(name="Read", frequency="daily", created_at=created), db_name
+        )
+        # Completed every other day in January
+        for day in range(1, 29, 2):
+            db.add_completion(hid, datetime.datetime(2026, 1, day, 8), db_name)
+        return db_name, hid
+
+    def test_exact_forecast(self, goal_db):
+        db_name, hid = goal_db
+        goal = Goal(
+            habit_id=hid,
+            target_completions=20,
+            start_date=datetime.datetime(2026, 1, 1),
+            end_date=datetime.datetime(2026, 2, 10, 23, 59),
+        )
+        goal.id = db.add_goal(goal, db_name)
+        result = habit_analysis.forecast_goal_achievement(
+            db_name, reference_date=datetime.date(2026, 1, 28), method="exact"
+        )[goal.id]
+        # 14 done, 6 needed over Jan 28 - Feb 10 (14 days) at a 14/28 rate
+        assert result["needed"] == 6
+        assert result["slots"] == 14
+        assert result["rate"] == pytest.approx(0.5)
+        assert result["probability"] == pytest.approx(
+            forecast.binomial_tail(14, 0.5, 6)
+        )
+
+    def test_achieved_and_open_ended_goals(self, goal_db):
+        db_name, hid = goal_db
+        done = Goal(
+            habit_id=hid,
+            target_completions=3,
+            start_date=datetime.datetime(2026, 1, 1),
+            end_date=datetime.datetime(2026, 1, 31),
+        )
+        done.id = db.add_goal(done, db_name)
+        open_ended = Goal(habit_id=hid)
+        open_ended.id = db.add_goal(open_ended, db_name)
+        forecasts = habit_analysis.forecast_goal_achievement(
+            db_name, reference_date=datetime.date(2026, 1, 28), method="simulate"
+        )
+        assert forecasts[done.id]["probability"] == 1.0
+        assert forecasts[open_ended.id] is None
+
+    def test_unknown_method(self, goal_db):
+        db_name, _ = goal_db
+        with pytest.raises(ValueError):
+            habit_analysis.forecast_goal_achievement(db_name, method="guess")
@@ -159,3 +159,45 @@ class TestGoal:
         repr_str = repr(goal)
         assert f"habit_id={self.habit_id}" in repr_str
         assert "target_period_days=14" in repr_str
+
+
+class TestBatchGoalProgress:
+    """Tests goal progress computed for all goals in one query."""
+
+    def test_batch_matches_per_goal_progress(self, tmp_path):
+        from momentum_hub import habit_analysis
+
+        db_name = str(tmp_path / "goals.db")
+        db.init_db(db_name)
+        daily = db.add_habit(Habit(name="Daily", frequency="daily"), db_name)
+        weekly = db.add_habit(Habit(name="Weekly", frequency="weekly"), db_name)
+        base = datetime.datetime(2026, 3, 1, 8, 0)
+        for i in range(10):
+            db.add_completion(daily, base + datetime.timedelta(days=i), db_name)
+        for i in range(4):
+            db.add_completion(weekly, base + datetime.timedelta(weeks=i), db_name)
+
+        goals = [
+            Goal(habit_id=daily, target_period_days=28),
+            Goal(
+                habit_id=daily,
+                target_completions=5,
+                start_date=datetime.datetime(2026, 3, 3),
+                end_date=datetime.datetime(2026, 3, 6, 23, 59),
+            ),
+            Goal(habit_id=weekly, target_period_days=21),
+            Goal(habit_id=weekly, start_date=datetime.datetime(2026, 3, 10)),
+        ]
+        for goal in goals:
+            db.add_goal(goal, db_name)
+        inactive = Goal(habit_id=daily, is_active=False)
+        db.add_goal(inactive, db_name)
+
+        batch = habit_analysis.calculate_all_goal_progress(db_name)
+        assert len(batch) == 4
+        for entry in batch:
+            expected = entry["goal"].calculate_progress(db_name)
+            assert entry["progress"] == expected
+        assert batch[1]["progress"]["count"] == 4
+        assert batch[3]["habit_name"] == "Weekly"
+        assert len(habit_analysis.calculate_all_goal_progress(db_name, False)) == 5
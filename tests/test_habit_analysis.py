@@ -155,6 +155,14 @@ class TestAnalysisFeatures:
         # For the Study habit, only the count of missed days is asserted
         assert missed_days == 3
 
+    def test_missed_day_ranges_match_missed_count(self):
+        """Missed-day ranges cover exactly the missed-day count for 'Study'."""
+        study_habit = next(
+            h for h in db.get_all_habits(db_name=self.test_db_name) if h.name == "Study"
+        )
+        ranges = habit_analysis.get_missed_day_ranges(study_habit.id, self.test_db_name)
+        assert sum((end - start).days + 1 for start, end in ranges) == 3
+
     def test_calculate_longest_streak_meditate(self):
         """Test longest streak for 'Meditate' (perfect 15-day streak)."""
         meditate_habit = next(
@@ -275,3 +283,57 @@ class TestAnalysisFeatures:
         assert isinstance(analysis, dict)
         # Should have at least uncategorized habits
         assert "Uncategorized" in analysis or len(analysis) > 0
+
+    def test_habit_leaderboard_longest_streak(self):
+        """Test the leaderboard ranks habits by longest streak at both ends."""
+        board = habit_analysis.get_habit_leaderboard(
+            self.test_db_name, "longest_streak", n=2
+        )
+        top_names = [habit.name for habit, _ in board["top"]]
+        assert top_names[0] == "Code"
+        assert board["top"][0][1] == 28
+        values = [value for _, value in board["bottom"]]
+        assert values == sorted(values)
+        assert len(board["bottom"]) == 2
+
+    def test_habit_leaderboard_matches_full_sort(self):
+        """Test heap selection returns the same ranking as a full sort."""
+        board = habit_analysis.get_habit_leaderboard(
+            self.test_db_name, "completion_rate", n=10
+        )
+        habits = db.get_all_habits(db_name=self.test_db_name)
+        expected = sorted(
+            (
+                -habit_analysis.calculate_completion_rate_for_habit(
+                    h.id, self.test_db_name
+                ),
+                h.id,
+            )
+            for h in habits
+        )
+        assert [h.id for h, _ in board["top"]] == [hid for _, hid in expected]
+
+    def test_habit_leaderboard_goal_percent_and_category(self):
+        """Test goal ranking skips habits without goals and category filtering."""
+        from momentum_hub.category import Category
+        from momentum_hub.goal import Goal
+
+        habits = db.get_all_habits(db_name=self.test_db_name)
+        code = next(h for h in habits if h.name == "Code")
+        db.add_goal(Goal(habit_id=code.id, target_completions=10), self.test_db_name)
+        board = habit_analysis.get_habit_leaderboard(self.test_db_name, "goal_percent")
+        assert [h.name for h, _ in board["top"]] == ["Code"]
+
+        category_id = db.add_category(Category(name="Mind"), self.test_db_name)
+        meditate = next(h for h in habits if h.name == "Meditate")
+        meditate.category_id = category_id
+        db.update_habit(meditate, self.test_db_name)
+        board = habit_analysis.get_habit_leaderboard(
+            self.test_db_name, "current_streak", category_id=category_id
+        )
+        assert [h.name for h, _ in board["top"]] == ["Meditate"]
+
+    def test_habit_leaderboard_unknown_metric(self):
+        """Test an unknown metric is rejected."""
+        with pytest.raises(ValueError):
+            habit_analysis.get_habit_leaderboard(self.test_db_name, "nonsense")
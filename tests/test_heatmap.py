@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import habit_analysis, heatmap
+from momentum_hub.habit import Habit
+
+START = datetime.date(2026, 1, 4)  # a Sunday
+
+
+def _day(offset):
+    return START + datetime.timedelta(days=offset)
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_heatmap.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+class TestDayIndex:
+    """Tests the per-habit day index and intensity levels."""
+
+    def test_counts_and_days(self):
+        rows = [(1, _day(0)), (2, _day(0)), (1, _day(2)), (1, _day(99))]
+        index = heatmap.DayIndex(START, _day(6), rows)
+        assert index.n_days == 7
+        assert index.counts() == [2, 0, 1, 0, 0, 0, 0]
+        assert index.counts([2]) == [1, 0, 0, 0, 0, 0, 0]
+        assert index.days(1) == [_day(0), _day(2)]
+        assert index.days(3) == []
+        assert index.offset(_day(7)) is None
+
+    @pytest.mark.parametrize(
+        "count, peak, level", [(0, 3, 0), (1, 3, 2), (2, 3, 3), (3, 3, 4), (1, 1, 4)]
+    )
+    def test_intensity(self, count, peak, level):
+        assert heatmap.intensity(count, peak) == level
+
+
+class TestGrids:
+    """Tests heatmap and month layouts."""
+
+    def test_heatmap_has_52_sunday_columns(self):
+        end = datetime.date(2026, 10, 14)  # a Wednesday
+        start, end = heatmap.heatmap_span(end)
+        assert start.weekday() == 6
+        index = heatmap.DayIndex(start, end, [(1, end)])
+        week_starts, rows = heatmap.heatmap_grid(index, index.counts(), 1)
+        assert len(week_starts) == heatmap.HEATMAP_WEEKS
+        assert rows[3][-1] == heatmap.LEVELS  # Wednesday of the last week
+        assert rows[4][-1] is None  # Thursday is after the span
+
+    def test_month_grid(self):
+        index = heatmap.DayIndex(START, _day(3), [(1, _day(1))])
+        grid = heatmap.month_grid(index, 2026, 1, index.counts(), 1)
+        assert grid[0][:4] == [None, None, None, None]  # Jan 1, 2026 is a Thursday
+        assert grid[1][:3] == [(4, 0), (5, heatmap.LEVELS), (6, 0)]
+        assert grid[1][5] == (9, None)
+
+
+class TestDayIndexFromDatabase:
+    """Tests building the index from one grouped query."""
+
+    def test_get_day_index(self, tmp_db_path):
+        hid = db.add_habit(Habit(name="Read", frequency="daily"), db_name=tmp_db_path)
+        other = db.add_habit(
+            Habit(name="Plan", frequency="weekly"), db_name=tmp_db_path
+        )
+        db.add_completion(hid, datetime.datetime(2026, 1, 4, 8), tmp_db_path)
+        db.add_completion(hid, datetime.datetime(2026, 1, 6, 23, 59), tmp_db_path)
+        db.add_completion(hid, datetime.datetime(2026, 1, 8, 8), tmp_db_path)
+        db.add_completion(other, datetime.datetime(2026, 1, 6, 8), tmp_db_path)
+        index = habit_analysis.get_day_index(tmp_db_path, [hid, other], START, _day(2))
+        assert index.counts() == [1, 0, 2]
+        assert index.days(hid) == [_day(0), _day(2)]
@@ -0,0 +1,172 @@
+import asyncio
+import datetime
+import http.client
+import json
+import threading
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import http_api
+from momentum_hub.goal import Goal
+from momentum_hub.habit import Habit
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_http_api.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def habit_id(tmp_db_path):
+    habit_id = db.add_habit(Habit(name="Read", frequency="daily"), tmp_db_path)
+    for day in range(1, 6):
+        db.add_completion(habit_id, datetime.datetime(2026, 1, day, 8), tmp_db_path)
+    return habit_id
+
+
+@pytest.fixture
+def server(tmp_db_path):
+    instance = http_api.MomentumHTTPServer(tmp_db_path, port=0, workers=2)
+    ready = threading.Event()
+    thread = threading.Thread(target=asyncio.run, args=(instance.serve(ready),))
+    thread.start()
+    assert ready.wait(5)
+    yield instance
+    instance.stop()
+    thread.join(5)
+
+
+@pytest.fixture
+def get(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+
+    def request(path, etag=None, method="GET"):
+        headers = {"If-None-Match": etag} if etag else {}
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+        return response, json.loads(body) if body else None
+
+    yield request
+    conn.close()
+
+
+class TestResources:
+    """Tests the JSON resources over one keep-alive connection."""
+
+    def test_habits_and_analytics(self, get, habit_id, tmp_db_path):
+        db.add_goal(Goal(habit_id=habit_id, target_completions=10), tmp_db_path)
+        response, habits = get("/habits")
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "application/json"
+        assert [h["name"] for h in habits] == ["Read"]
+        assert get(f"/habits/{habit_id}")[1]["id"] == habit_id
+        metrics = get("/analytics")[1]
+        assert metrics[str(habit_id)]["total_completions"] == 5
+        assert get(f"/habits/{habit_id}/analytics")[1]["longest_streak"] == 5
+        assert get("/goals")[1][0]["goal"]["habit_id"] == habit_id
+
+    def test_completions_are_paginated(self, get, habit_id):
+        dates, cursor = [], 0
+        while cursor is not None:
+            _, page = get(f"/habits/{habit_id}/completions?limit=2&after={cursor}")
+            dates += [c["date"][:10] for c in page["completions"]]
+            cursor = page["next"]
+        assert dates == [f"2026-01-0{day}" for day in range(1, 6)]
+
+    def test_errors(self, get, habit_id):
+        assert get("/habits/99")[0].status == 404
+        assert get("/streaks")[0].status == 404
+        response, body = get(f"/habits/{habit_id}/completions?limit=5000")
+        assert response.status == 400 and "limit" in body["error"]
+        response, _ = get("/habits", method="DELETE")
+        assert response.status == 405 and response.getheader("Allow") == "GET, HEAD"
+        response, body = get("/habits", method="HEAD")
+        assert response.status == 200 and body is None
+        assert int(response.getheader("Content-Length")) > 0
+
+
+class TestConditionalGet:
+    """Tests ETags derived from data versions."""
+
+    def test_not_modified_until_the_data_changes(self, get, habit_id, tmp_db_path):
+        other = db.add_habit(Habit(name="Walk", frequency="daily"), tmp_db_path)
+        habit_path = f"/habits/{habit_id}/completions"
+        response, _ = get(habit_path)
+        habit_tag = response.getheader("ETag")
+        list_tag = get("/habits")[0].getheader("ETag")
+
+        response, body = get(habit_path, etag=habit_tag)
+        assert response.status == 304 and body is None
+        assert get("/habits", etag=list_tag)[0].status == 304
+
+        # A write to another habit leaves this habit's tag alone
+        db.complete_habit(other, datetime.datetime(2026, 1, 9, 8), tmp_db_path)
+        assert get(habit_path, etag=habit_tag)[0].status == 304
+        assert get("/habits", etag=list_tag)[0].status == 200
+
+        db.add_completion(habit_id, datetime.datetime(2026, 1, 9, 8), tmp_db_path)
+        response, page = get(habit_path, etag=habit_tag)
+        assert response.status == 200
+        assert len(page["completions"]) == 6
+        assert response.getheader("ETag") != habit_tag
+
+    def test_analytics_reads_keep_collection_tags(self, tmp_db_path, habit_id):
+        # Reading analytics writes the analytics cache, which is not served data
+        instance = http_api.MomentumHTTPServer(tmp_db_path)
+        try:
+            habits_tag = instance.respond("/habits")[1]["ETag"]
+            analytics_tag = instance.respond("/analytics")[1]["ETag"]
+            instance.respond(f"/habits/{habit_id}/analytics")
+            assert instance.respond("/habits", habits_tag)[0] == 304
+            assert instance.respond("/analytics", analytics_tag)[0] == 304
+
+            # Goal edits change no habit version, but still change the tag
+            goal_id = db.add_goal(Goal(habit_id=habit_id), tmp_db_path)
+            goals_tag = instance.respond("/goals")[1]["ETag"]
+            goal = db.get_goal(goal_id, tmp_db_path)
+            goal.target_completions = 10
+            db.update_goal(goal, tmp_db_path)
+            assert instance.respond("/goals", goals_tag)[0] == 200
+        finally:
+            instance.executor.shutdown()
+
+    def test_tags_are_per_server_instance(self, tmp_db_path, habit_id):
+        first = http_api.MomentumHTTPServer(tmp_db_path)
+        second = http_api.MomentumHTTPServer(tmp_db_path)
+        try:
+            assert (
+                first.respond("/habits")[1]["ETag"]
+                != second.respond("/habits")[1]["ETag"]
+            )
+            status, headers, _ = first.respond(
+                "/habits", if_none_match=f'"x", {first.respond("/habits")[1]["ETag"]}'
+            )
+            assert status == 304
+        finally:
+            for instance in (first, second):
+                instance.executor.shutdown()
+
+
+class TestRunHTTPServer:
+    """Tests running the server in the foreground."""
+
+    def test_without_signal_handlers(self, tmp_db_path, monkeypatch, capsys):
+        # As on Windows: no loop signal handlers, Ctrl+C raises KeyboardInterrupt
+        def unsupported(self, sig, callback):
+            raise NotImplementedError
+
+        async def interrupted(self, ready=None):
+            self.executor.shutdown()
+            raise KeyboardInterrupt
+
+        probe = asyncio.new_event_loop()
+        loop_class = type(probe)
+        probe.close()
+        monkeypatch.setattr(loop_class, "add_signal_handler", unsupported)
+        monkeypatch.setattr(http_api.MomentumHTTPServer, "serve", interrupted)
+        http_api.run_http_server(tmp_db_path, port=0)
+        assert capsys.readouterr().out.startswith("Momentum API serving")
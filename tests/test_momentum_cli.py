@@ -12,6 +12,7 @@ import pytest
 
 import momentum_hub
 from momentum_hub import momentum_cli
+from momentum_hub.cli_utils import HABIT_PAGE_SIZE
 from momentum_hub.habit import Habit
 
 
@@ -109,6 +110,13 @@ class TestMainMenu:
         momentum_hub.momentum_cli.main_menu("test.db")
         mock_reactivate.assert_called_once_with("test.db")
 
+    @patch("momentum_hub.momentum_cli.questionary.select")
+    @patch("momentum_hub.momentum_cli.view_due_habits")
+    def test_main_menu_whats_due(self, mock_due, mock_select, mock_db):
+        mock_select.return_value.ask.return_value = "What's due"
+        momentum_hub.momentum_cli.main_menu("test.db")
+        mock_due.assert_called_once_with("test.db")
+
     @patch("momentum_hub.momentum_cli.questionary.select")
     @patch("builtins.print")
     def test_main_menu_exit(self, mock_print, mock_select, mock_db):
@@ -153,19 +161,19 @@ class TestCreateNewHabit:
 class TestViewHabits:
     """Tests CLI habit viewing flow."""
 
-    @patch("momentum_hub.cli_display.db.get_all_habits")
+    @patch("momentum_hub.cli_display.db.iter_habits")
     @patch("momentum_hub.cli_display.press_enter_to_continue")
     def test_view_habits_with_data(
         self, mock_continue, mock_get_habits, sample_habits, mock_db
     ):
-        mock_get_habits.return_value = sample_habits
+        mock_get_habits.return_value = iter(sample_habits)
         momentum_hub.momentum_cli.view_habits("test.db")
         mock_get_habits.assert_called_once_with(active_only=True, db_name="test.db")
 
-    @patch("momentum_hub.cli_display.db.get_all_habits")
+    @patch("momentum_hub.cli_display.db.iter_habits")
     @patch("momentum_hub.cli_display.press_enter_to_continue")
     def test_view_habits_no_data(self, mock_continue, mock_get_habits, mock_db):
-        mock_get_habits.return_value = []
+        mock_get_habits.return_value = iter([])
         momentum_hub.momentum_cli.view_habits("test.db")
         mock_get_habits.assert_called_once_with(active_only=True, db_name="test.db")
 
@@ -174,7 +182,7 @@ class TestMarkHabitCompleted:
     """Tests CLI habit completion flow."""
 
     @patch("momentum_hub.cli_habit_management.questionary.select")
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
     @patch("momentum_hub.cli_habit_management.db.add_completion")
     @patch("momentum_hub.cli_habit_management.db.update_habit")
     @patch("momentum_hub.cli_habit_management.db.update_streak")
@@ -192,20 +200,20 @@ class TestMarkHabitCompleted:
         sample_habit,
         mock_db,
     ):
-        mock_get_habits.return_value = [sample_habit]
-        mock_select.return_value.ask.return_value = "1. Test Habit (daily) - Streak: 5"
+        mock_get_habits.return_value = ([sample_habit], None)
+        mock_select.return_value.ask.return_value = 1
         mock_get_habit.return_value = sample_habit
         momentum_hub.momentum_cli.mark_habit_completed("test.db")
         mock_add_completion.assert_called_once()
         mock_update_habit.assert_called_once()
         mock_update_streak.assert_called_once()
 
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
     @patch("momentum_hub.cli_utils.press_enter_to_continue")
     def test_mark_habit_completed_no_habits(
         self, mock_continue, mock_get_habits, mock_db
     ):
-        mock_get_habits.return_value = []
+        mock_get_habits.return_value = ([], None)
         momentum_hub.momentum_cli.mark_habit_completed("test.db")
         # Should handle gracefully
 
@@ -215,7 +223,7 @@ class TestDeleteHabit:
 
     @patch("momentum_hub.cli_habit_management.questionary.select")
     @patch("momentum_hub.cli_habit_management.questionary.confirm")
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
     @patch("momentum_hub.cli_habit_management.db.delete_habit")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_delete_habit_success(
@@ -228,15 +236,15 @@ class TestDeleteHabit:
         sample_habit,
         mock_db,
     ):
-        mock_get_habits.return_value = [sample_habit]
-        mock_select.return_value.ask.return_value = "1. Test Habit (daily)"
+        mock_get_habits.return_value = ([sample_habit], None)
+        mock_select.return_value.ask.return_value = 1
         mock_confirm.return_value.ask.return_value = True
         momentum_hub.momentum_cli.delete_habit("test.db")
         mock_delete.assert_called_once_with(1, "test.db")
 
     @patch("momentum_hub.cli_habit_management.questionary.select")
     @patch("momentum_hub.cli_habit_management.questionary.confirm")
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_delete_habit_cancel(
         self,
@@ -247,8 +255,8 @@ class TestDeleteHabit:
         sample_habit,
         mock_db,
     ):
-        mock_get_habits.return_value = [sample_habit]
-        mock_select.return_value.ask.return_value = "1. Test Habit (daily)"
+        mock_get_habits.return_value = ([sample_habit], None)
+        mock_select.return_value.ask.return_value = 1
         mock_confirm.return_value.ask.return_value = False
         momentum_hub.momentum_cli.delete_habit("test.db")
         # Should not call delete
@@ -258,7 +266,7 @@ class TestReactivateHabit:
     """Tests CLI habit reactivation flow."""
 
     @patch("momentum_hub.cli_habit_management.questionary.select")
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
     @patch("momentum_hub.cli_habit_management.db.reactivate_habit")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_reactivate_habit_success(
@@ -271,8 +279,8 @@ class TestReactivateHabit:
         mock_db,
     ):
         sample_habit.is_active = False
-        mock_get_habits.return_value = [sample_habit]
-        mock_select.return_value.ask.return_value = "1. Test Habit (daily)"
+        mock_get_habits.return_value = ([sample_habit], None)
+        mock_select.return_value.ask.return_value = 1
         momentum_hub.momentum_cli.reactivate_habit("test.db")
         mock_reactivate.assert_called_once_with(1, "test.db")
 
@@ -282,7 +290,7 @@ class TestUpdateHabit:
 
     @patch("momentum_hub.cli_habit_management.questionary.text")
     @patch("momentum_hub.cli_habit_management.questionary.select")
-    @patch("momentum_hub.cli_habit_management.db.get_all_habits")
+    @patch("momentum_hub.cli_habit_management.db.search_habits")
     @patch("momentum_hub.cli_habit_management.db.update_habit")
     @patch("momentum_hub.cli_habit_management.press_enter_to_continue")
     def test_update_habit_success(
@@ -295,11 +303,9 @@ class TestUpdateHabit:
         sample_habit,
         mock_db,
     ):
-        mock_get_habits.return_value = [sample_habit]
+        mock_get_habits.return_value = ([sample_habit], None)
         mock_select.side_effect = [
-            MagicMock(
-                ask=MagicMock(return_value="1. Test Habit (daily) - Streak: 5")
-            ),  # habit selection
+            MagicMock(ask=MagicMock(return_value=1)),  # habit selection
             MagicMock(ask=MagicMock(return_value="weekly")),  # frequency
             MagicMock(ask=MagicMock(return_value="No category")),  # category selection
         ]
@@ -348,12 +354,12 @@ class TestAnalyzeHabits:
 class TestAnalyzeListAllHabits:
     """Tests CLI analyze: list all habits."""
 
-    @patch("momentum_hub.cli_analysis.db.get_all_habits")
+    @patch("momentum_hub.cli_analysis.db.iter_habits")
     @patch("momentum_hub.cli_analysis.press_enter_to_continue")
     def test_analyze_list_all_habits(
         self, mock_continue, mock_get_habits, sample_habits
     ):
-        mock_get_habits.return_value = sample_habits
+        mock_get_habits.return_value = iter(sample_habits)
         momentum_hub.momentum_cli.analyze_list_all_habits("test.db")
         mock_get_habits.assert_called_once_with(active_only=True, db_name="test.db")
 
@@ -412,7 +418,7 @@ class TestAnalyzeLongestStreakOne:
         return_value=5,
     )
     @patch("momentum_hub.cli_analysis.questionary.select")
-    @patch("momentum_hub.cli_analysis.db.get_all_habits")
+    @patch("momentum_hub.cli_analysis.db.search_habits")
     @patch("momentum_hub.cli_analysis.press_enter_to_continue")
     def test_analyze_longest_streak_one(
         self,
@@ -422,17 +428,19 @@ class TestAnalyzeLongestStreakOne:
         mock_longest_streak,
         sample_habit,
     ):
-        mock_get_habits.return_value = [sample_habit]
-        mock_select.return_value.ask.return_value = "1. Test Habit (daily) - Streak: 5"
+        mock_get_habits.return_value = ([sample_habit], None)
+        mock_select.return_value.ask.return_value = 1
         momentum_hub.momentum_cli.analyze_longest_streak_one("test.db")
-        mock_get_habits.assert_called_once_with(active_only=True, db_name="test.db")
+        mock_get_habits.assert_called_once_with(
+            "", True, None, HABIT_PAGE_SIZE, "test.db"
+        )
 
 
 class TestAnalyzeStreakHistoryGrid:
     """Tests CLI analyze: streak history calendar view."""
 
     @patch("momentum_hub.cli_analysis.questionary.select")
-    @patch("momentum_hub.cli_analysis.db.get_all_habits")
+    @patch("momentum_hub.cli_analysis.db.search_habits")
     @patch("momentum_hub.cli_analysis.db.get_completions")
     @patch("momentum_hub.cli_analysis.press_enter_to_continue")
     def test_analyze_streak_history_grid(
@@ -443,11 +451,13 @@ class TestAnalyzeStreakHistoryGrid:
         mock_select,
         sample_habit,
     ):
-        mock_get_habits.return_value = [sample_habit]
-        mock_select.return_value.ask.return_value = "1. Test Habit (daily) - Streak: 5"
+        mock_get_habits.return_value = ([sample_habit], None)
+        mock_select.return_value.ask.return_value = 1
         mock_get_completions.return_value = [datetime.datetime(2023, 1, 6)]
         momentum_hub.momentum_cli.analyze_streak_history_grid("test.db")
-        mock_get_habits.assert_called_once_with(active_only=True, db_name="test.db")
+        mock_get_habits.assert_called_once_with(
+            "", True, None, HABIT_PAGE_SIZE, "test.db"
+        )
 
 
 class TestAnalyzeExportCsv:
@@ -497,16 +507,16 @@ class TestAnalyzeCompletionHistory:
     """Tests CLI analyze: completion history."""
 
     @patch("momentum_hub.cli_analysis.questionary.select")
-    @patch("momentum_hub.cli_analysis.db.get_all_habits")
+    @patch("momentum_hub.cli_analysis.db.search_habits")
     @patch("momentum_hub.cli_analysis.press_enter_to_continue")
     def test_analyze_completion_history(
         self, mock_continue, mock_get_habits, mock_select, sample_habit
     ):
-        mock_get_habits.return_value = [sample_habit]
-        mock_select.return_value.ask.return_value = "1. Test Habit (daily) - Streak: 5"
+        mock_get_habits.return_value = ([sample_habit], None)
+        mock_select.return_value.ask.return_value = 1
         with patch(
-            "momentum_hub.cli_analysis.analysis.get_completion_history",
-            return_value=[datetime.datetime(2023, 1, 6)],
+            "momentum_hub.cli_analysis.db.iter_completions",
+            return_value=iter([datetime.datetime(2023, 1, 6)]),
         ):
             momentum_hub.momentum_cli.analyze_completion_history("test.db")
 
@@ -552,9 +562,10 @@ class TestStartCli:
     @patch("momentum_hub.momentum_cli.db.init_db")
     @patch("momentum_hub.momentum_cli.startup_message")
     @patch("momentum_hub.momentum_cli.main_menu")
+    @patch("momentum_hub.momentum_cli.start_warmer")
     @patch("builtins.print")
     def test_start_cli_success(
-        self, mock_print, mock_main_menu, mock_startup, mock_init_db
+        self, mock_print, mock_warmer, mock_main_menu, mock_startup, mock_init_db
     ):
         # Mock main_menu to raise SystemExit to exit the loop
         mock_main_menu.side_effect = SystemExit()
@@ -562,6 +573,9 @@ class TestStartCli:
         mock_init_db.assert_called_once_with("test.db")
         mock_startup.assert_called_once()
         mock_main_menu.assert_called_once_with("test.db")
+        # Background precomputation starts with the menu and stops on exit
+        mock_warmer.assert_called_once_with("test.db")
+        mock_warmer.return_value.cancel.assert_called_once()
 
     @patch("momentum_hub.momentum_cli.db.init_db")
     @patch("momentum_hub.momentum_cli.startup_message")
@@ -577,3 +591,79 @@ class TestStartCli:
         mock_main_menu.side_effect = [Exception("Test error"), SystemExit()]
         momentum_hub.momentum_cli.start_cli("test.db")
         mock_show.assert_called_with("An error occurred: Test error", color="\x1b[31m")
+
+
+# Modules that must stay off the cold-start import path; importing them eagerly
+# costs several times the rest of the menu's startup.
+DEFERRED_MODULES = (
+    "questionary",
+    "prompt_toolkit",
+    "pyfiglet",
+    "tabulate",
+    "momentum_hub.habit_analysis",
+    "momentum_hub.cli_analysis",
+    "momentum_hub.cli_habit_management",
+)
+
+
+def _modules_after_import(module: str) -> set:
+    """Imports module in a fresh interpreter; returns the names in sys.modules."""
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+# Cumulative `python -X importtime` budget for importing the menu module cold.
+# It takes about 45 ms and about 270 ms with the menu screens imported eagerly;
+# the margin is wide, and the best of several runs is taken, so a busy machine
+# does not fail the test but a startup regression still does.
+IMPORT_BUDGET_US = 150_000
+IMPORT_TIME_RUNS = 5
+
+
+def _import_time(module: str) -> int:
+    """Runs `python -X importtime -c 'import module'`; returns its cumulative us."""
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.endswith(f"| {module}"):
+            return int(line.split("|")[1])
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+class TestStartupImports:
+    """Tests that heavy modules stay off the cold-start import path."""
+
+    @pytest.mark.parametrize(
+        "module", ["momentum_hub.momentum_cli", "momentum_hub.commands"]
+    )
+    def test_heavy_modules_are_deferred(self, module):
+        loaded = _modules_after_import(module)
+        assert module in loaded
+        assert not [name for name in DEFERRED_MODULES if name in loaded]
+
+    def test_import_time_budget(self):
+        module = "momentum_hub.momentum_cli"
+        best = min(_import_time(module) for _ in range(IMPORT_TIME_RUNS))
+        assert best < IMPORT_BUDGET_US
+
+    def test_menu_functions_load_on_first_use(self):
+        from momentum_hub import cli_habit_management
+
+        assert momentum_cli.create_new_habit is cli_habit_management.create_new_habit
+        with pytest.raises(AttributeError):
+            momentum_cli.not_a_menu_function
@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+import pytest
+from colorama import Fore, Style
+from tabulate import tabulate
+
+from momentum_hub import paged_table
+
+
+@pytest.fixture(autouse=True)
+def default_page_size(monkeypatch):
+    monkeypatch.delenv(paged_table.PAGE_SIZE_ENV, raising=False)
+    yield
+    paged_table.set_page_size(None)
+
+
+class TestRendering:
+    """Tests the grid layout, column widths and truncation."""
+
+    def test_matches_tabulate_grid(self):
+        headers = ["ID", "Name", "Created At"]
+        rows = [[1, "Read", "2026-01-05 08:00"], [12, "Walk the dog", "-"]]
+        pages = list(paged_table.iter_pages(rows, headers, page_size=10))
+        expected = tabulate(rows, headers=headers, tablefmt="grid", stralign="center")
+        assert pages == [(expected, 2)]
+
+    def test_colour_codes_do_not_count_towards_width(self):
+        headers = [f"{Fore.CYAN}Streak{Style.RESET_ALL}"]
+        cell = f"{Fore.GREEN}123456789{Style.RESET_ALL}"
+        assert paged_table.sample_widths(headers, [[cell]]) == [9]
+        assert paged_table.sample_widths(headers, []) == [8]
+
+    def test_fixed_widths_truncate_long_cells(self):
+        text = paged_table.render_table(["Name"], [["Meditation"]], widths=[6])
+        assert "| Medit… |" in text
+        assert "|  Name  |" in text
+        assert paged_table.sample_widths(["Name"], [["x" * 100]]) == [
+            paged_table.MAX_COLUMN_WIDTH
+        ]
+
+
+class TestPaging:
+    """Tests page-at-a-time output and navigation."""
+
+    def test_pages_are_rendered_lazily(self):
+        consumed = []
+
+        def rows():
+            for i in range(10):
+                consumed.append(i)
+                yield [i]
+
+        pages = paged_table.iter_pages(rows(), ["N"], page_size=3, widths=[2])
+        assert next(pages)[1] == 3
+        assert consumed == [0, 1, 2]
+        assert [count for _, count in pages] == [3, 3, 1]
+
+    def test_next_page_and_stop(self, capsys):
+        closed = []
+
+        def rows():
+            try:
+                for i in range(7):
+                    yield [i]
+            finally:
+                closed.append(True)
+
+        with patch("builtins.input", side_effect=["", "q"]) as mock_input:
+            shown = paged_table.show_paged_table(rows(), ["N"], page_size=2)
+        assert shown == 4
+        assert mock_input.call_args.args[0].startswith("Rows 1-4 shown")
+        assert capsys.readouterr().out.count("+=====+") == 2
+        assert closed == [True]
+
+    def test_stopping_closes_the_source_under_a_map(self):
+        closed = []
+
+        def query():
+            try:
+                yield from range(7)
+            finally:
+                closed.append(True)
+
+        source = query()
+        pages = paged_table.iter_pages(
+            map(lambda i: [i], source), ["N"], page_size=2, source=source
+        )
+        next(pages)
+        pages.close()
+        assert closed == [True]
+
+    def test_empty_and_single_page(self, capsys):
+        with patch("builtins.input") as mock_input:
+            assert paged_table.show_paged_table(iter([]), ["N"]) == 0
+            assert paged_table.show_paged_table([[1], [2]], ["N"], page_size=2) == 2
+        mock_input.assert_not_called()
+        assert capsys.readouterr().out.count("+=====+") == 1
+
+    def test_page_size_setting(self, monkeypatch):
+        assert paged_table.get_page_size() == paged_table.DEFAULT_PAGE_SIZE
+        monkeypatch.setenv(paged_table.PAGE_SIZE_ENV, "5")
+        assert paged_table.get_page_size() == 5
+        paged_table.set_page_size(3)
+        assert paged_table.get_page_size() == 3
+        with pytest.raises(ValueError):
+            paged_table.set_page_size(0)
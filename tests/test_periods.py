@@ -0,0 +1,131 @@
+import datetime
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import habit_analysis, periods
+from momentum_hub.habit import Habit
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_periods.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+class TestPeriodKeys:
+    """Tests O(1) period keys and their bounds."""
+
+    def test_week_key_changes_on_sunday(self):
+        saturday = datetime.date(2025, 10, 4)
+        sunday = datetime.date(2025, 10, 5)
+        assert periods.week_key(sunday) == periods.week_key(saturday) + 1
+        assert periods.week_key(sunday) == periods.week_key(
+            datetime.datetime(2025, 10, 11, 23, 59)
+        )
+        assert periods.week_start(datetime.date(2025, 10, 8)) == sunday
+
+    def test_consecutive_months_have_consecutive_keys(self):
+        assert periods.month_key(datetime.date(2026, 1, 5)) == (
+            periods.month_key(datetime.date(2025, 12, 31)) + 1
+        )
+        assert periods.key_end(
+            periods.month_key(datetime.date(2024, 2, 10)), "month"
+        ) == (datetime.date(2024, 2, 29))
+
+    def test_period_bounds_cover_whole_period(self):
+        start, end = periods.period_bounds(
+            datetime.datetime(2026, 3, 18, 12), "monthly"
+        )
+        assert start == datetime.datetime(2026, 3, 1)
+        assert end.date() == datetime.date(2026, 3, 31)
+        assert end.time() == datetime.time.max
+
+    @pytest.mark.parametrize(
+        "frequency, expected",
+        [
+            ("daily", ("day", 1)),
+            ("weekly", ("week", 1)),
+            ("monthly", ("month", 1)),
+            ("3/week", ("week", 3)),
+            ("7/week", None),
+            ("yearly", None),
+        ],
+    )
+    def test_parse_frequency(self, frequency, expected):
+        assert periods.parse_frequency(frequency) == expected
+
+    def test_times_per_week_rejects_out_of_range(self):
+        assert periods.times_per_week(3) == "3/week"
+        with pytest.raises(ValueError):
+            periods.times_per_week(1)
+
+
+class TestPeriodStreaks:
+    """Tests streaks and rates for monthly and N-per-week habits."""
+
+    def test_n_per_week_only_counts_weeks_meeting_quota(self):
+        # Week of Jan 4 has 3 distinct days, week of Jan 11 only 2, week of Jan 18 has 3
+        days = [4, 5, 5, 6, 11, 12, 18, 19, 20]
+        dates = [datetime.date(2026, 1, d) for d in days]
+        keys = periods.completed_period_keys(dates, "3/week")
+        assert len(keys) == 2
+        assert habit_analysis.calculate_longest_streak_from_dates(dates, "3/week") == 1
+        assert habit_analysis.calculate_longest_streak_from_dates(dates, "2/week") == 3
+
+    def test_monthly_streak_and_rate(self):
+        dates = [
+            datetime.date(2025, 11, 30),
+            datetime.date(2025, 12, 1),
+            datetime.date(2026, 1, 15),
+        ]
+        assert habit_analysis.calculate_longest_streak_from_dates(dates, "monthly") == 3
+        rate = habit_analysis.calculate_completion_rate_from_dates(
+            set(dates), "monthly", datetime.date(2026, 1, 20)
+        )
+        assert rate == pytest.approx(1.0)
+
+    def test_habit_longest_streak_uses_periods(self):
+        habit = Habit(name="Budget review", frequency="monthly")
+        completions = [
+            datetime.datetime(2026, 1, 3),
+            datetime.datetime(2026, 2, 27),
+            datetime.datetime(2026, 4, 1),
+        ]
+        assert habit.calculate_longest_streak(completions) == 2
+
+
+class TestPeriodCompletions:
+    """Tests indexed duplicate checks for the new frequencies."""
+
+    def test_monthly_allows_one_completion_per_month(self, tmp_db_path):
+        hid = db.add_habit(
+            Habit(name="Budget", frequency="monthly"), db_name=tmp_db_path
+        )
+        db.add_completion(hid, datetime.datetime(2026, 1, 31, 9), tmp_db_path)
+        with pytest.raises(ValueError, match="for the month"):
+            db.add_completion(hid, datetime.datetime(2026, 1, 2, 9), tmp_db_path)
+        db.add_completion(hid, datetime.datetime(2026, 2, 1, 9), tmp_db_path)
+        db.update_streak(hid, tmp_db_path)
+        assert db.get_habit(hid, tmp_db_path).streak == 2
+
+    def test_n_per_week_quota(self, tmp_db_path):
+        hid = db.add_habit(Habit(name="Gym", frequency="2/week"), db_name=tmp_db_path)
+        db.add_completion(hid, datetime.datetime(2026, 1, 5, 9), tmp_db_path)
+        with pytest.raises(ValueError, match="today"):
+            db.add_completion(hid, datetime.datetime(2026, 1, 5, 18), tmp_db_path)
+        db.add_completion(hid, datetime.datetime(2026, 1, 7, 9), tmp_db_path)
+        with pytest.raises(ValueError, match="for the week"):
+            db.add_completion(hid, datetime.datetime(2026, 1, 9, 9), tmp_db_path)
+        db.update_streak(hid, tmp_db_path)
+        assert db.get_habit(hid, tmp_db_path).streak == 1
+
+    def test_reactivation_starts_a_fresh_period(self, tmp_db_path):
+        habit = Habit(name="Blog", frequency="weekly")
+        hid = db.add_habit(habit, db_name=tmp_db_path)
+        db.add_completion(hid, datetime.datetime(2026, 1, 5, 9), tmp_db_path)
+        habit = db.get_habit(hid, tmp_db_path)
+        habit.reactivated_at = datetime.datetime(2026, 1, 6, 0)
+        db.update_habit(habit, tmp_db_path)
+        db.add_completion(hid, datetime.datetime(2026, 1, 7, 9), tmp_db_path)
@@ -0,0 +1,77 @@
+import datetime
+import time
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import analytics_cache, habit_analysis, precompute
+from momentum_hub.habit import Habit
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_precompute.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def habit_ids(tmp_db_path):
+    ids = [
+        db.add_habit(
+            Habit(
+                name=f"Habit {i}",
+                frequency="daily",
+                created_at=datetime.datetime(2026, 1, 1 + i),
+            ),
+            tmp_db_path,
+        )
+        for i in range(4)
+    ]
+    db.complete_habit(ids[0], datetime.datetime(2026, 2, 1, 8), tmp_db_path)
+    return ids
+
+
+def cached_ids(db_name, ids):
+    return [hid for hid in ids if analytics_cache.load(hid, db_name)[1] is not None]
+
+
+class TestAnalyticsWarmer:
+    """Tests warming the analytics cache in the background."""
+
+    def test_recently_used_habits_first(self, tmp_db_path, habit_ids):
+        db.delete_habit(habit_ids[2], tmp_db_path)
+        order = [h.id for h in precompute.habits_by_recent_use(tmp_db_path)]
+        assert order == [habit_ids[0], habit_ids[3], habit_ids[1]]
+
+    def test_warm_fills_the_cache(self, tmp_db_path, habit_ids):
+        warmer = precompute.AnalyticsWarmer(tmp_db_path, batch_size=3, pause=0)
+        assert warmer.warm() == 4
+        assert cached_ids(tmp_db_path, habit_ids) == habit_ids
+        # Screens now read the warmed entries
+        metrics = habit_analysis.get_habit_metrics(habit_ids[0], tmp_db_path)
+        assert metrics["total_completions"] == 1
+
+    def test_cancel_stops_at_a_batch_boundary(self, tmp_db_path, habit_ids):
+        warmer = precompute.AnalyticsWarmer(tmp_db_path, batch_size=1, pause=5)
+        warmer.start()
+        deadline = time.monotonic() + 5
+        while warmer.warmed == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # The warmer is now pausing after its first batch
+        warmer.cancel(timeout=5)
+        assert not warmer.running
+        assert warmer.warmed == 1
+        assert cached_ids(tmp_db_path, habit_ids) == [habit_ids[0]]
+
+    def test_missing_database_and_opt_out(self, tmp_path, tmp_db_path, monkeypatch):
+        missing = str(tmp_path / "missing.db")
+        assert precompute.AnalyticsWarmer(missing).warm() == 0
+        assert not (tmp_path / "missing.db").exists()
+
+        monkeypatch.setenv("MOMENTUM_PRECOMPUTE", "0")
+        assert precompute.start_warmer(tmp_db_path) is None
+        monkeypatch.delenv("MOMENTUM_PRECOMPUTE")
+        warmer = precompute.start_warmer(tmp_db_path)
+        warmer.cancel(timeout=5)
+        assert not warmer.running
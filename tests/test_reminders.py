@@ -0,0 +1,162 @@
+import datetime
+import io
+import threading
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import reminders
+from momentum_hub.habit import Habit
+
+NOW = datetime.datetime(2026, 1, 7, 6, 0)  # a Wednesday morning
+
+
+class ListSink:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, reminder):
+        self.sent.append(reminder)
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_reminders.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def scheduler(tmp_db_path):
+    return reminders.ReminderScheduler(tmp_db_path, ListSink(), clock=lambda: NOW)
+
+
+def _add(db_name, name, frequency="daily", morning=None, evening=None):
+    habit = Habit(
+        name=name,
+        frequency=frequency,
+        reminder_time=morning,
+        evening_reminder_time=evening,
+    )
+    return db.add_habit(habit, db_name=db_name)
+
+
+class TestFireTimes:
+    """Tests reminder time parsing and next fire times."""
+
+    def test_next_fire_time_rolls_to_tomorrow(self):
+        at = datetime.time(7, 30)
+        assert reminders.next_fire_time(at, NOW) == datetime.datetime(2026, 1, 7, 7, 30)
+        later = datetime.datetime(2026, 1, 7, 7, 30)
+        assert reminders.next_fire_time(at, later) == datetime.datetime(
+            2026, 1, 8, 7, 30
+        )
+
+    def test_invalid_times_are_ignored(self):
+        assert reminders.parse_reminder_time("25:00") is None
+        assert reminders.parse_reminder_time(None) is None
+        assert reminders.parse_reminder_time("07:05") == datetime.time(7, 5)
+
+
+class TestReminderScheduler:
+    """Tests scheduling, dispatch and incremental reloads."""
+
+    def test_fires_in_time_order_and_reschedules(self, scheduler, tmp_db_path):
+        _add(tmp_db_path, "Read", morning="07:00", evening="21:00")
+        _add(tmp_db_path, "Stretch", morning="06:30")
+        _add(tmp_db_path, "No reminder")
+        assert scheduler.load(NOW) == 3
+        assert scheduler.next_fire_time() == datetime.datetime(2026, 1, 7, 6, 30)
+
+        sent = scheduler.run_pending(datetime.datetime(2026, 1, 7, 7, 0))
+        assert [(r.habit_name, r.kind) for r in sent] == [
+            ("Stretch", "morning"),
+            ("Read", "morning"),
+        ]
+        assert scheduler.next_fire_time() == datetime.datetime(2026, 1, 7, 21, 0)
+        assert len(scheduler) == 3
+
+    def test_skips_habits_completed_this_period(self, scheduler, tmp_db_path):
+        read = _add(tmp_db_path, "Read", morning="07:00")
+        gym = _add(tmp_db_path, "Gym", frequency="2/week", morning="07:00")
+        plan = _add(tmp_db_path, "Plan", frequency="weekly", morning="07:00")
+        scheduler.load(NOW)
+        db.add_completion(read, datetime.datetime(2026, 1, 7, 5), tmp_db_path)
+        db.add_completion(gym, datetime.datetime(2026, 1, 5, 5), tmp_db_path)
+        db.add_completion(plan, datetime.datetime(2026, 1, 4, 5), tmp_db_path)
+
+        sent = scheduler.run_pending(datetime.datetime(2026, 1, 7, 7, 1))
+        assert [r.habit_name for r in sent] == ["Gym"]
+        assert scheduler.sink.sent == sent
+
+    def test_skips_quota_habits_completed_today(self, scheduler, tmp_db_path):
+        gym = _add(tmp_db_path, "Gym", frequency="3/week", evening="20:00")
+        scheduler.load(NOW)
+        db.add_completion(gym, datetime.datetime(2026, 1, 7, 9), tmp_db_path)
+        # The weekly quota is unmet, but today's completion is the most allowed
+        assert scheduler.run_pending(datetime.datetime(2026, 1, 7, 20, 1)) == []
+        sent = scheduler.run_pending(datetime.datetime(2026, 1, 8, 20, 1))
+        assert [r.habit_name for r in sent] == ["Gym"]
+
+    def test_refresh_reloads_only_changed_habits(self, scheduler, tmp_db_path):
+        read = _add(tmp_db_path, "Read", morning="07:00")
+        stretch = _add(tmp_db_path, "Stretch", morning="06:30")
+        scheduler.load(NOW)
+        assert scheduler.refresh(NOW) == 0
+
+        habit = db.get_habit(read, tmp_db_path)
+        habit.reminder_time = None
+        habit.evening_reminder_time = "05:00"
+        db.update_habit(habit, tmp_db_path)
+        db.delete_habit(stretch, tmp_db_path)
+        _add(tmp_db_path, "Journal", evening="22:00")
+
+        assert scheduler.refresh(NOW) == 3
+        assert len(scheduler) == 2
+        assert scheduler.next_fire_time() == datetime.datetime(2026, 1, 7, 22, 0)
+        assert scheduler._entries[(read, "evening")][0] == datetime.datetime(
+            2026, 1, 8, 5, 0
+        )
+
+    def test_many_reschedules_keep_heap_compact(self, scheduler):
+        habit = Habit(name="Busy", frequency="daily", id=1, reminder_time="07:00")
+        for minute in range(500):
+            habit.reminder_time = f"07:{minute % 60:02d}"
+            scheduler.schedule(habit, NOW)
+        assert len(scheduler) == 1
+        assert len(scheduler._heap) < 100
+
+    def test_run_stops_on_event(self, tmp_db_path):
+        _add(tmp_db_path, "Read", morning="07:00")
+        stop = threading.Event()
+        stop.set()
+        scheduler = reminders.ReminderScheduler(tmp_db_path, ListSink())
+        scheduler.run(stop=stop)
+        assert len(scheduler) == 1
+
+
+class TestSinks:
+    """Tests the built-in notification sinks."""
+
+    reminder = reminders.Reminder(1, "Read", "morning", NOW)
+
+    def test_stdout_and_log_file(self, tmp_path):
+        stream = io.StringIO()
+        reminders.StdoutSink(stream).send(self.reminder)
+        assert stream.getvalue() == "Time for 'Read' (morning reminder)\n"
+
+        log = tmp_path / "reminders.log"
+        reminders.LogFileSink(str(log)).send(self.reminder)
+        assert (
+            log.read_text() == "2026-01-07 06:00 Time for 'Read' (morning reminder)\n"
+        )
+
+    def test_command_sink_passes_message(self, tmp_path, capsys):
+        out = tmp_path / "out.txt"
+        sink = reminders.CommandSink(
+            ["python", "-c", f"import sys; open({str(out)!r}, 'w').write(sys.argv[1])"]
+        )
+        sink.send(self.reminder)
+        assert out.read_text() == self.reminder.message
+        reminders.CommandSink(["/nonexistent-notifier"]).send(self.reminder)
+        assert "Reminder command failed" in capsys.readouterr().err
@@ -0,0 +1,116 @@
+import datetime
+import random
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import habit_analysis
+from momentum_hub.habit import Habit
+from momentum_hub.streak_timeline import StreakTimeline, period_index
+
+
+def _replay_current_streak(dates, frequency, as_of):
+    """Reference implementation: walk backwards from as_of period by period."""
+    completed = {period_index(d, frequency) for d in dates}
+    p = period_index(as_of, frequency)
+    if p not in completed:
+        p -= 1
+    streak = 0
+    while p in completed:
+        streak += 1
+        p -= 1
+    return streak
+
+
+class TestStreakTimeline:
+    """Tests the run-length streak timeline index."""
+
+    def test_runs_are_built_in_one_pass(self):
+        start = datetime.date(2026, 1, 1)
+        dates = [start + datetime.timedelta(days=i) for i in (0, 1, 2, 5, 6, 9)]
+        timeline = StreakTimeline.from_dates(dates, "daily")
+        assert [(e - s + 1) for s, e in timeline.runs] == [3, 2, 1]
+
+    def test_current_streak_as_of(self):
+        start = datetime.date(2026, 1, 1)
+        dates = [start + datetime.timedelta(days=i) for i in (0, 1, 2, 5, 6)]
+        timeline = StreakTimeline.from_dates(dates, "daily")
+        assert timeline.current_streak(datetime.date(2026, 1, 2)) == 2
+        # Open period: the day after the run still shows the run
+        assert timeline.current_streak(datetime.date(2026, 1, 4)) == 3
+        assert timeline.current_streak(datetime.date(2026, 1, 5)) == 0
+        assert timeline.current_streak(datetime.date(2025, 12, 31)) == 0
+
+    def test_longest_streak_so_far(self):
+        start = datetime.date(2026, 1, 1)
+        dates = [start + datetime.timedelta(days=i) for i in (0, 1, 5, 6, 7, 8)]
+        timeline = StreakTimeline.from_dates(dates, "daily")
+        assert timeline.longest_streak(datetime.date(2026, 1, 3)) == 2
+        assert timeline.longest_streak(datetime.date(2026, 1, 8)) == 3
+        assert timeline.longest_streak() == 4
+
+    def test_weekly_runs_use_sunday_weeks(self):
+        # Saturday then the following Sunday are consecutive weeks
+        dates = [datetime.date(2025, 10, 4), datetime.date(2025, 10, 5)]
+        timeline = StreakTimeline.from_dates(dates, "weekly")
+        assert timeline.longest_streak() == 2
+
+    @pytest.mark.parametrize("frequency", ["daily", "weekly"])
+    def test_matches_full_rescan(self, frequency):
+        rng = random.Random(42)
+        start = datetime.date(2025, 1, 1)
+        dates = [
+            start + datetime.timedelta(days=i) for i in range(300) if rng.random() < 0.6
+        ]
+        timeline = StreakTimeline.from_dates(dates, frequency)
+        for offset in range(0, 320, 11):
+            as_of = start + datetime.timedelta(days=offset)
+            if frequency == "weekly":
+                # Queries have period granularity: compare at week ends (Saturday)
+                as_of += datetime.timedelta(days=(5 - as_of.weekday()) % 7)
+            seen = [d for d in dates if d <= as_of]
+            assert timeline.longest_streak(
+                as_of
+            ) == habit_analysis.calculate_longest_streak_from_dates(seen, frequency)
+            assert timeline.completion_rate(as_of) == pytest.approx(
+                habit_analysis.calculate_completion_rate_from_dates(
+                    set(seen), frequency, as_of
+                )
+            )
+            assert timeline.current_streak(as_of) == _replay_current_streak(
+                seen, frequency, as_of
+            )
+
+    def test_unknown_frequency_is_empty(self):
+        timeline = StreakTimeline.from_dates([datetime.date(2026, 1, 1)], "yearly")
+        assert timeline.snapshot(datetime.date(2026, 1, 1)) == {
+            "current_streak": 0,
+            "longest_streak": 0,
+            "completion_rate": 0.0,
+        }
+
+
+class TestStreakHistory:
+    """Tests the database-backed timeline helpers."""
+
+    def test_history_and_memo_invalidation(self, tmp_path):
+        db_name = str(tmp_path / "timeline.db")
+        db.init_db(db_name)
+        hid = db.add_habit(Habit(name="Run", frequency="daily"), db_name=db_name)
+        base = datetime.datetime(2026, 2, 1, 8, 0)
+        for i in range(3):
+            db.add_completion(hid, base + datetime.timedelta(days=i), db_name)
+
+        history = habit_analysis.get_streak_history(
+            hid, db_name, [datetime.date(2026, 2, 2), datetime.date(2026, 2, 3)]
+        )
+        assert [h["current_streak"] for h in history] == [2, 3]
+
+        db.add_completion(hid, base + datetime.timedelta(days=3), db_name)
+        timeline = habit_analysis.get_streak_timeline(hid, db_name)
+        assert timeline.longest_streak() == 4
+
+    def test_missing_habit_returns_empty_timeline(self, tmp_path):
+        db_name = str(tmp_path / "timeline.db")
+        db.init_db(db_name)
+        assert habit_analysis.get_streak_timeline(99, db_name).runs == []
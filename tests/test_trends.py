@@ -0,0 +1,127 @@
+import datetime
+import random
+import tracemalloc
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import habit_analysis, trends
+from momentum_hub.habit import Habit
+
+START = datetime.date(2026, 1, 1)
+
+
+def _dt(offset, hour=8):
+    return datetime.datetime.combine(
+        START + datetime.timedelta(days=offset), datetime.time(hour)
+    )
+
+
+class TestTrendReport:
+    """Tests one-pass rolling rates and EWMA scores."""
+
+    def test_rolling_rates_match_rescan(self):
+        rng = random.Random(3)
+        offsets = sorted(o for o in range(200) if rng.random() < 0.5)
+        completions = [_dt(o) for o in offsets]
+        done = set(offsets)
+        end = START + datetime.timedelta(days=210)
+        for i, (day, rates) in enumerate(
+            trends.rolling_rates(iter(completions), end=end)
+        ):
+            assert day == START + datetime.timedelta(days=i)
+            for w in trends.DEFAULT_WINDOWS:
+                expected = sum(1 for o in range(i - w + 1, i + 1) if o in done) / w
+                assert rates[w] == pytest.approx(expected)
+
+    def test_duplicate_completions_count_once(self):
+        completions = [_dt(0, 8), _dt(0, 20), _dt(1)]
+        rows = list(trends.trend_report(completions, end=START + datetime.timedelta(1)))
+        assert [r["done"] for r in rows] == [True, True]
+        assert rows[-1]["rates"][7] == pytest.approx(2 / 7)
+
+    def test_ewma_halves_after_half_life(self):
+        scores = dict(
+            trends.ewma_scores(
+                [_dt(0)], end=START + datetime.timedelta(days=14), half_life=14
+            )
+        )
+        first = scores[START]
+        assert scores[START + datetime.timedelta(days=14)] == pytest.approx(first / 2)
+
+    def test_start_skips_earlier_completions(self):
+        rows = list(
+            trends.day_flags(
+                [_dt(0), _dt(5)],
+                start=START + datetime.timedelta(days=4),
+                end=START + datetime.timedelta(days=5),
+            )
+        )
+        assert [done for _, done in rows] == [False, True]
+
+    def test_empty_stream(self):
+        assert list(trends.trend_report(iter([]))) == []
+
+    def test_multi_year_history_in_constant_memory(self):
+        def stream():
+            for o in range(0, 3650, 2):
+                yield _dt(o)
+
+        end = START + datetime.timedelta(days=3650)
+        tracemalloc.start()
+        last = None
+        for last in trends.trend_report(stream(), end=end):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert last["rates"][28] == pytest.approx(0.5, abs=0.04)
+        assert peak < 100_000
+
+
+class TestStreakBreaks:
+    """Tests streak-break events."""
+
+    def test_daily_breaks(self):
+        completions = [_dt(o) for o in (0, 1, 2, 5, 6, 9)]
+        events = list(trends.streak_breaks(completions, "daily"))
+        assert [(e["length"], e["missed_periods"]) for e in events] == [(3, 2), (2, 2)]
+        assert events[0]["broken_on"] == START + datetime.timedelta(days=3)
+
+    def test_trailing_break_needs_a_closed_period(self):
+        completions = [_dt(0), _dt(1)]
+        assert list(trends.streak_breaks(completions, "daily", as_of=_dt(2))) == []
+        (event,) = trends.streak_breaks(completions, "daily", as_of=_dt(4))
+        assert event["length"] == 2
+        assert event["missed_periods"] == 2
+
+    def test_n_per_week_quota(self):
+        # Week 1 meets 2/week, week 2 has a single day, week 3 meets it again
+        days = [datetime.date(2026, 1, d) for d in (4, 6, 12, 18, 19)]
+        (event,) = trends.streak_breaks(days, "2/week")
+        assert event["start"] == datetime.date(2026, 1, 4)
+        assert event["end"] == datetime.date(2026, 1, 10)
+        assert event["missed_periods"] == 1
+
+
+class TestHabitTrendHelpers:
+    """Tests the database-backed streaming helpers."""
+
+    def test_streams_from_database(self, tmp_path):
+        db_name = str(tmp_path / "trend.db")
+        db.init_db(db_name)
+        hid = db.add_habit(Habit(name="Walk", frequency="daily"), db_name=db_name)
+        for o in (0, 1, 2, 4):
+            db.add_completion(hid, _dt(o), db_name)
+
+        streamed = db.iter_completions(hid, db_name=db_name, batch_size=2)
+        assert list(streamed) == db.get_completions(hid, db_name)
+
+        rows = list(
+            habit_analysis.iter_habit_trend(
+                hid, db_name, end=START + datetime.timedelta(days=4)
+            )
+        )
+        assert rows[-1]["rates"][7] == pytest.approx(4 / 7)
+        breaks = list(habit_analysis.iter_streak_breaks(hid, db_name))
+        assert [e["length"] for e in breaks] == [3]
+        assert list(habit_analysis.iter_streak_breaks(999, db_name)) == []
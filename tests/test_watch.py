@@ -0,0 +1,136 @@
+import datetime
+import io
+import threading
+
+import pytest
+
+import momentum_hub.momentum_db as db
+from momentum_hub import habit_analysis, watch
+from momentum_hub.habit import Habit
+
+
+class Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def tmp_db_path(tmp_path):
+    db_name = str(tmp_path / "test_watch.db")
+    db.init_db(db_name=db_name)
+    return db_name
+
+
+@pytest.fixture
+def habit_ids(tmp_db_path):
+    return [
+        db.add_habit(Habit(name=name, frequency="daily"), tmp_db_path)
+        for name in ("Read", "Walk", "Stretch")
+    ]
+
+
+@pytest.fixture
+def clock():
+    now = {"value": datetime.datetime(2026, 1, 10, 9)}
+    return now
+
+
+@pytest.fixture
+def dashboard(tmp_db_path, clock, monkeypatch):
+    monkeypatch.setenv("LINES", "40")
+    instance = watch.WatchDashboard(tmp_db_path, Terminal(), lambda: clock["value"])
+    yield instance
+    instance.close()
+
+
+def recomputed(monkeypatch):
+    calls = []
+    original = habit_analysis.get_metrics_for_habits
+
+    def spy(habits, db_name, reference_date=None):
+        habits = list(habits)
+        calls.append(sorted(h.id for h in habits))
+        return original(habits, db_name, reference_date)
+
+    monkeypatch.setattr(habit_analysis, "get_metrics_for_habits", spy)
+    return calls
+
+
+class TestWatchDashboard:
+    """Tests incremental refreshes of the watch dashboard."""
+
+    def test_only_changed_habits_are_recomputed(
+        self, dashboard, habit_ids, tmp_db_path, monkeypatch
+    ):
+        calls = recomputed(monkeypatch)
+        assert dashboard.tick() == habit_ids
+        assert dashboard.tick() == []
+
+        db.complete_habit(habit_ids[1], datetime.datetime(2026, 1, 10, 8), tmp_db_path)
+        assert dashboard.tick() == [habit_ids[1]]
+        assert calls == [habit_ids, [habit_ids[1]]]
+        row = dashboard.rows[habit_ids[1]]
+        assert row[3] == 1 and row[6] == 1 and row[7] == "2026-01-10 08:00"
+        # The metrics cache write is a commit, but changes no habit version
+        scans = []
+        monkeypatch.setattr(
+            db, "get_habit_versions", lambda db_name: scans.append(db_name)
+        )
+        assert dashboard.tick() == [] and len(calls) == 2
+        assert scans == []
+
+    def test_changed_rows_are_redrawn_in_place(self, dashboard, habit_ids, tmp_db_path):
+        dashboard.tick()
+        assert dashboard.stream.getvalue().startswith("\x1b[H\x1b[2J")
+        dashboard.stream.seek(0)
+        dashboard.stream.truncate()
+
+        db.complete_habit(habit_ids[2], datetime.datetime(2026, 1, 10, 8), tmp_db_path)
+        dashboard.tick()
+        output = dashboard.stream.getvalue()
+        # Third row (title, 3 header lines, 2 lines per row before it), then status
+        assert output.startswith("\x1b[9;1H\x1b[2K| ")
+        assert "Stretch" in output and "Read" not in output
+        assert "\x1b[11;1H\x1b[2KUpdated 09:00:00: 1 row(s) refreshed." in output
+
+    def test_tables_taller_than_the_terminal_are_redrawn(
+        self, dashboard, habit_ids, tmp_db_path, monkeypatch
+    ):
+        dashboard.tick()
+        # Status line 11 on a 10-line terminal: the table scrolled
+        monkeypatch.setenv("LINES", "10")
+        db.complete_habit(habit_ids[2], datetime.datetime(2026, 1, 10, 8), tmp_db_path)
+        dashboard.tick()
+        assert dashboard.stream.getvalue().count("\x1b[H\x1b[2J") == 2
+        assert "\x1b[9;1H" not in dashboard.stream.getvalue()
+
+    def test_rows_appear_and_disappear(self, dashboard, habit_ids, tmp_db_path):
+        dashboard.tick()
+        db.delete_habit(habit_ids[0], tmp_db_path)
+        new_id = db.add_habit(Habit(name="Swim", frequency="weekly"), tmp_db_path)
+        assert dashboard.tick() == [habit_ids[0], new_id]
+        assert dashboard.order == [*habit_ids[1:], new_id]
+        # A full redraw, since the rows below moved
+        assert dashboard.stream.getvalue().count("\x1b[H\x1b[2J") == 2
+
+        db.reactivate_habit(habit_ids[0], tmp_db_path)
+        assert dashboard.tick() == [habit_ids[0]]
+        assert dashboard.order[0] == habit_ids[0]
+
+    def test_new_day_recomputes_every_row(self, dashboard, habit_ids, clock):
+        dashboard.tick()
+        assert dashboard.tick() == []
+        clock["value"] += datetime.timedelta(days=1)
+        assert dashboard.tick() == habit_ids
+
+    def test_log_output_and_run(self, tmp_db_path, habit_ids):
+        stream = io.StringIO()
+        stop = threading.Event()
+        stop.set()
+        watch.WatchDashboard(tmp_db_path, stream).run(interval=0.01, stop=stop)
+        lines = stream.getvalue().splitlines()
+        assert "\x1b" not in stream.getvalue()
+        assert lines[0] == f"Momentum Hub: watching {tmp_db_path}"
+        assert lines[-1].endswith("3 row(s) refreshed. Press Ctrl+C to stop.")
+        with pytest.raises(ValueError):
+            watch.run_watch(tmp_db_path, interval=0)